@@ -1,12 +1,13 @@
 import sys
 sys.path.insert(0, '..')
 
-from helpers import filemap
+from collections import Counter
 
-def search_combinations(data, target_joltage, mem = dict()):
-    if target_joltage in mem:
-        return mem[target_joltage]
+from helpers import filemap, instrument, memoize
 
+@instrument
+@memoize(key=lambda data, target_joltage: target_joltage)
+def search_combinations(data, target_joltage):
     # If the joltage of this node is in the range [0,3], then we have a valid
     # combination. But we still need to check if we can add an adapter.
     # The arg target_joltage is always positive!
@@ -17,11 +18,25 @@ def search_combinations(data, target_joltage, mem = dict()):
             continue
         if joltage < target_joltage - 3:
             break
-        combinations += search_combinations(data, joltage, mem)
+        combinations += search_combinations(data, joltage)
 
-    mem[target_joltage] = combinations
     return combinations
 
+def count_combinations(data, target_joltage):
+    ''' search_combinations bottom-up in increasing joltage, without recursion. '''
+    adapters = Counter(data)
+    ways = {}
+    for joltage in sorted(set(data) | {target_joltage}):
+        if joltage > target_joltage:
+            break
+        combinations = 0 if joltage > 3 else 1
+        for prev in range(joltage - 3, joltage):
+            if prev in ways:
+                combinations += adapters[prev] * ways[prev]
+        ways[joltage] = combinations
+
+    return ways[target_joltage]
+
 def search(data, target_joltage):
     data = sorted(data)
     data.append(target_joltage)
@@ -60,6 +75,17 @@ def search_perf(data, target_joltage):
 
     return diffs[1] * diffs[3]
 
+def load(filename):
+    return filemap(filename)
+
+def part1(data):
+    return search_perf(data, max(data) + 3)
+
+def part2(data, recursive=False):
+    if recursive:
+        return search_combinations(sorted(data, reverse=True), max(data) + 3)
+    return count_combinations(data, max(data) + 3)
+
 def main():
     # Testing data
     data = [
@@ -68,7 +94,7 @@ def main():
     ]
     data = [16, 10, 15, 5, 1, 11, 7, 19, 6, 12, 4]
     # Actual data
-    data = filemap('input.txt')
+    data = load('input.txt')
 
     dev_joltage = max(data) + 3
     #print(dev_joltage)
@@ -77,10 +103,10 @@ def main():
     res = search(data, dev_joltage)
     res_freq = count_freq(res)
     print('Part1:', res_freq[1] * res_freq[3])
-    print('Part1:', search_perf(data, dev_joltage))
+    print('Part1:', part1(data))
 
     # Part 2
-    print('Part2:', search_combinations(sorted(data, reverse=True), dev_joltage))
+    print('Part2:', part2(data))
 
 if __name__ == '__main__':
     main()
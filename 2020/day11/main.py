@@ -1,115 +1,121 @@
 import sys
 sys.path.insert(0, '..')
 
-from helpers import filemap, DIRECTIONS
+from array import array
+from itertools import compress
 
-def is_in_bounds(y, x, y_len, x_len):
-    return 0 <= y < y_len and \
-            0 <= x < x_len
+from helpers import Grid
+
+FLOOR, EMPTY, TAKEN, BORDER = 0, 1, 2, 3
+CODES = {'.': FLOOR, 'L': EMPTY, '#': TAKEN}
+CHARS = {FLOOR: '.', EMPTY: 'L', TAKEN: '#'}
 
 # Part 1 rules
-def p1_requirements(model, y, x, y_len, x_len):
+def p1_neighbours(model, i):
     '''
     Adjacent seats only.
     '''
-    neighbours = 8
-    adj_neighbr = {True: 0, False: 0}
-
-    for coords in DIRECTIONS.values():
-        dy = y + coords[0]
-        dx = x + coords[1]
-
-        if not is_in_bounds(dy, dx, y_len, x_len):
-            neighbours -= 1
-            continue
-
-        if model[dy][dx] is None:
-            neighbours -= 1
-            continue
-
-        adj_neighbr[model[dy][dx]] += 1
-
-    return (model[y][x] and adj_neighbr[True] > 3) or \
-            (not model[y][x] and adj_neighbr[False] == neighbours)
+    cells = model.cells
+    return [i + o for o in model.offsets8 if cells[i + o] in (EMPTY, TAKEN)]
 
 
 # Part 2 rules
-def p2_requirements(model, y, x, y_len, x_len):
+def p2_neighbours(model, i):
     '''
     All seats in the row.
     '''
-    rows = {True: 0, False: 0} # Sum of all seats in all 8 directions,
-                               # True is taken, false empty
-    for direction in DIRECTIONS.values():
-        dy = y
-        dx = x
-        while True:
-            dy += direction[0]
-            dx += direction[1]
-            if not is_in_bounds(dy, dx, y_len, x_len):
-                rows[False] += 1
-                break
-            if model[dy][dx] is None:
-                continue
-
-            rows[model[dy][dx]] += 1
-            break
-
-    return (model[y][x] and rows[True] > 4) or \
-            (not model[y][x] and rows[False] == 8)
-
-
-def predict(model, handle_coord):
+    cells = model.cells
+    neighbours = []
+    for offset in model.offsets8:
+        j = i + offset
+        while cells[j] == FLOOR:
+            j += offset
+        if cells[j] != BORDER:
+            neighbours.append(j)
+    return neighbours
+
+
+def neighbour_table(model, find_neighbours):
+    '''
+    The seats of the model and the seats each of them looks at, by their
+    number in seats and all in one flat array. The neighbours of seats[k]
+    are neighbours[starts[k]:starts[k + 1]].
+    '''
+    cells = model.cells
+    seats = array('I', (s for s in model.interior() if cells[s] != FLOOR))
+    numbers = array('I', (0,)) * len(cells) # Seat number by cell index
+    for k, s in enumerate(seats):
+        numbers[s] = k
+    starts, neighbours = array('I', (0,)), array('I')
+    for s in seats:
+        neighbours.extend(numbers[n] for n in find_neighbours(model, s))
+        starts.append(len(neighbours))
+    return seats, starts, neighbours
+
+def predict(model, find_neighbours, tolerance):
     '''
-    Simulate the process of people picking their seats based on the rules
-    by the function handle_coord. "Predict" the final equilibriant situation.
+    Simulate the process of people picking their seats based on the seats
+    returned by find_neighbours. "Predict" the final equilibriant situation.
+    A taken seat is left when more than tolerance of those seats are taken,
+    an empty seat is taken when none of them are.
     '''
-    MAX_ITERATIONS = 200
     i = 0
 
     # Dont alter the original map.
-    model = list(map(lambda y: [mapper(c) for c in y], model))
-    y_len, x_len = len(model), len(model[0])
-    coords = [-1] # Cords of seats to be flipped based on handle_coord result
-
-    while coords:
+    model = model.copy()
+    cells = model.cells
+    # The seats each seat looks at never change, find them only once
+    seats, starts, neighbours = neighbour_table(model, find_neighbours)
+    taken = bytearray(cells[s] == TAKEN for s in seats)
+    # Taken seats each seat sees, kept up to date as the seats flip
+    seen = bytearray(len(seats))
+    for k in range(len(seats)):
+        seen[k] = sum(map(taken.__getitem__, neighbours[starts[k]:starts[k + 1]]))
+    # Changes spread across the whole map, bigger maps need more rounds
+    MAX_ITERATIONS = max(200, model.height + model.width)
+    # Seats to check, the first round checks all of them. Seeing the same
+    # seats the same way as in the previous round a seat stays as it is, so
+    # after that only the flipped seats and the seats seeing them are checked.
+    candidates = range(len(seats))
+
+    while candidates:
         i += 1
         if i > MAX_ITERATIONS:
             raise Exception('Infinite loop in prediction?')
 
-        coords = list()
-
-        for y in range(y_len):
-            for x in range(x_len):
-                if model[y][x] is None: continue
-                if handle_coord(model, y, x, y_len, x_len):
-                    coords.append((y, x))
-
-        for y, x in coords:
-            model[y][x] = not model[y][x]
-
+        # Seats to be flipped based on the rules
+        flips = array('I', (k for k in candidates if ((seen[k] > tolerance) if taken[k] else (seen[k] == 0))))
+
+        marked = bytearray(len(seats))
+        for k in flips:
+            change = -1 if taken[k] else 1
+            taken[k] ^= 1
+            marked[k] = 1
+            for n in neighbours[starts[k]:starts[k + 1]]:
+                seen[n] += change
+                marked[n] = 1
+        candidates = array('I', compress(range(len(seats)), marked))
+
+    for s, t in zip(seats, taken):
+        cells[s] = TAKEN if t else EMPTY
     return model
 
 
 def map_as_str(model):
-    return '\n'.join((''.join(r) for r in model))
+    return '\n'.join(model.to_lines(CHARS))
 
-def count_occurences(model, seat_type = True):
+def count_occurences(model, seat_type = TAKEN):
     '''Counts the occurences of seat_type in the 2d map'''
-    return len([c for y in model for c in y if c == seat_type])
+    return model.count(seat_type)
 
-def mapper(c):
-    '''
-    Maps the seats and empty floor coords into True/False or None
-    '''
-    if c == '.': return None        # Empty space
-    if c == 'L': return False       # Empty seat = False
-    if c == '#': return True        # Taken seat = True
-    raise Exception('BAD INPutTTT')
+def load(filename):
+    return Grid.load(filename, CODES, pad=1, border=BORDER)
+
+def part1(data):
+    return count_occurences(predict(data, p1_neighbours, 3))
 
-def mapper_reverse(c):
-    if c is None: return '.'
-    return '#' if c else 'L'
+def part2(data):
+    return count_occurences(predict(data, p2_neighbours, 4))
 
 def main():
     #  Testing data
@@ -126,20 +132,20 @@ def main():
         'L.LLLLL.LL'
     ]
 
-    data = list(map(lambda r: [c for c in r], data))
+    data = Grid.from_lines(data, CODES, pad=1, border=BORDER)
 
     # Actual data
-    data = filemap('input.txt', lambda r: [c for c in r])
+    data = load('input.txt')
 
-    data_p1 = predict(data, p1_requirements)
-    data_p2 = predict(data, p2_requirements)
+    data_p1 = predict(data, p1_neighbours, 3)
+    data_p2 = predict(data, p2_neighbours, 4)
 
     #print('Map for P1:')
-    #print(map_as_str(map(lambda y: [mapper_reverse(x) for x in y], data_p1)))
+    #print(map_as_str(data_p1))
 
     #print()
     #print('Map for P2:')
-    #print(map_as_str(map(lambda y: [mapper_reverse(x) for x in y], data_p2)))
+    #print(map_as_str(data_p2))
 
     print('P1 occupied seats:', count_occurences(data_p1))
     print('P2 occupied seats:', count_occurences(data_p2))
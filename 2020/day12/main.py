@@ -1,7 +1,7 @@
 import sys
 sys.path.insert(0, '..')
 
-from helpers import filemap
+from helpers import char_ints
 
 def calculate_endpoint_manhattan_distance(nav_instructions):
     ''' Calculates the manhattan distance from start to where the ship
@@ -72,15 +72,24 @@ def calc_waypoint_manhattan_distance(nav_instructions):
     return abs(y) + abs(x)
 
 
+def load(filename):
+    return char_ints(filename)
+
+def part1(data):
+    return calculate_endpoint_manhattan_distance(data)
+
+def part2(data):
+    return calc_waypoint_manhattan_distance(data)
+
 def main():
     # Test data
     #data = ['F10', 'N3', 'F7', 'R90', 'F11']
     #data = list(map(lambda s: (s[0], int(s[1:])), data))
     # Actual data
-    data = filemap('input.txt', lambda s: (s[0], int(s[1:]) ) )
+    data = load('input.txt')
 
-    print('Part1:', calculate_endpoint_manhattan_distance(data))
-    print('Part2:', calc_waypoint_manhattan_distance(data))
+    print('Part1:', part1(data))
+    print('Part2:', part2(data))
 
 
 if __name__ == '__main__':
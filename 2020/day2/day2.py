@@ -1,38 +1,91 @@
 import sys
 sys.path.insert(0, '..')
 
-from helpers import filemap
+import re
+from array import array
+from itertools import repeat
+from typing import List, NamedTuple
 
-def passwd_has_correct_amount_of_req_char(l):
-    # Validator for part one
-    req, passwd = l
-    min_req, max_req = map(int, req.split()[0].split('-'))
-    char = req.split()[1]
-    return min_req <= len([c for c in passwd if c == char]) <= max_req
+from helpers import byte_ranges, imatches
 
-def passwd_has_correct_char_in_specific_indx(l):
+# One record per line, e.g. '1-3 c: ccpc'
+POLICY_RE = re.compile(rb'^(\d+)-(\d+) (\S): (\S*)', re.M)
+
+class Policies(NamedTuple):
+    ''' Column per field of the records, the characters as byte values. '''
+    lows: array
+    highs: array
+    chars: bytes
+    passwords: List[bytes]
+
+def count_correct_amount_of_req_char(policies):
+    # Validator for part one, bytes.count takes the byte value of the character
+    return sum(low <= passwd.count(char) <= high
+               for low, high, char, passwd in zip(*policies))
+
+def count_correct_char_in_specific_indx(policies):
     ''' "Exactly one of these positions must contain the given letter!"
          Positions start indexing from 1, not 0.
     '''
-    # Validator for part two. Offset index in lambdafunction.
-    req, passwd = l
-    first_req, second_req = map(lambda v: int(v) - 1, req.split()[0].split('-'))
-    char = req.split()[1]
-    return (passwd[first_req] == char or passwd[second_req] == char) \
-            and (passwd[first_req] != passwd[second_req])
+    # Validator for part two, indexing bytes gives the byte values as well
+    return sum((passwd[first - 1] == char) != (passwd[second - 1] == char)
+               for first, second, char, passwd in zip(*policies))
+
+
+def parse(filename, start = 0, end = None):
+    ''' The records of the file, or of its bytes from start to end. '''
+    lows, highs, chars, passwords = array('I'), array('I'), bytearray(), []
+    for low, high, char, passwd in imatches(filename, POLICY_RE, start, end):
+        lows.append(int(low))
+        highs.append(int(high))
+        chars += char
+        passwords.append(passwd)
+    return Policies(lows, highs, bytes(chars), passwords)
+
+def count_valid(filename, start, end):
+    ''' Valid passwords in the bytes from start to end of the file under both policies. '''
+    policies = parse(filename, start, end)
+    return part1(policies), part2(policies)
+
+def stream(filename, jobs = None, chunk_size = 1 << 22):
+    '''
+    Valid passwords of the file under both policies, counted chunk by chunk
+    in a pool of jobs worker processes. Only one chunk per worker is parsed
+    at a time, so logs larger than memory can be checked too.
+    '''
+    # Imported here, the pool is not needed to solve the puzzle input
+    from concurrent.futures import ProcessPoolExecutor
+    ranges = byte_ranges(filename, chunk_size)
+    if not ranges:
+        return 0, 0
+    starts, ends = zip(*ranges)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        counts = list(pool.map(count_valid, repeat(filename), starts, ends))
+    return sum(c[0] for c in counts), sum(c[1] for c in counts)
+
+
+def load(filename):
+    return parse(filename)
+
+def part1(policies):
+    return count_correct_amount_of_req_char(policies)
 
-def valid_lines_count(data, func):
-    return sum([func(l) for l in data])
+def part2(policies):
+    return count_correct_char_in_specific_indx(policies)
 
 
 def main():
-    lines = filemap('input.txt', lambda s: s.split(': '))
+    if len(sys.argv) > 1:
+        # python day2.py huge.txt [jobs]
+        valid1, valid2 = stream(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else None)
+        print('Part1:', valid1)
+        print('Part2:', valid2)
+        return
 
-    valid_passwds_p1 = valid_lines_count(lines, passwd_has_correct_amount_of_req_char)
-    valid_passwds_p2 = valid_lines_count(lines, passwd_has_correct_char_in_specific_indx)
+    policies = load('input.txt')
 
-    print('Part1:', valid_passwds_p1)
-    print('Part2:', valid_passwds_p2)
+    print('Part1:', part1(policies))
+    print('Part2:', part2(policies))
 
 
 if __name__ == '__main__':
@@ -1,38 +1,68 @@
 import sys
 sys.path.insert(0, '..')
 
-from helpers import filemap
+from helpers import records
 from functools import reduce
 
-def travel(map, dy, dx):
-    ''' Travels the map with dx and dy steps and counts how many trees are
-        encountered amongst the route.
-    '''
-    y_max, x_max = len(map), len(map[0])
-    x = 0
-    trees = 0
+TREE = ord('#')
 
-    for y in range(0, y_max, dy):
-        if map[y][x] == '#': #Tree
-            trees += 1
-        x = (x + dx) % x_max
+def count_trees(rows, jumps, tree = TREE):
+    ''' Travels the rows with every (dy, dx) slope of jumps at once and
+        counts how many trees each route encounters. The rows are only
+        iterated once, so they can be streamed from the file. Empty rows
+        contain no trees.
+    '''
+    trees = [0] * len(jumps)
+    # Slopes moving down the same number of rows land on the same rows
+    by_dy = {}
+    for i, (dy, dx) in enumerate(jumps):
+        by_dy.setdefault(dy, []).append((i, dx))
 
+    width = None
+    for y, row in enumerate(rows):
+        if width is None:
+            width = len(row)
+        if not width:
+            break
+        for dy, slopes in by_dy.items():
+            if y % dy:
+                continue
+            step = y // dy
+            for i, dx in slopes:
+                trees[i] += row[step * dx % width] == tree
     return trees
 
-def travel_many(map, jumps = ((1, 3), )):
-    ''' Travels the map with all slopes specified in the argument jumps and
-        multiplies all the encountered trees from the different routes.
-        jumps argument is a tuple containing tuples with
+def count_trees_in_file(filename, jumps):
+    ''' count_trees() with the rows read one at a time from the file, so
+        the map is never held in memory. records() reads CRLF line endings
+        like LF ones, and an empty file has no trees on any route.
+    '''
+    return count_trees(records(filename), jumps)
+
+def travel_many(filename, jumps = ((1, 3), )):
+    ''' Travels the map in filename with all slopes specified in the
+        argument jumps and multiplies all the encountered trees from the
+        different routes. jumps argument is a tuple containing tuples with
         (y_movement, x_movement) in coords.
     '''
-    return reduce(lambda x, y: x * y,
-                    [travel(map, dir[0], dir[1]) for dir in jumps])
+    return reduce(lambda x, y: x * y, count_trees_in_file(filename, jumps))
+
+
+def load(filename):
+    # Nothing is parsed up front, both parts stream the rows from the file
+    return filename
+
+def part1(data):
+    return travel_many(data)
+
+def part2(data):
+    return travel_many(data, ((1, 1), (1, 3), (1, 5), (1, 7), (2, 1)))
 
 
 def main():
-    data = filemap('input.txt', lambda s: s)
-    print('Part1:', travel_many(data))
-    print('Part2:', travel_many(data, ((1, 1), (1, 3), (1, 5), (1, 7), (2, 1))))
+    data = load('input.txt')
+    print('Part1:', part1(data))
+    print('Part2:', part2(data))
 
 
 if __name__ == '__main__':
@@ -4,13 +4,15 @@ sys.path.insert(0, '..')
 from helpers import filemap
 import re
 
+HCL_RE = re.compile('^#[0-9|a-f]{6}$')
+
 # Validators
 def test_byr(val): return val.isdigit() and 1919 < int(val) < 2003 # Birth year
 def test_iyr(val): return val.isdigit() and 2009 < int(val) < 2021 # Issue year
 def test_eyr(val): return val.isdigit() and 2019 < int(val) < 2031 # Expiration year
 def test_pid(val): return val.isdigit() and len(val) == 9          # Passport ID
 def test_ecl(val): return val in valid_eyecolors                   # Eye color
-def test_hcl(val): return re.match('^#[0-9|a-f]{6}$', val)         # Hair color
+def test_hcl(val): return HCL_RE.match(val)                        # Hair color
 def test_cid(val): return True # Should be ignored, always True    # Country ID
 def test_hgt(val):                                                 # Height
     min, max = 0,0
@@ -55,15 +57,22 @@ def valid_passport_fields_count(passports):
     return sum([validate_passport_fields(pp) for pp in passports])
 
 
-def main():
-    data = filemap('input.txt', lambda s: s.strip(), '\n\n')
+def load(filename):
+    return filemap(filename, lambda s: s.strip(), '\n\n')
+
+def part1(data):
+    return len(filter_passports(data, req_fields[:-1])) # 'cid:' is optional => ignore it
 
-    passports_with_req_fields = filter_passports(data, req_fields[:-1]) # 'cid:' is optional => ignore it
-    pp_req_fields_count = len(passports_with_req_fields)
-    pp_valid_fields_count = valid_passport_fields_count(passports_with_req_fields)
+def part2(data):
+    passports_with_req_fields = filter_passports(data, req_fields[:-1])
+    return valid_passport_fields_count(passports_with_req_fields)
+
+
+def main():
+    data = load('input.txt')
 
-    print('Part1, passports with required fields:', pp_req_fields_count)
-    print('Part2, passports with valid fields   :', pp_valid_fields_count)
+    print('Part1, passports with required fields:', part1(data))
+    print('Part2, passports with valid fields   :', part2(data))
 
 
 if __name__ == '__main__':
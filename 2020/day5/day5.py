@@ -33,17 +33,24 @@ def handle_row(row):
 
     return l * 8 + s_l
 
-def main():
-    lines = filemap('input.txt', lambda s: s)
-    seat_ids = sorted([handle_row(r) for r in lines])
+def load(filename):
+    return filemap(filename, lambda s: s)
 
-    print('Part1:', max(seat_ids)) # Part 1
+def part1(lines):
+    return max(handle_row(r) for r in lines)
 
-    # Part 2
+def part2(lines):
+    seat_ids = sorted([handle_row(r) for r in lines])
     for i in range(1, len(seat_ids) - 1):
         if seat_ids[i] - seat_ids[i - 1] != 1:
-            print('Part2:', seat_ids[i] - 1)
-            break
+            return seat_ids[i] - 1
+    return None
+
+def main():
+    lines = load('input.txt')
+
+    print('Part1:', part1(lines))
+    print('Part2:', part2(lines))
 
 if __name__ == '__main__':
     main()
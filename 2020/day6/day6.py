@@ -4,8 +4,25 @@ sys.path.insert(0, '..')
 from functools import reduce
 from helpers   import filemap
 
+def load(filename):
+    return filemap(filename, lambda s: s, '\n\n')
+
+def part1(groups):
+    yes_tot = 0
+    for g in groups:
+        yes_tot += len(set((c for c in g if c != '\n')))
+    return yes_tot
+
+def part2(groups):
+    yes_answers = 0
+    for g in groups:
+        grp_answers = map(lambda pa: set((c for c in pa)), g.split())
+        result = reduce(lambda x, y: x.intersection(y), grp_answers)
+        yes_answers += len(result)
+    return yes_answers
+
 def main():
-    groups = filemap('input.txt', lambda s: s, '\n\n')
+    groups = load('input.txt')
     # Test data => Part 1: 11 & Part 2: 6
     #groups = [
     #    'abc',
@@ -14,21 +31,9 @@ def main():
     #    'a\na\na\na\na',
     #    'b'
     #]
-    yes_tot     = 0 # Part 1
-    yes_answers = 0 # Part 2
-    all_answers = set()
-
-    for g in groups:
-        # Part 2
-        grp_answers = map(lambda pa: set((c for c in pa)), g.split())
-        result = reduce(lambda x, y: x.intersection(y), grp_answers)
-        yes_answers += len(result)
-
-        # Part 1
-        yes_tot += len(set((c for c in g if c != '\n')))
 
-    print('part1:', yes_tot)
-    print('part2:', yes_answers)
+    print('part1:', part1(groups))
+    print('part2:', part2(groups))
 
 if __name__ == '__main__':
     main()
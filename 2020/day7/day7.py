@@ -1,10 +1,11 @@
 import sys
 sys.path.insert(0, '..')
 
-from helpers import filemap
+from helpers import filemap, GraphBuilder
 
 def parse_data(data):
-    can_go_in = dict()
+    ''' Graph from every outer color to the colors it contains, weighted by how many. '''
+    can_go_in = GraphBuilder(weighted=True)
 
     for rule in data:
         rule = rule.replace(' bags', '').replace(' bag', '')
@@ -12,39 +13,31 @@ def parse_data(data):
             raise Exception('BAD INPUT')
         rule = rule[:-1]
         outer, inner = rule.split(' contain ')
+        can_go_in.node(outer)
         inner = inner.split(', ')
         for color in inner:
             if not color[:1].isdigit():
                 continue
-            if not outer in can_go_in:
-                can_go_in[outer] = set()
-            can_go_in[outer].add((color[2:], int(color[0])))
+            count, color = color.split(' ', 1)
+            can_go_in.edge(outer, color, int(count))
 
-    return can_go_in
+    return can_go_in.build()
 
-def count(possibilities, color, target_color):
-    if color == target_color:
-        return 1
-    if color not in possibilities:
-        return 0
-
-    for inner_color in possibilities[color]:
-        if inner_color[0] == target_color or \
-                count(possibilities, inner_color[0], target_color) > 0:
-            return 1
+def load(filename):
+    return parse_data(filemap(filename, lambda s: s, '\n'))
 
-    return 0
+def part1(possibilities, target_color = 'shiny gold'):
+    if target_color not in possibilities:
+        return 0
+    # Every color the target can be reached from, except the target itself
+    can_contain = possibilities.reversed().reachable([possibilities.ids[target_color]])
+    return sum(can_contain) - 1
 
 # Part 2
-def count_p2(possibilities, color):
-    sum = 1
-    if color not in possibilities:
-        return sum
-
-    for inner_color in possibilities[color]:
-        sum += inner_color[1] * count_p2(possibilities, inner_color[0])
-
-    return sum
+def part2(possibilities, target_color = 'shiny gold'):
+    if target_color not in possibilities:
+        return 0
+    return possibilities.weighted_sums()[possibilities.ids[target_color]] - 1
 
 def main():
     # Part 1 testing data
@@ -70,22 +63,10 @@ def main():
         'dark violet bags contain no other bags.'
     )
 
-    data = filemap('input.txt', lambda s: s, '\n')
-    #print(data)
-    possibilities = parse_data(data)
-
-    # Part 1
-    target_color = 'shiny gold'
-    sum = 0
-    for outer_color in possibilities:
-        if outer_color == target_color:
-            continue
-        sum += count(possibilities, outer_color, target_color)
-    print('Part1:', sum)
-    # Part 1 end
+    possibilities = load('input.txt')
 
-    # Part 2
-    print('Part2', count_p2(possibilities, target_color) - 1)
+    print('Part1:', part1(possibilities))
+    print('Part2', part2(possibilities))
 
 if __name__ == '__main__':
     main()
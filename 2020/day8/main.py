@@ -64,6 +64,16 @@ def can_reach_end(code):
         idx += 1
     return accumulator
 
+def load(filename):
+    data = filemap(filename, lambda s: s.split())
+    return list(map(lambda l: (l[0], int(l[1])), data))
+
+def part1(code):
+    return walk(code)
+
+def part2(code):
+    return walk_fix(code)
+
 def main():
     # Test data
     data = [
@@ -77,14 +87,13 @@ def main():
         ('jmp', -4),
         ('acc', 6)
     ]
-    data = filemap('input.txt', lambda s: s.split())
-    data = list(map(lambda l: (l[0], int(l[1])), data))
+    data = load('input.txt')
     #print(data)
 
     # Part 1
-    print('Part1:', walk(data))
+    print('Part1:', part1(data))
     # Part 2
-    print('Part2:', walk_fix(data))
+    print('Part2:', part2(data))
 
 
 if __name__ == '__main__':
@@ -52,6 +52,23 @@ def sub_sum(arr, sum):
 
 
 
+def load(filename):
+    return filemap(filename)
+
+def part1(data, preamble_len = 25):
+    '''
+    Returns the index and the value of the first number that is not the sum
+    of two of the preamble_len numbers before it.
+    '''
+    for i in range(preamble_len, len(data)):
+        if not has_sum(data[i-preamble_len:i], data[i]):
+            return (i, data[i])
+    return ()
+
+def part2(data, preamble_len = 25):
+    p1 = part1(data, preamble_len)
+    return sub_sum(data[0:p1[0]], p1[1])
+
 def main():
     # Training data
     data = [
@@ -79,17 +96,10 @@ def main():
     preamble_len = 5
 
     # Actual data
-    data = filemap('input.txt')
-    preamble_len = 25
+    data = load('input.txt')
 
-    # Part 1 answer, index and the value
-    p1 = ()
-    for i in range(preamble_len, len(data)):
-        if not has_sum(data[i-preamble_len:i], data[i]):
-            p1 = (i, data[i])
-            break
-    print('Part1:', p1)
-    print('Part2:', sub_sum(data[0:p1[0]], p1[1]))
+    print('Part1:', part1(data))
+    print('Part2:', part2(data))
 
 if __name__ == '__main__':
     main()
@@ -1,41 +1,33 @@
-from functools import reduce
-
-
-def filemap(filename, func = int, sep='\n'):
-    '''
-    Reads in the filename and returns a list with all the rows mapped by
-    the function func, which defaults to int(). That is returns
-    a list containing one integer for every row of the file with def arguments.
-    '''
-    with open(filename, 'r') as f:
-        return list(map(func, f.read().strip().split(sep)))
-
-DIRECTIONS = dict(zip('ESWN', reduce(   # ( (0,1), (1,0), (0,-1), (-1,0) )
-    lambda x, y: x + y, map(            # ( ((0,1), (1,0)), ((0,-1), (-1,0)) )
-        lambda c: ((c[1], c[0]), c),
-            ((y,0) for y in (1,-1))     # ( (1,0), (-1,0) )
-        )
-    )
-))
-
-def init_diags():
-    dirs = list(DIRECTIONS.keys())
-    for a in ('N', 'S'):
-        for b in ('W', 'E'):
-            A = DIRECTIONS[a]
-            B = DIRECTIONS[b]
-            DIRECTIONS[''.join((a, b))] = (A[0] + B[0], A[1] + B[1])
-
-def initialize():
-    init_diags()
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import importlib
+
+from aoc.loader import byte_ranges, filemap, ifilemap, imatches, ints, int_tuples, char_ints, records
+
+# Shared names of the modules most days do not need, imported on first use
+LAZY = {
+    'DIRECTIONS': 'aoc.grid',
+    'Grid': 'aoc.grid',
+    'GraphBuilder': 'aoc.graph',
+    'instrument': 'aoc.instrument',
+    'memoize': 'aoc.memo',
+    'SumIndex': 'aoc.ksum',
+}
+
+def __getattr__(name):
+    if name not in LAZY:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(LAZY[name]), name)
+    globals()[name] = value
+    return value
 
 
 def main():
-    initialize()
+    from aoc.grid import DIRECTIONS
     print(DIRECTIONS)
 
 
 if __name__ == '__main__':
     main()
-else:
-    initialize()
@@ -1,8 +1,9 @@
+import sys
+sys.path.insert(0, '../..')
+
 from typing import List, Tuple
 
-def filemap(filename, func = int, sep='\n'):
-    with open(filename, 'r') as f:
-        return list(map(func, f.read().strip().split(sep)))
+from aoc.loader import char_ints
 
 test_input = [
     'L68',
@@ -56,11 +57,22 @@ def prob2(input: List[Tuple[str, int]]):
 
     return zeros_count
 
+def line_parser(r: str) -> Tuple[str, int]:
+    return (r[:1], int(r[1:]))
+
+def load(filename: str) -> List[Tuple[str, int]]:
+    return char_ints(filename)
+
+def part1(input: List[Tuple[str, int]]) -> int:
+    return prob1(input)
+
+def part2(input: List[Tuple[str, int]]) -> int:
+    return prob2(input)
+
 def main():
-    line_parser = lambda r: (r[:1], int(r[1:]))
-    input = filemap('input.txt', line_parser) if True else list(map(line_parser, test_input))
-    print('Prob1: ', prob1(input))
-    print('Prob2: ', prob2(input))
+    input = load('input.txt') if True else list(map(line_parser, test_input))
+    print('Prob1: ', part1(input))
+    print('Prob2: ', part2(input))
 
 if __name__ == '__main__':
     main()
@@ -1,4 +1,7 @@
-use std::fs;
+use std::{
+    fs,
+    time::Instant,
+};
 
 const TEST_INPUT: [&str; 10] = ["L68", "L30", "R48", "L5", "R60", "L55", "L1", "L99", "R14", "L82"];
 
@@ -80,12 +83,22 @@ fn prob_2(input: &Vec<(char, u32)>) -> u32 {
 }
 
 fn main() {
+    let start = Instant::now();
     let input = if true {
         parse_input(&read_input_file("./input.txt"))
     } else {
         parse_input(&TEST_INPUT)
     };
+    let parse_time = start.elapsed();
 
-    println!("Prob 1: {}", prob_1(&input));
-    println!("Prob 2: {}", prob_2(&input));
+    let start = Instant::now();
+    let prob1_res = prob_1(&input);
+    let prob1_time = start.elapsed();
+    let start = Instant::now();
+    let prob2_res = prob_2(&input);
+    let prob2_time = start.elapsed();
+
+    println!("Prob 1: {}", prob1_res);
+    println!("Prob 2: {}", prob2_res);
+    eprintln!("Timings (ns): parse {} prob1 {} prob2 {}", parse_time.as_nanos(), prob1_time.as_nanos(), prob2_time.as_nanos());
 }
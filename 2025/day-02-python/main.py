@@ -1,8 +1,9 @@
+import sys
+sys.path.insert(0, '../..')
+
 from typing import Callable, List, Tuple
 
-def filemap(filename, func = int, sep='\n'):
-    with open(filename, 'r') as f:
-        return list(map(func, f.read().strip().split(sep)))
+from aoc.loader import int_tuples
 
 test_input = [
     "11-22",
@@ -54,16 +55,26 @@ def count_invalid_ids(input: List[Tuple[int, int]], invalid_id_predicate: Callab
 
     return invalid_ids_sum
 
+def line_parser(l: str) -> Tuple[int, int]:
+    return tuple(map(int, l.split('-')))
+
+def load(filename: str) -> List[Tuple[int, int]]:
+    return int_tuples(filename, ',', '-')
+
+def part1(input: List[Tuple[int, int]]) -> int:
+    return count_invalid_ids(input, is_part1_invalid_id)
+
+def part2(input: List[Tuple[int, int]]) -> int:
+    return count_invalid_ids(input, is_part2_invalid_id)
+
 def main():
-    line_parser = lambda l: tuple(map(int, l.split('-')))
-    line_separator = ','
-    input = filemap('input.txt', line_parser, line_separator) if True else list(map(line_parser, test_input))
+    input = load('input.txt') if True else list(map(line_parser, test_input))
 
-    prob1_res = count_invalid_ids(input, is_part1_invalid_id)
+    prob1_res = part1(input)
     prob1_res = f'{prob1_res} ({"Correct" if prob1_res == 35367539282 else "Wrong, correct = 35367539282"})'
     print('Prob1:', prob1_res)
 
-    prob2_res = count_invalid_ids(input, is_part2_invalid_id)
+    prob2_res = part2(input)
     prob2_res =f'{prob2_res} ({"Correct" if prob2_res == 45814076230 else "Wrong, correct = 45814076230"})'
     print('Prob2:', prob2_res)
 
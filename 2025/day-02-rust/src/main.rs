@@ -1,4 +1,7 @@
-use std::fs;
+use std::{
+    fs,
+    time::Instant,
+};
 
 const TEST_INPUT: [&str; 11] = [
     "11-22",
@@ -100,15 +103,22 @@ fn count_invalid_ids(
 }
 
 fn main() {
+    let start = Instant::now();
     let input = if true {
         parse_input(&read_input_file("./input.txt"))
     } else {
         parse_input(&TEST_INPUT)
     };
+    let parse_time = start.elapsed();
 
+    let start = Instant::now();
     let prob1_res = count_invalid_ids(&input, &is_part1_invalid_id);
+    let prob1_time = start.elapsed();
+    let start = Instant::now();
     let prob2_res = count_invalid_ids(&input, &is_part2_invalid_id);
+    let prob2_time = start.elapsed();
 
     println!("Prob 1: {}. Correct? {}", prob1_res, prob1_res == 35367539282);
     println!("Prob 2: {}. Correct? {}", prob2_res, prob2_res == 45814076230u64);
+    eprintln!("Timings (ns): parse {} prob1 {} prob2 {}", parse_time.as_nanos(), prob1_time.as_nanos(), prob2_time.as_nanos());
 }
@@ -1,10 +1,13 @@
-from typing import Dict, List, Tuple
+import sys
+sys.path.insert(0, '../..')
 
-# NOTE: Tuples of various length that contain integers are lazily typed just as Tuple instead of Iterable
+from typing import List, Tuple
+
+from aoc.instrument import instrument
+from aoc.loader import filemap
+from aoc.memo import memoize, pack
 
-def filemap(filename, func = int, sep='\n'):
-    with open(filename, 'r') as f:
-        return list(map(func, f.read().strip().split(sep)))
+# NOTE: Tuples of various length that contain integers are lazily typed just as Tuple instead of Iterable
 
 test_input = [
     "987654321111111",
@@ -21,45 +24,53 @@ test_input = [
 #            max_joltage = max(max_joltage, 10*bank[l] + bank[r])
 #    return max_joltage
 
-def compute_bank_n_batts_max_joltage(bank: Tuple, n: int, cache: Dict[Tuple[int, Tuple], int]) -> int:
-    if (n, bank) in cache:
-        return cache[(n, bank)]
+# Max joltage of n batteries of bank[start:], memoized per bank
+@instrument
+@memoize(key=lambda bank, start, n: pack(n, start))
+def compute_bank_n_batts_max_joltage(bank: Tuple, start: int, n: int) -> int:
     if n == 1:
-        m = max(bank)
-        cache[(n, bank)] = m
-        return m
-    if n > len(bank):
+        return max(bank[start:])
+    if n > len(bank) - start:
         return 0
 
     max_joltage = 0
 
-    for i in range(0, len(bank)-1):
+    for i in range(start, len(bank)-1):
         current = 10 ** (n-1) * bank[i]
-        rest = compute_bank_n_batts_max_joltage(bank[i+1:], n-1, cache)
+        rest = compute_bank_n_batts_max_joltage(bank, i+1, n-1)
         if rest == 0:
             continue
         current += rest
         max_joltage = max(max_joltage, current)
 
-    cache[(n, bank)] = max_joltage
     return max_joltage
 
 def compute_n_batts_combined_max_joltage(input: List[Tuple], n_batteries: int):
-    cache = dict()
     total_joltage = 0
     for bank in input:
-        total_joltage += compute_bank_n_batts_max_joltage(bank, n_batteries, cache)
+        total_joltage += compute_bank_n_batts_max_joltage(bank, 0, n_batteries)
     return total_joltage
 
+def line_parser(l: str) -> Tuple:
+    return tuple(map(int, (c for c in l)))
+
+def load(filename: str) -> List[Tuple]:
+    return filemap(filename, line_parser)
+
+def part1(input: List[Tuple]) -> int:
+    return compute_n_batts_combined_max_joltage(input, 2)
+
+def part2(input: List[Tuple]) -> int:
+    return compute_n_batts_combined_max_joltage(input, 12)
+
 def main():
-    line_parser = lambda l: tuple(map(int, (c for c in l)))
-    input = filemap('input.txt', line_parser) if True else list(map(line_parser, test_input))
+    input = load('input.txt') if True else list(map(line_parser, test_input))
 
-    prob1_res = compute_n_batts_combined_max_joltage(input, 2)
+    prob1_res = part1(input)
     prob1_res = f'{prob1_res} ({"Correct" if prob1_res == 16993 else "Wrong, correct = 16993"})'
     print('Prob1:', prob1_res)
 
-    prob2_res = compute_n_batts_combined_max_joltage(input, 12)
+    prob2_res = part2(input)
     prob2_res =f'{prob2_res} ({"Correct" if prob2_res == 168617068915447 else "Wrong, correct = 168617068915447"})'
     print('Prob2:', prob2_res)
 
@@ -1,7 +1,8 @@
 use std::{
     cmp::max,
     collections::HashMap,
-    io::{self, Write}
+    io::{self, Write},
+    time::Instant,
 };
 
 use day_03_rust::io::utils::handle_args_load_puzzle_input;
@@ -78,12 +79,19 @@ fn compute_n_batts_combined_max_joltage(input: &Vec<Vec<u8>>, n_batteries: u32)
 }
 
 fn main() {
+    let start = Instant::now();
     let data = handle_args_load_puzzle_input();
     let parsed_input = parse_input(data);
+    let parse_time = start.elapsed();
 
+    let start = Instant::now();
     let prob1_res = compute_n_batts_combined_max_joltage(&parsed_input, 2);
+    let prob1_time = start.elapsed();
+    let start = Instant::now();
     let prob2_res = compute_n_batts_combined_max_joltage(&parsed_input, 12);
+    let prob2_time = start.elapsed();
 
     println!("Prob 1: {}. Correct? {}", prob1_res, prob1_res == 16993u64);
     println!("Prob 2: {}. Correct? {}", prob2_res, prob2_res == 168617068915447u64);
+    eprintln!("Timings (ns): parse {} prob1 {} prob2 {}", parse_time.as_nanos(), prob1_time.as_nanos(), prob2_time.as_nanos());
 }
@@ -1,13 +1,16 @@
-from enum import Enum
-from typing import List
+import sys
+sys.path.insert(0, '../..')
 
-class Cell(Enum):
+from array import array
+from enum import IntEnum
+
+from aoc.grid import Grid
+
+class Cell(IntEnum):
     EMPTY = 0
     ROLL = 1
 
-def filemap(filename, func = int, sep='\n'):
-    with open(filename, 'r') as f:
-        return list(map(func, f.read().strip().split(sep)))
+CODES = {'.': Cell.EMPTY, '@': Cell.ROLL}
 
 test_input = [
     '..@@.@@@@.',
@@ -22,63 +25,67 @@ test_input = [
     '@.@.@@@.@.'
 ]
 
-def count_adjacent_rolls(grid: List[List[Cell]], y: int, x: int) -> int:
-    rolls_cnt = 0
-    for dy in range(max(0, y-1), min(len(grid), y+2)):
-        for dx in range(max(0, x-1), min(len(grid[dy]), x+2)):
-            if dy == y and dx == x:
-                continue
-            if grid[dy][dx] == Cell.ROLL:
-                rolls_cnt += 1
-    return rolls_cnt
+def count_adjacent_rolls(grid: Grid, i: int) -> int:
+    # ROLL is 1 and the border is EMPTY, so the sum of the neighbours is the count
+    cells = grid.cells
+    return sum(cells[i + o] for o in grid.offsets8)
 
 
-def prob1(input: List[List[Cell]]) -> int:
+def prob1(input: Grid) -> int:
     can_access_cnt = 0
-    for y in range(len(input)):
-        for x in range(len(input[y])):
-            if input[y][x] == Cell.ROLL and count_adjacent_rolls(input, y, x) < 4:
-                can_access_cnt += 1
+    cells = input.cells
+    for i in input.interior():
+        if cells[i] == Cell.ROLL and count_adjacent_rolls(input, i) < 4:
+            can_access_cnt += 1
     return can_access_cnt
 
 
-def remove_roll(neighbours_map: List[List[int]], y: int, x: int):
-    for dy in range(max(0, y-1), min(len(neighbours_map), y+2)):
-        for dx in range(max(0, x-1), min(len(neighbours_map[dy]), x+2)):
-            neighbours_map[dy][dx] = max(0, neighbours_map[dy][dx]-1)
-
-def remove_all_rolls(grid: List[List[Cell]], neighbours_map: List[List[int]]) -> int:
+def remove_all_rolls(grid: Grid, neighbours_map: array) -> int:
+    # Removing a roll only ever lowers the counts of its neighbours, so instead
+    # of sweeping the grid until nothing changes only the neighbours of the
+    # removed rolls are revisited
+    cells = grid.cells
+    offsets = grid.offsets8
     removed_rolls_cnt = 0
-    done = False
-    while not done:
-        done = True
-        for y in range(len(grid)):
-            for x in range(len(grid[y])):
-                if grid[y][x] == Cell.ROLL and neighbours_map[y][x] < 4:
-                    grid[y][x] = Cell.EMPTY
-                    remove_roll(neighbours_map, y, x)
-                    removed_rolls_cnt += 1
-                    done = False
+    stack = array('I', (i for i in grid.interior() if cells[i] == Cell.ROLL and neighbours_map[i] < 4))
+    while stack:
+        i = stack.pop()
+        if cells[i] != Cell.ROLL:
+            continue
+        cells[i] = Cell.EMPTY
+        removed_rolls_cnt += 1
+        for o in offsets:
+            n = i + o
+            neighbours_map[n] -= 1
+            if cells[n] == Cell.ROLL and neighbours_map[n] < 4:
+                stack.append(n)
     return removed_rolls_cnt
 
-def prob2(input: List[List[Cell]]) -> int:
-    adjacent_rolls_cnt_map = list()
-    for y in range(len(input)):
-        adjacent_rolls_cnt_map.append([])
-        for x in range(len(input[y])):
-            adjacent_rolls_cnt_map[y].append(count_adjacent_rolls(input, y, x))
+def prob2(input: Grid) -> int:
+    # At most 8, and the border cells only go down to -3
+    adjacent_rolls_cnt_map = array('b', bytes(len(input.cells)))
+    for i in input.interior():
+        adjacent_rolls_cnt_map[i] = count_adjacent_rolls(input, i)
 
     return remove_all_rolls(input, adjacent_rolls_cnt_map)
 
+def load(filename: str) -> Grid:
+    return Grid.load(filename, CODES, pad=1, border=Cell.EMPTY)
+
+def part1(input: Grid) -> int:
+    return prob1(input)
+
+def part2(input: Grid) -> int:
+    return prob2(input)
+
 def main():
-    line_parser = lambda l: list((Cell.ROLL if c == '@' else Cell.EMPTY for c in l))
-    input = filemap('input.txt', line_parser) if True else list(map(line_parser, test_input))
+    input = load('input.txt') if True else Grid.from_lines(test_input, CODES, pad=1, border=Cell.EMPTY)
 
-    prob1_res = prob1(input)
+    prob1_res = part1(input)
     prob1_res = f'{prob1_res} ({"Correct" if prob1_res == 1411 else "Wrong, correct = 1411"})'
     print('Prob1:', prob1_res)
 
-    prob2_res = prob2(input)
+    prob2_res = part2(input)
     prob2_res =f'{prob2_res} ({"Correct" if prob2_res == 8557 else "Wrong, correct = 8557"})'
     print('Prob2:', prob2_res)
 
@@ -1,4 +1,7 @@
-use std::fmt;
+use std::{
+    fmt,
+    time::Instant,
+};
 
 use day_04_rust::io::utils::handle_args_load_puzzle_input;
 
@@ -262,12 +265,19 @@ fn prob2(input: &mut Grid, max_allowed_adjacent_rolls: u8) -> u32 {
 }
 
 fn main() {
+    let start = Instant::now();
     let data = handle_args_load_puzzle_input();
     let mut parsed_input = parse_input(data);
+    let parse_time = start.elapsed();
 
+    let start = Instant::now();
     let prob1_res = prob1(&parsed_input, 4);
+    let prob1_time = start.elapsed();
+    let start = Instant::now();
     let prob2_res = prob2(&mut parsed_input, 4);
+    let prob2_time = start.elapsed();
 
     println!("Prob 1: {}. Correct? {}", prob1_res, prob1_res == 1411u32);
     println!("Prob 2: {}. Correct? {}", prob2_res, prob2_res == 8557u32);
+    eprintln!("Timings (ns): parse {} prob1 {} prob2 {}", parse_time.as_nanos(), prob1_time.as_nanos(), prob2_time.as_nanos());
 }
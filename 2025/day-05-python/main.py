@@ -1,10 +1,12 @@
-from typing import Callable, List, Tuple
+import sys
+sys.path.insert(0, '../..')
 
-# NOTE: Python 3.8, type system has no support for proper generics
+from typing import List, Tuple
+
+from aoc.intervals import IntervalSet
+from aoc.loader import filemap
 
-def filemap(filename: str, func: Callable = int, sep: str = '\n') -> List:
-    with open(filename, 'r') as f:
-        return list(map(func, f.read().strip().split(sep)))
+# NOTE: Python 3.8, type system has no support for proper generics
 
 test_input = [
     '3-5',
@@ -20,7 +22,7 @@ test_input = [
     '32'
 ]
 
-def parse_input(input: List[str]) -> Tuple[List[Tuple[int, int]], List[int]]:
+def parse_input(input: List[str]) -> Tuple[IntervalSet, List[int]]:
     id_ranges = []
     ids = []
     parsing_ranges = True
@@ -30,46 +32,36 @@ def parse_input(input: List[str]) -> Tuple[List[Tuple[int, int]], List[int]]:
             parsing_ranges = False
             continue
         if parsing_ranges:
-            id_ranges.append(tuple(map(int, line.split('-'))))
+            low, high = line.split('-')
+            id_ranges.append((int(low), int(high)))
         else:
             ids.append(int(line))
 
-    id_ranges.sort()
-    combined = id_ranges[:1]
-
-    for low, high in id_ranges[1:]:
-        if low <= combined[-1][1]:
-            combined[-1] = (combined[-1][0], max(combined[-1][1], high))
-        else:
-            combined.append((low, high))
+    return (IntervalSet(id_ranges), ids)
 
-    return (combined, sorted(ids))
+def prob1(fresh_id_ranges: IntervalSet, ids: List[int]) -> int:
+    return fresh_id_ranges.count_contained(ids)
 
-def prob1(fresh_id_ranges: List[Tuple[int, int]], ids: List[int]) -> int:
-    fresh_ids_cnt = 0
-    min_id_i = 0
+def prob2(fresh_id_ranges: IntervalSet) -> int:
+    return fresh_id_ranges.covered()
 
-    for id in ids:
-        for i in range(min_id_i, len(fresh_id_ranges)):
-            low, high = fresh_id_ranges[i]
-            if low <= id <= high:
-                fresh_ids_cnt += 1
-                min_id_i = i
-                break
+def load(filename: str) -> Tuple[IntervalSet, List[int]]:
+    return parse_input(filemap(filename, str))
 
-    return fresh_ids_cnt
+def part1(input: Tuple[IntervalSet, List[int]]) -> int:
+    return prob1(input[0], input[1])
 
-def prob2(fresh_id_ranges: List[Tuple[int, int]]) -> int:
-    return sum(high-low+1 for low, high in fresh_id_ranges)
+def part2(input: Tuple[IntervalSet, List[int]]) -> int:
+    return prob2(input[0])
 
 def main():
-    input = parse_input(filemap('input.txt', str) if True else test_input)
+    input = load('input.txt') if True else parse_input(test_input)
 
-    prob1_res = prob1(input[0], input[1])
+    prob1_res = part1(input)
     prob1_res = f'{prob1_res} ({"Correct" if prob1_res == 690 else "Wrong, correct = 690"})'
     print('Prob1:', prob1_res)
 
-    prob2_res = prob2(input[0])
+    prob2_res = part2(input)
     prob2_res =f'{prob2_res} ({"Correct" if prob2_res == 344323629240733 else "Wrong, correct = 344323629240733"})'
     print('Prob2:', prob2_res)
 
@@ -1,6 +1,7 @@
 use std::{
     cmp::Ordering,
-    process
+    process,
+    time::Instant,
 };
 
 use day_05_rust::io::utils::handle_args_load_puzzle_input;
@@ -134,15 +135,22 @@ fn prob2(input: &IngredientIDData) -> usize {
 }
 
 fn main() {
+    let start = Instant::now();
     let data = match handle_args_load_puzzle_input() {
         Some(input_data) => input_data,
         None => process::exit(0),
     };
     let parsed_input = parse_input(&data);
+    let parse_time = start.elapsed();
 
+    let start = Instant::now();
     let prob1_res = prob1(&parsed_input);
+    let prob1_time = start.elapsed();
+    let start = Instant::now();
     let prob2_res = prob2(&parsed_input);
+    let prob2_time = start.elapsed();
 
     println!("Prob 1: {}. Correct? {}", prob1_res, prob1_res == 690usize);
     println!("Prob 2: {}. Correct? {}", prob2_res, prob2_res == 344323629240733usize);
+    eprintln!("Timings (ns): parse {} prob1 {} prob2 {}", parse_time.as_nanos(), prob1_time.as_nanos(), prob2_time.as_nanos());
 }
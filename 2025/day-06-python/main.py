@@ -1,11 +1,11 @@
-from dataclasses import dataclass
+import sys
+sys.path.insert(0, '../..')
+
 import operator
 import string
-from typing import Callable, List
+from typing import List, NamedTuple
 
-def filemap(filename: str, func: Callable = int, sep: str = '\n') -> List:
-    with open(filename, 'r') as f:
-        return list(map(func, f.read().split(sep)))
+from aoc.loader import filemap
 
 test_input = [
     '123 328  51 64 ',
@@ -21,8 +21,7 @@ OPS_MAP = {
     '/': operator.truediv
 }
 
-@dataclass
-class ParsedInput:
+class ParsedInput(NamedTuple):
     col_widths: List[int]
     lines: List[List[str]]
     operators: List[str]
@@ -104,14 +103,23 @@ def prob2(
 
     return tot_sum
 
+def load(filename: str) -> ParsedInput:
+    return parse_input(filemap(filename, str, strip=False)) # Columns are whitespace aligned
+
+def part1(input: ParsedInput) -> int:
+    return prob1(input.lines, input.operators)
+
+def part2(input: ParsedInput) -> int:
+    return prob2(input.lines, input.operators, input.col_widths)
+
 def main():
-    input = parse_input(filemap('input.txt', str) if True else test_input)
+    input = load('input.txt') if True else parse_input(test_input)
 
-    prob1_res = prob1(input.lines, input.operators)
+    prob1_res = part1(input)
     prob1_res = f'{prob1_res} ({"Correct" if prob1_res == 4076006202939 else "Wrong, correct = 4076006202939"})'
     print('Prob1:', prob1_res)
 
-    prob2_res = prob2(input.lines, input.operators, input.col_widths)
+    prob2_res = part2(input)
     prob2_res =f'{prob2_res} ({"Correct" if prob2_res == 7903168391557 else "Wrong, correct = 7903168391557"})'
     print('Prob2:', prob2_res)
 
@@ -1,4 +1,7 @@
-use std::process;
+use std::{
+    process,
+    time::Instant,
+};
 
 use day_06_rust::io::utils::handle_args_load_puzzle_input;
 
@@ -93,14 +96,19 @@ fn prob1(input: &InputData) -> u64 {
 }
 
 fn main() {
+    let start = Instant::now();
     let data = match handle_args_load_puzzle_input()  {
         Some(input_data) => input_data,
         None => process::exit(0),
     };
 
     let parsed_input = parse_input(&data);
+    let parse_time = start.elapsed();
 
+    let start = Instant::now();
     let prob1_res = prob1(&parsed_input);
+    let prob1_time = start.elapsed();
 
     println!("Prob 1: {}. Correct? {}", prob1_res, prob1_res == 4076006202939u64);
+    eprintln!("Timings (ns): parse {} prob1 {}", parse_time.as_nanos(), prob1_time.as_nanos());
 }
@@ -1,10 +1,11 @@
-import copy
-from enum import Enum
-from typing import Callable, Dict, List, Tuple
+import sys
+sys.path.insert(0, '../..')
 
-def filemap(filename: str, func: Callable = int, sep: str = '\n') -> List:
-    with open(filename, 'r') as f:
-        return list(map(func, f.read().strip().split(sep)))
+from enum import IntEnum
+
+from aoc.grid import Grid
+from aoc.instrument import instrument
+from aoc.memo import memoize
 
 test_input = [
     '.......S.......',
@@ -25,7 +26,7 @@ test_input = [
     '...............'
 ]
 
-CellEnum = Enum('Cell', 'BEAM EMPTY SPLITTER START')
+CellEnum = IntEnum('CellEnum', 'BEAM EMPTY SPLITTER START BORDER')
 CELL_ENUM_MAP = {
     '.': CellEnum.EMPTY,
     CellEnum.EMPTY: '.',
@@ -37,66 +38,96 @@ CELL_ENUM_MAP = {
     CellEnum.BEAM: '|'
 }
 
-def print_grid(grid: List[List[CellEnum]]):
-    for row in grid:
-        print(''.join(CELL_ENUM_MAP[x] for x in row))
+CODES = {c: cell for c, cell in CELL_ENUM_MAP.items() if isinstance(c, str)}
 
-def parse_input_line(line: str):
-    try:
-        return [CELL_ENUM_MAP[c] for c in line]
-    except Exception as e:
-        print("Encountered not supported character in input:", e)
-        return []
+def print_grid(grid: Grid):
+    for row in grid.to_lines(CELL_ENUM_MAP):
+        print(row)
 
-def prob1(grid: List[List[CellEnum]]) -> int:
+def prob1(grid: Grid) -> int:
+    BEAM, EMPTY, SPLITTER = CellEnum.BEAM, CellEnum.EMPTY, CellEnum.SPLITTER
+    cells, below = grid.cells, grid.stride
+    row_starts = grid.row_starts()
     tot_splits_count = 0
-    for x in range(len(grid[0])):
-        if grid[0][x] == CellEnum.START:
-            grid[1][x] = CellEnum.BEAM
-
-    for y in range(len(grid)-1):
-        for x in range(len(grid[y])):
-            if grid[y][x] == CellEnum.BEAM:
-                if grid[y+1][x] == CellEnum.SPLITTER:
+    for i in range(row_starts[0], row_starts[0] + grid.width):
+        if cells[i] == CellEnum.START:
+            cells[i + below] = BEAM
+
+    # The border is never EMPTY, so beams are not split out of the grid
+    for start in row_starts[:-1]:
+        for i in range(start, start + grid.width):
+            if cells[i] == BEAM:
+                if cells[i + below] == SPLITTER:
                     tot_splits_count += 1
-                    if x > 0 and grid[y+1][x-1] == CellEnum.EMPTY:
-                        grid[y+1][x-1] = CellEnum.BEAM
-                    if x < len(grid[y+1])-1 and grid[y+1][x+1] == CellEnum.EMPTY:
-                        grid[y+1][x+1] = CellEnum.BEAM
+                    if cells[i + below - 1] == EMPTY:
+                        cells[i + below - 1] = BEAM
+                    if cells[i + below + 1] == EMPTY:
+                        cells[i + below + 1] = BEAM
                 else:
-                    grid[y+1][x] = CellEnum.BEAM
+                    cells[i + below] = BEAM
 
     return tot_splits_count
 
-def prob2(grid: List[List[CellEnum]], pos: Tuple[int, int], cache: Dict[Tuple[int, int], int]) -> int:
-    if pos in cache:
-        return cache[pos]
-
-    y, x = pos
+@instrument
+@memoize(key=lambda grid, i: i)
+def prob2(grid: Grid, i: int) -> int:
+    cell = grid.cells[i]
+    if cell == CellEnum.BORDER:
+        return 0
 
-    if y == len(grid) - 1:
+    y, _ = grid.coords(i)
+    if y == grid.height - 1:
         return 1
 
     tot = 0
-    if grid[y][x] == CellEnum.EMPTY or grid[y][x] == CellEnum.START:
-        tot = prob2(grid, (y+1, x), cache)
-    elif grid[y][x] == CellEnum.SPLITTER:
-        if x > 0:
-            tot += prob2(grid, (y, x-1), cache)
-        if x < len(grid[y]) - 1:
-            tot += prob2(grid, (y, x+1), cache)
-
-    cache[pos] = tot
+    if cell == CellEnum.EMPTY or cell == CellEnum.START:
+        tot = prob2(grid, i + grid.stride)
+    elif cell == CellEnum.SPLITTER:
+        tot += prob2(grid, i - 1)
+        tot += prob2(grid, i + 1)
+
     return tot
 
+def prob2_bottom_up(grid: Grid, start: int) -> int:
+    ''' prob2 computed row by row from the last row up, without recursion. '''
+    EMPTY, SPLITTER, START = CellEnum.EMPTY, CellEnum.SPLITTER, CellEnum.START
+    cells, width = grid.cells, grid.width
+    row_starts = grid.row_starts()
+
+    # Timelines starting from every cell of the row below, each cell of the last row ends one
+    below = [1] * width
+    for row_start in reversed(row_starts[:-1]):
+        row = [0] * width
+        for x in range(width):
+            cell = cells[row_start + x]
+            if cell == EMPTY or cell == START:
+                row[x] = below[x]
+        # Splitters continue in the cells beside them, the border ends a beam
+        for x in range(width):
+            if cells[row_start + x] == SPLITTER:
+                row[x] = (row[x-1] if x > 0 else 0) + (row[x+1] if x < width - 1 else 0)
+        below = row
+
+    return below[start - row_starts[0]]
+
+def load(filename: str) -> Grid:
+    return Grid.load(filename, CODES, pad=1, border=CellEnum.BORDER)
+
+def part1(input: Grid) -> int:
+    return prob1(input.copy())
+
+def part2(input: Grid, recursive: bool = False) -> int:
+    start = input.cells.index(CellEnum.START, input.index(0, 0), input.index(0, input.width))
+    return prob2(input, start) if recursive else prob2_bottom_up(input, start)
+
 def main():
-    input = filemap('input.txt', parse_input_line) if True else list(map(parse_input_line, test_input))
+    input = load('input.txt') if True else Grid.from_lines(test_input, CODES, pad=1, border=CellEnum.BORDER)
 
-    prob1_res = prob1(copy.deepcopy(input))
+    prob1_res = part1(input)
     prob1_res = f'{prob1_res} ({"Correct" if prob1_res == 1672 else "Wrong, correct = 1672"})'
     print('Prob1:', prob1_res)
 
-    prob2_res = prob2(input, (0, input[0].index(CellEnum.START)), dict())
+    prob2_res = part2(input)
     prob2_res =f'{prob2_res} ({"Correct" if prob2_res == 231229866702355 else "Wrong, correct = 231229866702355"})'
     print('Prob2:', prob2_res)
 
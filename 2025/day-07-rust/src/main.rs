@@ -1,7 +1,8 @@
 use std::{
     collections,
     fmt,
-    process
+    process,
+    time::Instant,
 };
 
 use day_07_rust::io::utils::handle_args_load_puzzle_input;
@@ -193,18 +194,25 @@ fn prob2(input_data: &InputData) -> u64 {
 }
 
 fn main() {
+    let start = Instant::now();
     let data = match handle_args_load_puzzle_input() {
         Some(input_data) => input_data,
         None => process::exit(0),
     };
 
     let parsed_input = parse_input(&data);
-    let mut prob1_grid = parsed_input.grid.clone();
+    let parse_time = start.elapsed();
 
+    let start = Instant::now();
+    let mut prob1_grid = parsed_input.grid.clone();
     let prob1_res = prob1(&mut prob1_grid);
+    let prob1_time = start.elapsed();
+    let start = Instant::now();
     let prob2_res = prob2(&parsed_input);
+    let prob2_time = start.elapsed();
 
     //println!("{}", prob1_grid);
     println!("Prob 1: {}. Correct? {}", prob1_res, prob1_res == 21u64 || prob1_res == 1672u64);
     println!("Prob 2: {}. Correct? {}", prob2_res, prob2_res == 40u64 || prob2_res == 231229866702355u64);
+    eprintln!("Timings (ns): parse {} prob1 {} prob2 {}", parse_time.as_nanos(), prob1_time.as_nanos(), prob2_time.as_nanos());
 }
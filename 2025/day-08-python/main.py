@@ -1,6 +1,12 @@
+import sys
+sys.path.insert(0, '../..')
+
 import heapq
 import math
-from typing import Callable, Dict, List, NamedTuple, Set, Tuple
+from typing import Iterator, List, NamedTuple, Tuple
+
+from aoc.loader import iint_tuples
+from aoc.unionfind import UnionFind
 
 test_input = [
     '162,817,812',
@@ -30,130 +36,83 @@ class Point3D(NamedTuple):
     y: int
     z: int
 
-def filemap(filename: str, func: Callable = int, sep: str = '\n') -> List:
-    with open(filename, 'r') as f:
-        return list(map(func, f.read().strip().split(sep)))
-
-def dist(a: Point3D, b: Point3D) -> float:
-    return math.sqrt((a.x-b.x) ** 2 + (a.y-b.y) ** 2 + (a.z-b.z) ** 2)
+def dist2(a: Point3D, b: Point3D) -> int:
+    ''' Squared distance, orders the pairs like the distance without any rounding. '''
+    return (a.x-b.x) ** 2 + (a.y-b.y) ** 2 + (a.z-b.z) ** 2
 
-def compute_distances(input: List[Point3D]) -> Tuple[Dict[int, Dict[int, float]], List[Tuple[float, Tuple[int, int]]]]:
-    dist_graph: Dict[int, Dict[int, float]] = dict()
-    distlist: List[Tuple[float, Tuple[int, int]]] = list()
-
-    for i in range(len(input)):
-        dist_graph[i] = dict()
+def pair_distances(input: List[Point3D]) -> Iterator[Tuple[int, int, int]]:
+    ''' (squared distance, i, j) of every pair i < j, generated one at a time. '''
+    for i, a in enumerate(input):
+        ax, ay, az = a
         for j in range(i+1, len(input)):
-            d = dist(input[i], input[j])
-            dist_graph[i][j] = d
-            distlist.append((d, (i, j)))
-
-    heapq.heapify(distlist)
-    return dist_graph, distlist
+            bx, by, bz = input[j]
+            yield ((ax-bx) ** 2 + (ay-by) ** 2 + (az-bz) ** 2, i, j)
 
 def prob1(input: List[Point3D], connections_cnt: int) -> int:
-    _, distlist = compute_distances(input)
-    circuits: List[Set[int]] = list()
-
-    added_cnt = 0
-    while added_cnt < connections_cnt:
-        added_cnt += 1
-        was_in_same_circuit = False
-        _, (a, b) = heapq.heappop(distlist)
-
-        matching_indexes = []
-        for i, circuit in enumerate(circuits):
-            if a in circuit:
-                if b in circuit:
-                    was_in_same_circuit = True
-                    break
-                matching_indexes.append(i)
-            elif b in circuit:
-                matching_indexes.append(i)
-
-            if len(matching_indexes) == 2:
-                break
-
-        if was_in_same_circuit:
-            continue
-
-        if len(matching_indexes) == 0:
-            circuits.append({a, b})
-        elif len(matching_indexes) == 1:
-            circuits[matching_indexes[0]].add(a)
-            circuits[matching_indexes[0]].add(b)
-        elif len(matching_indexes) == 2:
-            circuits[matching_indexes[0]].add(a)
-            circuits[matching_indexes[0]].add(b)
-            circuits[matching_indexes[0]] |= circuits[matching_indexes[1]]
-            del circuits[matching_indexes[1]]
-        else:
-            print("Logic error")
-
-    circuit_sizes = sorted((len(s) for s in circuits), reverse=True)
+    # Only the closest pairs are kept, in a heap of connections_cnt, not all n^2 of them
+    closest = heapq.nsmallest(connections_cnt, pair_distances(input))
+    circuits = UnionFind(len(input))
+
+    for _, a, b in closest:
+        circuits.union(a, b)
+
+    circuit_sizes = sorted(circuits.set_sizes(), reverse=True)
     return math.prod(circuit_sizes[:3])
 
 def prob2(input: List[Point3D]) -> int:
-    _, distlist = compute_distances(input)
-    circuits: List[Set[int]] = list()
-
-    last_added_pair = None
-
-    while len(distlist) > 0:
-        was_in_same_circuit = False
-        matching_indexes = []
-        _, (a, b) = heapq.heappop(distlist)
-
-        for idx, circuit in enumerate(circuits):
-            if a in circuit:
-                if b in circuit:
-                    was_in_same_circuit = True
-                    break
-                matching_indexes.append(idx)
-            elif b in circuit:
-                matching_indexes.append(idx)
-
-            if len(matching_indexes) == 2:
-                break
-
-        if was_in_same_circuit:
-            continue
-
-        if len(matching_indexes) == 0:
-            last_added_pair = (a, b)
-            circuits.append({a, b})
-        elif len(matching_indexes) == 1:
-            last_added_pair = (a, b)
-            circuits[matching_indexes[0]].add(a)
-            circuits[matching_indexes[0]].add(b)
-        elif len(matching_indexes) == 2:
-            last_added_pair = (a, b)
-            circuits[matching_indexes[0]] |= circuits[matching_indexes[1]]
-            circuits[matching_indexes[1]].clear()
-            #del circuits[matching_indexes[1]]
-        else:
-            print("Logic error")
-
-    if last_added_pair is None:
+    '''
+    Connecting the closest pairs first is Kruskal's algorithm, and the last
+    pair that merges two circuits is the longest edge of the minimum
+    spanning tree. The tree is grown with Prim's algorithm over the implicit
+    complete graph instead, which only keeps the distance of every box not
+    yet connected to the tree. With distinct distances, as in the puzzle,
+    the tree and so its longest edge are the same as Kruskal's.
+    '''
+    if len(input) < 2:
         return -1
 
-    j_box_a = input[last_added_pair[0]]
-    j_box_b = input[last_added_pair[1]]
+    xs, ys, zs = ([p[k] for p in input] for k in range(3))
+    rest = list(range(1, len(input)))
+    best = [dist2(input[0], input[j]) for j in rest]
+    longest, longest_box = -1, 0
+
+    while rest:
+        k = min(range(len(rest)), key=best.__getitem__)
+        d, j = best[k], rest[k]
+        if d > longest:
+            longest, longest_box = d, j
+        rest[k], best[k] = rest[-1], best[-1]
+        rest.pop()
+        best.pop()
+        x, y, z = xs[j], ys[j], zs[j]
+        best = list(map(min, best, [(xs[m]-x) ** 2 + (ys[m]-y) ** 2 + (zs[m]-z) ** 2 for m in rest]))
+
+    # The box the longest edge connected to, the only other one at that distance
+    partner = next(i for i, p in enumerate(input) if i != longest_box and dist2(p, input[longest_box]) == longest)
+    return input[longest_box].x * input[partner].x
+
+
+def line_parser(l: str) -> Point3D:
+    return Point3D(*map(int, l.strip().split(',')))
+
+def load(filename: str) -> List[Point3D]:
+    return [Point3D(*coords) for coords in iint_tuples(filename)]
 
-    return j_box_a.x * j_box_b.x
+def part1(input: List[Point3D], connections_cnt: int = 1000) -> int:
+    return prob1(input, connections_cnt)
 
+def part2(input: List[Point3D]) -> int:
+    return prob2(input)
 
 def main():
     use_test_input = False
-    line_parser = lambda l: list(map(int, l.strip().split(',')))
-    input = filemap('input.txt', line_parser) if not use_test_input else list(map(line_parser, test_input))
-    input = list(map(lambda l: Point3D(*l), input))
+    input = load('input.txt') if not use_test_input else list(map(line_parser, test_input))
 
-    prob1_res = prob1(input, 10 if use_test_input else 1000)
+    prob1_res = part1(input, 10 if use_test_input else 1000)
     prob1_res = f'{prob1_res} ({"Correct" if prob1_res == 164475 else "Wrong, correct = 164475"})'
     print('Prob1:', prob1_res)
 
-    prob2_res = prob2(input)
+    prob2_res = part2(input)
     prob2_res =f'{prob2_res} ({"Correct" if prob2_res == 169521198 else "Wrong, correct = 169521198"})'
     print('Prob2:', prob2_res)
 
@@ -6,6 +6,7 @@ use std::{
     },
     fmt,
     process,
+    time::Instant,
 };
 
 use day_08_rust::io::utils::handle_args_load_puzzle_input;
@@ -263,16 +264,23 @@ fn prob2(mut edges_dist_heap: BinaryHeap<Edge>) -> i64 {
 fn main() {
     // Lazy implementation that performs O(n) operations on Vec's instead of using smarter
     // bookkeeping of the states of the circuits. Runtime <0.5 seconds with the given input.
+    let start = Instant::now();
     let data = match handle_args_load_puzzle_input() {
         Some(input_data) => input_data,
         None => process::exit(0),
     };
 
     let parsed_input = parse_input(&data.0);
+    let parse_time = start.elapsed();
 
+    let start = Instant::now();
     let prob1_res = prob1(parsed_input.edges_dist_heap.clone(), if data.1 { 1000 } else { 10 });
+    let prob1_time = start.elapsed();
+    let start = Instant::now();
     let prob2_res = prob2(parsed_input.edges_dist_heap);
+    let prob2_time = start.elapsed();
 
     println!("Prob 1: {}. Correct? {}", prob1_res, prob1_res == 40usize || prob1_res == 164475usize);
     println!("Prob 2: {}. Correct? {}", prob2_res, prob2_res == 25272i64 || prob2_res == 169521198i64);
+    eprintln!("Timings (ns): parse {} prob1 {} prob2 {}", parse_time.as_nanos(), prob1_time.as_nanos(), prob2_time.as_nanos());
 }
@@ -1,8 +1,9 @@
-from typing import Callable, List, NamedTuple, Set
+import sys
+sys.path.insert(0, '../..')
 
-def filemap(filename: str, func: Callable = int, sep: str = '\n') -> List:
-    with open(filename, 'r') as f:
-        return list(map(func, f.read().strip().split(sep)))
+from typing import List, NamedTuple, Set
+
+from aoc.loader import iint_tuples
 
 class Point2D(NamedTuple):
     x: int
@@ -101,15 +102,26 @@ def prob2(red_tiles_coords: List[Point2D]) -> int:
 
     return max_rect_size
 
+def line_parser(l: str) -> Point2D:
+    return Point2D(*map(int, l.split(',')))
+
+def load(filename: str) -> List[Point2D]:
+    return [Point2D(*coords) for coords in iint_tuples(filename)]
+
+def part1(input: List[Point2D]) -> int:
+    return prob1(input)
+
+def part2(input: List[Point2D]) -> int:
+    return prob2(input)
+
 def main():
-    line_parser = lambda l: Point2D(*map(int, l.split(',')))
-    input = filemap('input.txt', line_parser) if True else list(map(line_parser, test_input))
+    input = load('input.txt') if True else list(map(line_parser, test_input))
 
-    prob1_res = prob1(input)
+    prob1_res = part1(input)
     prob1_res = f'{prob1_res} ({"Correct" if prob1_res == 4748826374 or prob1_res == 50 else "Wrong, correct = 4748826374"})'
     print('Prob1:', prob1_res)
 
-    prob2_res = prob2(input)
+    prob2_res = part2(input)
     prob2_res =f'{prob2_res} ({"Correct" if prob2_res == 1554370486 or prob2_res == 24 else "Wrong, correct = 1554370486"})'
     print('Prob2:', prob2_res)
 
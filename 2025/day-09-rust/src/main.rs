@@ -3,6 +3,7 @@ use std::{
     collections::HashSet,
     io,
     process,
+    time::Instant,
 };
 
 use crossterm::{
@@ -293,6 +294,7 @@ fn run_ui(
 }
 
 fn main() -> Result<(), Box<dyn std::error::Error>> {
+    let start = Instant::now();
     let (dump_ascii, input_data) = handle_args_load_puzzle_input();
     let data = match input_data {
         Some(input_data) => input_data,
@@ -300,9 +302,15 @@ fn main() -> Result<(), Box<dyn std::error::Error>> {
     };
 
     let parsed_input = parse_input(&data);
+    let parse_time = start.elapsed();
 
+    let start = Instant::now();
     let prob1_res = prob1(&parsed_input);
+    let prob1_time = start.elapsed();
+    let start = Instant::now();
     let (prob2_res, prob2_rect) = prob2(&parsed_input);
+    let prob2_time = start.elapsed();
+    eprintln!("Timings (ns): parse {} prob1 {} prob2 {}", parse_time.as_nanos(), prob1_time.as_nanos(), prob2_time.as_nanos());
 
     let prob1_text = format!("Prob 1: {}. Correct? {}", prob1_res, prob1_res == 50usize || prob1_res == 4748826374usize);
     let prob2_text = format!("Prob 2: {}. Correct? {}", prob2_res, prob2_res == 24usize || prob2_res == 1554370486usize);
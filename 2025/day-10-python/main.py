@@ -1,14 +1,13 @@
-from dataclasses import dataclass
+import sys
+sys.path.insert(0, '../..')
+
 import heapq
 
-from typing import Callable, List, Set, Tuple
+from typing import List, NamedTuple, Set, Tuple
 
-def filemap(filename: str, func: Callable = int, sep: str = '\n') -> List:
-    with open(filename, 'r') as f:
-        return list(map(func, f.read().strip().split(sep)))
+from aoc.loader import filemap
 
-@dataclass
-class Machine:
+class Machine(NamedTuple):
     indicator_ligths: Tuple[bool, ...]
     wiring_schematics: List[Set[int]]
     joltage_requirements: List[int]
@@ -76,14 +75,23 @@ def prob1(input: List[Machine]) -> int:
 def prob2(input: List[Machine]) -> int:
     return -1
 
+def load(filename: str) -> List[Machine]:
+    return filemap(filename, parse_input_line)
+
+def part1(input: List[Machine]) -> int:
+    return prob1(input)
+
+def part2(input: List[Machine]) -> int:
+    return prob2(input)
+
 def main():
-    input = filemap('input.txt', parse_input_line) if True else list(map(parse_input_line, test_input))
+    input = load('input.txt') if True else list(map(parse_input_line, test_input))
 
-    prob1_res = prob1(input)
+    prob1_res = part1(input)
     prob1_res = f'{prob1_res} ({"Correct" if prob1_res == 507 else "Wrong, correct = 507"})'
     print('Prob1:', prob1_res)
 
-    prob2_res = prob2(input) # 10 + 12 + 11 = 33
+    prob2_res = part2(input) # 10 + 12 + 11 = 33
     prob2_res =f'{prob2_res} ({"Correct" if prob2_res == 33 else "Wrong, correct = 33"})'
     print('Prob2: (TODO: Implement linear equation solver for integer solutions?):', prob2_res)
 
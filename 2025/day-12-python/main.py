@@ -1,12 +1,12 @@
-import copy
-from dataclasses import dataclass
+import sys
+sys.path.insert(0, '../..')
+
 from enum import Enum
 
-from typing import Callable, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
-def filemap(filename: str, func: Callable = int, sep: str = '\n') -> List:
-    with open(filename, 'r') as f:
-        return list(map(func, f.read().strip().split(sep)))
+from aoc.grid import Grid
+from aoc.loader import filemap
 
 test_input = [
     '0:',
@@ -52,9 +52,9 @@ class Orientation(Enum):
     VF = 4
     HF = 5
 
-class Shape:
-    fill_i_val = 0
+EMPTY, FILLED = 0, 1
 
+class Shape:
     def __init__(self, coords: List[str]):
         if any(len(coords) != len(row) for row in coords):
             print('Error: encountered a not square sized shape')
@@ -80,6 +80,8 @@ class Shape:
             flip_v,
             flip_h
         ]
+        # Flat grid offsets of the filled cells of every orientation, by grid stride
+        self.__offsets: Dict[Tuple[Orientation, int], Tuple[int, ...]] = {}
 
     @property
     def cells_cnt(self) -> int:
@@ -88,36 +90,47 @@ class Shape:
     def get_orientation(self, orientation: Orientation) -> List[List[bool]]:
         return self.__coords[orientation.value]
 
-    def fits(self, grid: List[List[Optional[int]]], orientation: Orientation, y: int, x: int) -> bool:
-        for dy in range(self.__side_len):
-            for dx in range(self.__side_len):
-                if self.get_orientation(orientation)[dy][dx] and grid[y+dy][x+dx] is not None:
-                    return False
+    def get_offsets(self, orientation: Orientation, stride: int) -> Tuple[int, ...]:
+        key = (orientation, stride)
+        if key not in self.__offsets:
+            oriented = self.get_orientation(orientation)
+            self.__offsets[key] = tuple(dy * stride + dx
+                                        for dy in range(self.__side_len)
+                                        for dx in range(self.__side_len) if oriented[dy][dx])
+        return self.__offsets[key]
+
+    def fits(self, grid: Grid, orientation: Orientation, y: int, x: int) -> bool:
+        cells = grid.cells
+        base = grid.index(y, x)
+        for offset in self.get_offsets(orientation, grid.stride):
+            if cells[base + offset] != EMPTY:
+                return False
         return True
 
-    def place_if_fits(self, grid: List[List[Optional[int]]], orientation: Orientation) -> Tuple[int, int]:
-        for i in range(len(grid) + 1 - self.__side_len):
-            for j in range(len(grid[i]) + 1 - self.__side_len):
-                if self.fits(grid, orientation, i, j):
-                    for y in range(self.__side_len):
-                        for x in range(self.__side_len):
-                            if self.get_orientation(orientation)[y][x]:
-                                grid[i+y][j+x] = Shape.fill_i_val
-
-                    Shape.fill_i_val += 1
+    def place_if_fits(self, grid: Grid, orientation: Orientation) -> Tuple[int, int]:
+        # fits() inlined, this scan is where the search spends its time
+        cells = grid.cells
+        offsets = self.get_offsets(orientation, grid.stride)
+        for i in range(grid.height + 1 - self.__side_len):
+            row_base = grid.index(i, 0)
+            for j in range(grid.width + 1 - self.__side_len):
+                base = row_base + j
+                for offset in offsets:
+                    if cells[base + offset] != EMPTY:
+                        break
+                else:
+                    for offset in offsets:
+                        cells[base + offset] = FILLED
                     return (i, j)
 
         return (-1, -1)
 
-    def remove_from_grid(self, grid: List[List[Optional[int]]], orientation: Orientation, y: int, x: int):
-        oriented = self.get_orientation(orientation)
-        for i in range(y, y+self.__side_len):
-            for j in range(x, x+self.__side_len):
-                if not oriented[i-y][j-x]:
-                    continue
-                if grid[i][j] is None:
-                    print('error, removing non existing shape coord')
-                grid[i][j] = None
+    def remove_from_grid(self, grid: Grid, orientation: Orientation, y: int, x: int):
+        base = grid.index(y, x)
+        for offset in self.get_offsets(orientation, grid.stride):
+            if grid.cells[base + offset] == EMPTY:
+                print('error, removing non existing shape coord')
+            grid.cells[base + offset] = EMPTY
 
     def __str__(self) -> str:
         return '\n'.join((''.join('#' if x else '.' for x in row)
@@ -132,20 +145,18 @@ class Shape:
         ))
 
 
-@dataclass
-class Region:
+class Region(NamedTuple):
     height: int
     width: int
     present_idxs_cnt: List[int]
 
-@dataclass
-class InputData:
+class InputData(NamedTuple):
     present_shapes: List[Shape]
     regions: List[Region]
 
 
-def print_grid(grid: List[List[Optional[int]]]):
-    print('\n'.join((''.join(str(x) if x is not None else '.' for x in row) for row in grid)))
+def print_grid(grid: Grid):
+    print('\n'.join(grid.to_lines({EMPTY: '.', FILLED: '#'})))
 
 def parse_input(raw_input: List[str]) -> InputData:
     start_idxs = [l for l, row in enumerate(raw_input) if row.endswith(':')]
@@ -176,10 +187,11 @@ def parse_input(raw_input: List[str]) -> InputData:
     )
 
 
-def prob1(input_test: InputData, input: InputData) -> int:
+def count_fitting_regions(input: InputData) -> int:
+    ''' Regions in which all their presents fit, searched exhaustively. '''
     def can_fit(
             present_shapes: List[Shape],
-            grid: List[List[Optional[int]]],
+            grid: Grid,
             indices_cnt: List[Tuple[int, int]]
     ) -> bool:
         if all([cnt == 0 for _, cnt in indices_cnt]):
@@ -196,10 +208,10 @@ def prob1(input_test: InputData, input: InputData) -> int:
                 if did_fit_coords == (-1, -1):
                     continue
 
-                next_indices_cnt = copy.deepcopy(indices_cnt)
+                next_indices_cnt = list(indices_cnt) # The counts are immutable tuples
                 next_indices_cnt[i] = (shape_i, cnt-1)
 
-                all_fitted = can_fit(present_shapes, copy.deepcopy(grid), next_indices_cnt)
+                all_fitted = can_fit(present_shapes, grid.copy(), next_indices_cnt)
                 if all_fitted:
                     return True
                 else:
@@ -207,17 +219,28 @@ def prob1(input_test: InputData, input: InputData) -> int:
 
         return False
 
-    test_input_fits_cnt = 0
     fits_cnt = 0
-
-    print('Calibrating approximation of required extra empty cells count against test input, this can take a few minutes..')
-    for i, region in enumerate(input_test.regions):
-        grid: List[List[Optional[int]]] = [[None for _ in range(region.width)] for _ in range(region.height)]
+    for region in input.regions:
+        grid = Grid(region.height, region.width, EMPTY)
         indicies = [(i, cnt) for i,cnt in enumerate(region.present_idxs_cnt) if cnt > 0]
-        did_fit = can_fit(input_test.present_shapes, grid, indicies)
+        did_fit = can_fit(input.present_shapes, grid, indicies)
         if did_fit:
-            test_input_fits_cnt += 1
-        print(i+1, '/', len(input_test.regions), 'completed. All presents fitted:', did_fit)
+            fits_cnt += 1
+
+    return fits_cnt
+
+def calibration() -> Tuple[InputData, int]:
+    '''
+    The test input and how many of its regions fit. It only depends on the
+    test input, but it is searched again on every call and not cached, so
+    the search is part of every timed run of part 1.
+    '''
+    print('Calibrating approximation of required extra empty cells count against test input, this can take a few minutes..')
+    input_test = parse_input(test_input)
+    return input_test, count_fitting_regions(input_test)
+
+def prob1(input_test: InputData, test_input_fits_cnt: int, input: InputData) -> int:
+    fits_cnt = 0
 
     # Approximate required extra_cells count for every shape
     extra_cells = -1
@@ -248,15 +271,24 @@ def prob1(input_test: InputData, input: InputData) -> int:
 def prob2(input) -> int:
     return -1
 
+def load(filename: str) -> InputData:
+    return parse_input(filemap(filename, str))
+
+def part1(input: InputData, calibrated: Optional[Tuple[InputData, int]] = None) -> int:
+    ''' calibrated is the result of calibration(), searched here if not given. '''
+    return prob1(*(calibrated or calibration()), input)
+
+def part2(input: InputData) -> int:
+    return prob2(input)
+
 def main():
-    input = parse_input(filemap('input.txt', str))
-    input_test = parse_input(test_input)
+    input = load('input.txt')
 
-    prob1_res = prob1(input_test, input)
+    prob1_res = part1(input)
     prob1_res = f'{prob1_res} ({"Correct" if prob1_res == 472 else "Wrong, correct = 472"})'
     print('Prob1:', prob1_res)
 
-    prob2_res = prob2(input)
+    prob2_res = part2(input)
     prob2_res =f'{prob2_res} ({"Correct" if prob2_res == -1 else "Wrong, correct = -1"})'
     print('Prob2:', prob2_res)
 
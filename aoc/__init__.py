@@ -0,0 +1,12 @@
+'''
+Shared tooling for running, timing and profiling the Advent of Code solutions
+of every year in this repository.
+
+Every solution module exposes the same three phases:
+
+    load(filename)  -> parsed input
+    part1(input)    -> answer for part 1
+    part2(input)    -> answer for part 2
+
+and keeps its own main() for running it directly from its directory.
+'''
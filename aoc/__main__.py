@@ -0,0 +1,95 @@
+'''
+Single entry point of the tooling.
+
+    python -m aoc run 2025 8 [--input big.txt] [--part 2] [--repeat 5] [--profile]
+    python -m aoc <bench|runner|generate|instrument|memory|check|rust|watch|startup|batch|history> [args..]
+
+run solves one day, only importing its module and running the requested
+parts on any input. The other commands forward their arguments to the tool
+of the same name, which is imported only when it is used.
+'''
+import argparse
+import importlib
+import statistics
+import sys
+import time
+from typing import List, Optional
+
+TOOLS = ('bench', 'runner', 'generate', 'instrument', 'memory', 'check', 'rust', 'watch', 'startup', 'batch', 'history')
+
+def run(args: argparse.Namespace, parser: argparse.ArgumentParser) -> int:
+    from aoc.days import load_module, select_cli_days
+
+    days = select_cli_days(parser, [f'{args.year}:{args.day}'])
+    day = days[0]
+    module = load_module(day)
+    input_path = args.input or day.input_path
+    parts = [args.part] if args.part else [1, 2]
+
+    profiler = None
+    if args.profile:
+        import cProfile
+        profiler = cProfile.Profile()
+
+    parse_times: List[float] = []
+    part_times = {part: [] for part in parts}
+    answers = {}
+    for _ in range(args.repeat):
+        # Parsed again on every round, some parts modify their input
+        start = time.perf_counter()
+        input = module.load(input_path)
+        parse_times.append(time.perf_counter() - start)
+        for part in parts:
+            func = getattr(module, f'part{part}')
+            if profiler is not None:
+                profiler.enable()
+            start = time.perf_counter()
+            answers[part] = func(input)
+            part_times[part].append(time.perf_counter() - start)
+            if profiler is not None:
+                profiler.disable()
+
+    for part in parts:
+        print(f'{day.name} part{part}: {answers[part]}')
+    summary = lambda times: f'{statistics.median(times) * 1000:.3f} ms'
+    print(f'parse {summary(parse_times)}, ' + ', '.join(f'part{p} {summary(t)}' for p, t in part_times.items())
+          + (f' (median of {args.repeat})' if args.repeat > 1 else ''), file=sys.stderr)
+
+    if profiler is not None:
+        import pstats
+        stats = pstats.Stats(profiler, stream=sys.stderr).sort_stats(args.sort)
+        if args.profile_output:
+            stats.dump_stats(args.profile_output)
+        stats.print_stats(args.profile_lines)
+    return 0
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in TOOLS:
+        tool = importlib.import_module(f'aoc.{argv[0]}')
+        return tool.main(argv[1:])
+
+    parser = argparse.ArgumentParser(prog='python -m aoc', description=__doc__.split('\n\n')[0],
+                                     epilog=f'tools: {", ".join(TOOLS)}, see python -m aoc <tool> --help')
+    commands = parser.add_subparsers(dest='command', required=True)
+    run_parser = commands.add_parser('run', help='solve one day')
+    run_parser.add_argument('year', type=int)
+    run_parser.add_argument('day', type=int)
+    run_parser.add_argument('-i', '--input', help='input file to use instead of input.txt')
+    run_parser.add_argument('-p', '--part', type=int, choices=(1, 2), help='only run this part')
+    run_parser.add_argument('-r', '--repeat', type=int, default=1, help='timed rounds, the median is reported')
+    run_parser.add_argument('--profile', action='store_true', help='profile the parts with cProfile')
+    run_parser.add_argument('--sort', default='cumulative', help='profile sort key, default %(default)s')
+    run_parser.add_argument('--profile-lines', type=int, default=25, help='profile rows shown')
+    run_parser.add_argument('--profile-output', help='also write the raw profile into this file')
+    for tool in TOOLS:
+        commands.add_parser(tool, help=f'python -m aoc.{tool}', add_help=False)
+    args = parser.parse_args(argv)
+
+    if args.repeat < 1:
+        run_parser.error('--repeat must be at least 1')
+    return run(args, run_parser)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
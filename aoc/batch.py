@@ -0,0 +1,103 @@
+'''
+Solves one day on many inputs in a pool of warm worker processes.
+
+    python -m aoc.batch 2025:12 inputs/ other.txt [-j JOBS] [--pattern '*.txt'] [-o results.json] [--cache]
+
+The inputs are files, or directories standing for the files in them that
+match a pattern. Each worker imports the solution module once when it
+starts and then solves input after input with it, so the interpreter
+start, the imports and the module level tables of the day are paid once
+per worker instead of once per input. Work a part does on every call, like
+the day 12 calibration, is not shared between inputs, so the timings of
+every input are those of a single run. The answers and timings of every
+input are printed as one table. An input that raises or takes its worker
+down is reported as failed without affecting the others: a dead worker
+breaks the whole pool, so the inputs not finished then are solved again,
+each in a fresh worker of its own.
+'''
+import argparse
+import fnmatch
+import json
+import os
+import sys
+import time
+from typing import Dict, List, Optional
+
+from aoc.bench import silenced
+from aoc.days import Day, load_module, select_cli_days
+from aoc.runner import failed_result, run_day, run_isolated
+
+def warm_up(day: Day):
+    ''' Worker initializer, imports the module before the first input arrives. '''
+    with silenced():
+        load_module(day)
+
+def input_files(paths: List[str], pattern: str = '*.txt') -> List[str]:
+    ''' The paths with the directories replaced by the files in them matching pattern, sorted by name. '''
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(os.path.join(path, f) for f in fnmatch.filter(os.listdir(path), pattern)
+                                if os.path.isfile(os.path.join(path, f))))
+        else:
+            files.append(path)
+    return files
+
+def run_batch(day: Day, input_paths: List[str], jobs: Optional[int] = None, cache: bool = False) -> List[Dict]:
+    ''' Solves day on every input in a pool of jobs workers, results are in the order of input_paths. '''
+    jobs = jobs or os.cpu_count() or 1
+    outcomes = run_isolated(run_day, [(day, path, cache) for path in input_paths], jobs,
+                            initializer=warm_up, initargs=(day,))
+    results = []
+    for path, result in zip(input_paths, outcomes):
+        if isinstance(result, BaseException): # The worker died, e.g. ran out of memory
+            result = failed_result(day, f'worker: {type(result).__name__}: {result}')
+        result['input'] = path
+        results.append(result)
+    return results
+
+def print_results(results: List[Dict]):
+    width = max([len(r['input']) for r in results] + [5])
+    print(f'{"input":<{width}} {"part1":>18} {"part2":>18} {"parse ms":>10} {"part1 ms":>10} {"part2 ms":>10}')
+    for r in results:
+        t = r['timings']
+        times = ' '.join(f'{t[p] * 1000:10.2f}' if p in t else f'{"-":>10}' for p in ('parse', 'part1', 'part2'))
+        answers = ' '.join(f'{str(a):>18}' for a in r['answers'])
+        line = f'{r["input"]:<{width}} {answers} {times}'
+        if r['error']:
+            line += f'  FAILED {r["error"]}'
+        print(line)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m aoc.batch', description=__doc__.split('\n\n')[0])
+    parser.add_argument('day', help="day to solve, e.g. '2025:12'")
+    parser.add_argument('inputs', nargs='+', help='input files, or directories of input files')
+    parser.add_argument('-j', '--jobs', type=int, help='worker processes, default one per core')
+    parser.add_argument('--pattern', default='*.txt', help='input files taken from directories, default %(default)s')
+    parser.add_argument('-o', '--output', help='write the results as JSON into this file')
+    parser.add_argument('--cache', action='store_true', help='load parsed inputs from the on-disk cache')
+    args = parser.parse_args(argv)
+
+    days = select_cli_days(parser, [args.day])
+    if len(days) != 1:
+        parser.error('select a single day')
+    input_paths = input_files(args.inputs, args.pattern)
+    if not input_paths:
+        parser.error('no input files found')
+
+    start = time.perf_counter()
+    results = run_batch(days[0], input_paths, args.jobs, args.cache)
+    elapsed = time.perf_counter() - start
+
+    print_results(results)
+    print(f'{len(results)} inputs in {elapsed:.2f}s, {sum(1 for r in results if r["error"])} failed')
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=1, default=repr)
+
+    return 1 if any(r['error'] for r in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
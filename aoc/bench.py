@@ -0,0 +1,208 @@
+'''
+Benchmark harness timing the parse, part 1 and part 2 phases of every day
+as separate phases.
+
+    python -m aoc.bench [days..] [--repeat N] [--warmup N] [-o out.json]
+                        [--baseline baseline.json] [--threshold 1.1] [--cache] [--no-history]
+
+Days are given as '2025' or '2025:8', every day is benchmarked by default.
+Each part is timed against a freshly parsed input so solutions that mutate
+their input (2025 day 4, 2020 day 8..) are measured the same on every round.
+Every run is recorded in the history database of aoc.history.
+'''
+import argparse
+import contextlib
+import gc
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from aoc.days import Day, load_module, select_cli_days
+
+PHASES = ('parse', 'part1', 'part2')
+
+def percentile(samples: List[float], p: float) -> float:
+    ''' Nearest-rank percentile of the samples, p in the range [0, 100]. '''
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * p // 100)) # ceil without floats
+    return ordered[int(rank) - 1]
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    return {
+        'min': min(samples),
+        'median': percentile(samples, 50),
+        'p95': percentile(samples, 95),
+    }
+
+@contextlib.contextmanager
+def silenced():
+    ''' Swallows whatever the solutions print while they are being timed. '''
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+def time_phase(
+        func: Callable,
+        repeat: int,
+        warmup: int,
+        setup: Optional[Callable] = None
+) -> Tuple[List[float], object]:
+    '''
+    Calls func warmup + repeat times and returns the timings of the last
+    repeat calls and the result of the last call. If setup is given its
+    return value is passed to func and it is not included in the timings.
+    '''
+    samples = []
+    result = None
+    for i in range(warmup + repeat):
+        arg = setup() if setup is not None else None
+        gc.collect()
+        start = time.perf_counter()
+        result = func(arg) if setup is not None else func()
+        elapsed = time.perf_counter() - start
+        if i >= warmup:
+            samples.append(elapsed)
+    return samples, result
+
+def phase_funcs(module, input_path: str, cache: bool = False) -> Dict[str, Tuple[Callable, Optional[Callable]]]:
+    if cache:
+        from aoc.cache import cached_load
+        load = lambda: cached_load(module, input_path)
+    else:
+        load = lambda: module.load(input_path)
+    return {
+        'parse': (load, None),
+        'part1': (module.part1, load),
+        'part2': (module.part2, load),
+    }
+
+def bench_day(
+        day: Day,
+        repeat: int = 5,
+        warmup: int = 1,
+        input_path: Optional[str] = None,
+        phases: Tuple[str, ...] = PHASES,
+        cache: bool = False
+) -> List[Dict]:
+    input_path = input_path or day.input_path
+    module = load_module(day)
+    if cache:
+        from aoc.cache import cacheable
+        cache = cacheable(module)
+    results = []
+
+    for phase, (func, setup) in phase_funcs(module, input_path, cache).items():
+        if phase not in phases:
+            continue
+        with silenced():
+            samples, answer = time_phase(func, repeat, warmup, setup)
+        results.append({
+            'year': day.year,
+            'day': day.day,
+            'phase': phase,
+            'cached': cache,
+            'input': os.path.relpath(input_path),
+            'input_bytes': os.path.getsize(input_path),
+            'samples': samples,
+            **summarize(samples),
+            'answer': None if phase == 'parse' else repr(answer),
+        })
+    return results
+
+def result_key(result: Dict) -> Tuple[int, int, str]:
+    return result['year'], result['day'], result['phase']
+
+def compare(
+        results: List[Dict],
+        baseline: List[Dict],
+        threshold: float,
+        min_delta: float = 0.001
+) -> List[Dict]:
+    '''
+    Compares the medians of results against the matching baseline results.
+    Returns the compared results with the ratio to the baseline median and
+    whether they regressed above threshold. Slowdowns of less than min_delta
+    seconds are timer noise and never count as regressions.
+    '''
+    base = {result_key(r): r for r in baseline}
+    compared = []
+    for result in results:
+        old = base.get(result_key(result))
+        if old is None:
+            continue
+        ratio = result['median'] / old['median'] if old['median'] > 0 else float('inf')
+        compared.append({**result, 'baseline_median': old['median'],
+                         'ratio': ratio,
+                         'regressed': ratio > threshold and result['median'] - old['median'] > min_delta})
+    return compared
+
+def format_ms(seconds: float) -> str:
+    return f'{seconds * 1000:10.3f}'
+
+def print_results(results: List[Dict], compared: Optional[List[Dict]] = None):
+    ratios = {result_key(r): r for r in compared or []}
+    header = f'{"day":<8} {"phase":<6} {"min ms":>10} {"median ms":>10} {"p95 ms":>10}'
+    if compared is not None:
+        header += f' {"vs base":>8}'
+    print(header)
+    for r in results:
+        line = f'{r["year"]}-{r["day"]:02} {r["phase"]:<6} ' \
+               f'{format_ms(r["min"])} {format_ms(r["median"])} {format_ms(r["p95"])}'
+        cmp = ratios.get(result_key(r))
+        if cmp is not None:
+            line += f' {cmp["ratio"]:7.2f}x' + (' REGRESSION' if cmp['regressed'] else '')
+        print(line)
+
+def run_metadata(repeat: int, warmup: int) -> Dict:
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'timestamp': time.time(),
+        'repeat': repeat,
+        'warmup': warmup,
+    }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m aoc.bench', description=__doc__.split('\n\n')[0])
+    parser.add_argument('days', nargs='*', help="days to benchmark, e.g. '2025' or '2025:8'")
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='timed rounds per phase')
+    parser.add_argument('-w', '--warmup', type=int, default=1, help='untimed rounds per phase')
+    parser.add_argument('-i', '--input', help='input file to use instead of input.txt (single day only)')
+    parser.add_argument('-o', '--output', help='write the results as JSON into this file')
+    parser.add_argument('-b', '--baseline', help='JSON results of an earlier run to compare against')
+    parser.add_argument('-t', '--threshold', type=float, default=1.10,
+                        help='median ratio to the baseline that counts as a regression')
+    parser.add_argument('--cache', action='store_true', help='load parsed inputs from the on-disk cache')
+    parser.add_argument('--no-history', action='store_true', help='do not record the run in the history database')
+    args = parser.parse_args(argv)
+
+    days = select_cli_days(parser, args.days)
+    if args.input and len(days) != 1:
+        parser.error('--input can only be used when benchmarking a single day')
+
+    results = []
+    for day in days:
+        print(f'Benchmarking {day.name}..', file=sys.stderr)
+        results.extend(bench_day(day, args.repeat, args.warmup, args.input, cache=args.cache))
+
+    compared = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            compared = compare(results, json.load(f)['results'], args.threshold)
+    print_results(results, compared)
+    if not args.no_history:
+        from aoc.history import record
+        record(results, 'bench')
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'meta': run_metadata(args.repeat, args.warmup), 'results': results}, f, indent=1)
+
+    return 1 if compared and any(r['regressed'] for r in compared) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,171 @@
+'''
+Opt-in on-disk cache of parsed inputs.
+
+The parsed input of a day is pickled into .aoc-cache/ under a key made of
+the hash of the input file contents and the hash of the parser, that is the
+source of the solution module and of every repository module it uses: the
+modules it imports and the modules the functions and classes in its globals
+come from are followed recursively, along with the names a module such as
+the 2020 helpers resolves lazily from its LAZY table. Editing any of them or
+the input makes the old entry unreachable, and it is removed the next time
+that input is cached.
+
+A hit still costs hashing the input, unpickling it and, once per process,
+hashing the parser, which is more than most days take to parse their input
+in the first place. Only the days in CACHED_DAYS, whose parsers are slow, go
+through the cache, the others are loaded as usual even when it is enabled.
+The input hash is kept per process too, keyed by the size and modification
+time of the file, so repeated loads of an unchanged input only stat it.
+'''
+import glob
+import hashlib
+import importlib
+import os
+import pickle
+import re
+import sys
+import weakref
+from types import ModuleType
+from typing import Dict, List, Optional, Tuple
+
+from aoc.days import ROOT
+
+CACHE_DIR = os.path.join(ROOT, '.aoc-cache')
+# Days that spend long enough parsing for a cache hit to pay off, as (year, day)
+CACHED_DAYS = frozenset({(2020, 7), (2025, 10), (2025, 11), (2025, 12)})
+# Module names of CACHED_DAYS, see Day.module_name
+CACHED_MODULES = frozenset(f'aoc_{year}_{day:02}' for year, day in CACHED_DAYS)
+# Absolute imports at the start of a line, 'import a.b, c' or 'from a.b import ...'
+IMPORT_RE = re.compile(rb'^[ \t]*(?:import[ \t]+([\w. \t,]+)|from[ \t]+(\w[\w.]*)[ \t]+import)', re.M)
+
+_file_hashes: Dict[Tuple[str, int, int], str] = {}
+# Reloading a module, as aoc.watch does, gives a new module object and a new hash
+_parser_hashes: 'weakref.WeakKeyDictionary[ModuleType, str]' = weakref.WeakKeyDictionary()
+
+def cacheable(module: ModuleType) -> bool:
+    return module.__name__ in CACHED_MODULES
+
+def file_hash(filename: str) -> str:
+    st = os.stat(filename)
+    key = (os.path.abspath(filename), st.st_size, st.st_mtime_ns)
+    if key not in _file_hashes:
+        h = hashlib.sha256()
+        with open(filename, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                h.update(block)
+        _file_hashes[key] = h.hexdigest()
+    return _file_hashes[key]
+
+def in_repository(path: Optional[str]) -> bool:
+    return path is not None and os.path.abspath(path).startswith(ROOT + os.sep)
+
+def imported_names(source: bytes) -> List[str]:
+    '''
+    Module names in the absolute import statements of source. A regex is
+    enough, a name that is not a module in sys.modules is skipped anyway,
+    and parsing the files with ast costs more than the cache saves.
+    '''
+    names = []
+    for modules, module in IMPORT_RE.findall(source):
+        if module:
+            names.append(module.decode())
+        else:
+            names.extend(name.split()[0].decode() for name in modules.split(b',') if name.strip())
+    return names
+
+def sources(module: ModuleType) -> Dict[str, bytes]:
+    ''' Source of module and of the repository modules it uses, by path. '''
+    found: Dict[str, bytes] = {}
+    visited = set()
+    pending = [module]
+    while pending:
+        m = pending.pop()
+        if m.__name__ in visited:
+            continue
+        visited.add(m.__name__)
+        path = getattr(m, '__file__', None)
+        if not in_repository(path) or path in found:
+            continue
+        with open(path, 'rb') as f:
+            found[path] = f.read()
+        # from helpers import ints leaves no trace of helpers in the globals
+        pending.extend(sys.modules[name] for name in imported_names(found[path]) if name in sys.modules)
+        for value in list(vars(m).values()):
+            if isinstance(value, ModuleType):
+                pending.append(value)
+                continue
+            origin = getattr(value, '__module__', None)
+            if isinstance(origin, str) and origin in sys.modules:
+                pending.append(sys.modules[origin])
+        # Names resolved on first use, see 2020/helpers.py
+        lazy = vars(m).get('LAZY')
+        if isinstance(lazy, dict):
+            pending.extend(importlib.import_module(name) for name in set(lazy.values()))
+    return found
+
+def parser_hash(module) -> str:
+    '''
+    Changes whenever the code that parses the input of the module may have
+    changed. Computed once per module object, the code it runs cannot change
+    without reloading it.
+    '''
+    if module not in _parser_hashes:
+        h = hashlib.sha256(f'{sys.version_info[:2]}-{pickle.HIGHEST_PROTOCOL}'.encode())
+        found = sources(module)
+        for path in sorted(found):
+            h.update(os.path.relpath(path, ROOT).encode())
+            h.update(found[path])
+        _parser_hashes[module] = h.hexdigest()
+    return _parser_hashes[module]
+
+def cache_path(module, filename: str, cache_dir: str = CACHE_DIR) -> str:
+    return os.path.join(cache_dir, f'{module.__name__}-{file_hash(filename)[:20]}-{parser_hash(module)[:20]}.pickle')
+
+def cached_load(module, filename: str, cache_dir: Optional[str] = None):
+    '''
+    Returns module.load(filename), from the cache if this input has been
+    parsed by the current parser before. Days outside CACHED_DAYS are
+    always parsed.
+    '''
+    if not cacheable(module):
+        return module.load(filename)
+    path = cache_path(module, filename, cache_dir or CACHE_DIR)
+    try:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        remove(path) # Broken or written by an incompatible parser
+
+    data = module.load(filename)
+    try:
+        store(path, data)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        remove(f'{path}.{os.getpid()}.tmp') # Not picklable, stays uncached
+    return data
+
+def remove(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError: # Removed by a parallel run
+        pass
+
+def store(path: str, data):
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    # Entries of older parsers for the same input can never be hit again
+    for stale in glob.glob(path.rsplit('-', 1)[0] + '-*.pickle'):
+        if stale != path:
+            remove(stale)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'wb') as f:
+        pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path) # Atomic, parallel runs never see half written entries
+
+def clear(cache_dir: str = CACHE_DIR) -> int:
+    ''' Removes every cached input and returns how many there were. '''
+    paths = glob.glob(os.path.join(cache_dir, '*.pickle'))
+    for path in paths:
+        remove(path)
+    return len(paths)
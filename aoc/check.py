@@ -0,0 +1,144 @@
+'''
+Regression check of the answers and the run time of every part.
+
+    python -m aoc.check [days..] [-j JOBS] [--no-timing] [--repeat N]
+    python -m aoc.check [days..] --update-ceilings [--repeat N]
+
+The expected answers of 2025 are the ones hardcoded in the "Correct" checks
+of each main.py, the 2020 solutions have none so theirs are declared in
+aoc/expected.json. An answer declared there overrides the embedded one, and
+null marks a part that is not solved yet and is not checked. The same file
+holds the wall-clock ceiling of every part in seconds, with the median it
+was derived from. --update-ceilings runs every day on its own repeat times
+and sets each ceiling to a multiple of the median plus a fixed margin.
+
+Any wrong answer or error makes the run exit with 1. The days of a check
+run in parallel and compete with each other and everything else on the
+machine, so a part over its ceiling is not taken at its word: its day is
+run again on its own repeat times, and only a median still over the
+ceiling fails the check.
+'''
+import argparse
+import json
+import math
+import os
+import re
+import statistics
+import sys
+from typing import Dict, List, Optional
+
+from aoc.days import ROOT, Day, select_cli_days
+from aoc.runner import run_days
+
+EXPECTED_PATH = os.path.join(ROOT, 'aoc', 'expected.json')
+PARTS = ('part1', 'part2')
+# The real answer is the one printed when the check fails, some days also accept the test answer
+EMBEDDED_RE = re.compile(r'prob([12])_res\s*=.*"Wrong, correct = (-?\d+)"')
+# Ceilings recorded with --update-ceilings, as a multiple of the median time plus a margin
+CEILING_FACTOR = 2.0
+CEILING_MARGIN = 0.05
+MIN_CEILING = 0.1
+# Runs of a day on its own behind a recorded median or a confirmed slow part
+DEFAULT_REPEAT = 5
+
+def embedded_answers(day: Day) -> Dict[str, str]:
+    ''' The answers hardcoded in the solution of day as reprs, by part. '''
+    with open(day.path) as f:
+        return {f'part{m.group(1)}': m.group(2) for m in EMBEDDED_RE.finditer(f.read())}
+
+def load_expected(path: str = EXPECTED_PATH) -> Dict[str, Dict[str, Dict]]:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+def save_expected(expected: Dict[str, Dict[str, Dict]], path: str = EXPECTED_PATH):
+    with open(path, 'w') as f:
+        json.dump(dict(sorted(expected.items())), f, indent=1)
+        f.write('\n')
+
+def expected_answers(day: Day, expected: Dict[str, Dict[str, Dict]]) -> Dict[str, Optional[str]]:
+    answers: Dict[str, Optional[str]] = dict(embedded_answers(day))
+    for part, entry in expected.get(day.name, {}).items():
+        if 'answer' in entry:
+            answers[part] = entry['answer']
+    return answers
+
+def check_result(day: Day, result: Dict, expected: Dict[str, Dict[str, Dict]]) -> List[str]:
+    ''' Returns the problems with the answers of the runner result of day, empty if there are none. '''
+    if result['error']:
+        return [f'error in {result["error"]}']
+
+    problems = []
+    answers = expected_answers(day, expected)
+    for i, part in enumerate(PARTS):
+        if part not in answers:
+            problems.append(f'{part}: no expected answer')
+        elif answers[part] is not None and repr(result['answers'][i]) != answers[part]:
+            problems.append(f'{part}: got {result["answers"][i]!r}, expected {answers[part]}')
+    return problems
+
+def slow_parts(day: Day, timings: Dict[str, float], expected: Dict[str, Dict[str, Dict]]) -> List[str]:
+    ''' The parts of day whose timings are over their ceilings, as problems. '''
+    problems = []
+    for part in PARTS:
+        ceiling = expected.get(day.name, {}).get(part, {}).get('ceiling')
+        if ceiling is not None and part in timings and timings[part] > ceiling:
+            problems.append(f'{part}: took {timings[part]:.3f}s, ceiling {ceiling}s')
+    return problems
+
+def isolated_medians(day: Day, repeat: int) -> Dict[str, float]:
+    ''' Median time of every part of day over repeat runs of the day alone, empty if a run fails. '''
+    runs = [run_days([day], jobs=1)[0] for _ in range(repeat)]
+    if any(r['error'] for r in runs):
+        return {}
+    return {part: statistics.median(r['timings'][part] for r in runs) for part in PARTS}
+
+def ceiling_for(median: float) -> float:
+    ''' Median time with headroom, rounded up to 10 ms. '''
+    return max(MIN_CEILING, math.ceil((median * CEILING_FACTOR + CEILING_MARGIN) * 100) / 100)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m aoc.check', description=__doc__.split('\n\n')[0])
+    parser.add_argument('days', nargs='*', help="days to check, e.g. '2025' or '2025:8', default every day")
+    parser.add_argument('-j', '--jobs', type=int, help='worker processes, default one per core')
+    parser.add_argument('--no-timing', action='store_true', help='only check the answers')
+    parser.add_argument('--update-ceilings', action='store_true',
+                        help=f'set the ceilings to {CEILING_FACTOR:g}x the median times + {CEILING_MARGIN:g}s')
+    parser.add_argument('-r', '--repeat', type=int, default=DEFAULT_REPEAT,
+                        help='runs of a day on its own to take the median of, default %(default)s')
+    parser.add_argument('--expected', default=EXPECTED_PATH, help='expectations file, default %(default)s')
+    args = parser.parse_args(argv)
+
+    days = select_cli_days(parser, args.days)
+    expected = load_expected(args.expected)
+    results = run_days(days, args.jobs)
+
+    if args.update_ceilings:
+        for day in days:
+            print(f'Timing {day.name}..', file=sys.stderr)
+            for part, median in isolated_medians(day, args.repeat).items():
+                entry = expected.setdefault(day.name, {}).setdefault(part, {})
+                entry['median'] = round(median, 4)
+                entry['ceiling'] = ceiling_for(median)
+        save_expected(expected, args.expected)
+
+    failed = 0
+    for day, result in zip(days, results):
+        problems = check_result(day, result, expected)
+        timings = result['timings']
+        if not args.no_timing and not result['error'] and slow_parts(day, timings, expected):
+            timings = {**timings, **isolated_medians(day, args.repeat)}
+            problems += slow_parts(day, timings, expected)
+        times = ' '.join(f'{timings[p]:8.3f}s' if p in timings else f'{"-":>9}' for p in PARTS)
+        print(f'{day.name} {times}  {"FAIL" if problems else "ok"}')
+        for problem in problems:
+            print(f'    {problem}')
+        failed += bool(problems)
+
+    print(f'{len(days) - failed} of {len(days)} days passed')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
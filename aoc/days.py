@@ -0,0 +1,119 @@
+'''
+Discovery and loading of the solution modules of every year.
+
+Solutions live in <year>/day<N>/ (2020) or <year>/day-<NN>-python/ (2025) and
+are plain scripts, so they are imported straight from their file paths under
+a unique module name instead of as packages.
+'''
+import argparse
+import importlib.util
+import os
+import re
+import sys
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DAY_DIR_RE = re.compile(r'^day-?(\d+)(-python)?$')
+
+class Day(NamedTuple):
+    year: int
+    day: int
+    path: str # Path of the solution module
+
+    @property
+    def name(self) -> str:
+        return f'{self.year}-{self.day:02}'
+
+    @property
+    def dir(self) -> str:
+        return os.path.dirname(self.path)
+
+    @property
+    def input_path(self) -> str:
+        return os.path.join(self.dir, 'input.txt')
+
+    @property
+    def module_name(self) -> str:
+        return f'aoc_{self.year}_{self.day:02}'
+
+
+def find_module_file(day_dir: str, day: int) -> Optional[str]:
+    for fname in ('main.py', f'day{day}.py'):
+        path = os.path.join(day_dir, fname)
+        if os.path.isfile(path):
+            return path
+    return None
+
+def all_days(root: str = ROOT) -> List[Day]:
+    ''' Returns every solution module of the repository sorted by year and day. '''
+    days = []
+    for year in os.listdir(root):
+        if not (year.isdigit() and os.path.isdir(os.path.join(root, year))):
+            continue
+        for entry in os.listdir(os.path.join(root, year)):
+            match = DAY_DIR_RE.match(entry)
+            if match is None:
+                continue
+            path = find_module_file(os.path.join(root, year, entry), int(match.group(1)))
+            if path is not None:
+                days.append(Day(int(year), int(match.group(1)), path))
+    return sorted(days)
+
+def parse_selection(specs: Iterable[str]) -> List[Tuple[int, Optional[int]]]:
+    '''
+    Parses day selections of the form '2025' (every day of the year),
+    '2025:8' or '2025/8' into (year, day) tuples, day being None for a full year.
+    '''
+    selection = []
+    for spec in specs:
+        year, _, day = spec.replace('/', ':').partition(':')
+        if not year.isdigit() or (day and not day.isdigit()):
+            raise ValueError(f'Invalid day selection: {spec!r}')
+        selection.append((int(year), int(day) if day else None))
+    return selection
+
+def select_days(specs: Iterable[str] = (), root: str = ROOT) -> List[Day]:
+    ''' Returns the days matching the selection specs, or every day if there are none. '''
+    selection = parse_selection(specs)
+    days = all_days(root)
+    if not selection:
+        return days
+    selected = [d for d in days if any(
+        d.year == year and (day is None or d.day == day) for year, day in selection
+    )]
+    for year, day in selection:
+        if not any(d.year == year and (day is None or d.day == day) for d in selected):
+            raise ValueError(f'No solution found for {year}' + (f' day {day}' if day else ''))
+    return selected
+
+def select_cli_days(parser: argparse.ArgumentParser, specs: Iterable[str] = ()) -> List[Day]:
+    ''' select_days() for a command line, an invalid or unknown selection is a usage error. '''
+    try:
+        return select_days(specs)
+    except ValueError as e:
+        parser.error(str(e))
+
+def load_module(day: Day):
+    '''
+    Imports the solution module of day. The modules of a year share the
+    helpers in the year directory, so that directory is put on sys.path.
+    '''
+    if day.module_name in sys.modules:
+        return sys.modules[day.module_name]
+
+    year_dir = os.path.dirname(day.dir)
+    if year_dir not in sys.path:
+        sys.path.insert(0, year_dir)
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+
+    spec = importlib.util.spec_from_file_location(day.module_name, day.path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[day.module_name] = module # dataclasses look the module up while executing it
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[day.module_name]
+        raise
+    return module
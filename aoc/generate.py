@@ -0,0 +1,472 @@
+'''
+Seeded generators of synthetic, scaled up puzzle inputs.
+
+    python -m aoc.generate [days..] [--scales 10 100 1000] [--seed 0]
+
+Writes <day dir>/input-x<scale>.txt for every selected day. The scale is
+relative to the size of the real input.txt, and every generator keeps the
+constraints its puzzle relies on (unique answers, reachable targets, valid
+indexes..) so the solutions can be run on the output as is. A few puzzles
+can not grow past a limit without breaking those constraints, their
+generators cap the size and say so.
+'''
+import argparse
+import math
+import os
+import random
+import string
+import sys
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from aoc.days import Day, select_cli_days
+
+GENERATORS: Dict[Tuple[int, int], Callable[[random.Random, int], Iterator[str]]] = dict()
+
+def generator(year: int, day: int):
+    ''' Registers the decorated function as the input generator of the day. '''
+    def register(func):
+        GENERATORS[(year, day)] = func
+        return func
+    return register
+
+def side(base: int, scale: int) -> int:
+    ''' Side length of a grid with scale times the area of a base x base grid. '''
+    return max(1, round(base * math.sqrt(scale)))
+
+def word(rng: random.Random, length: int) -> str:
+    return ''.join(rng.choice(string.ascii_lowercase) for _ in range(length))
+
+def unique_words(rng: random.Random, count: int, length: int, reserved=()) -> List[str]:
+    words = dict.fromkeys(reserved) # Ordered, sets would make the output depend on hash seeds
+    while len(words) < count + len(reserved):
+        words[word(rng, length)] = None
+    return [w for w in words if w not in reserved]
+
+def name_length(count: int, min_length: int = 3) -> int:
+    ''' Length of lowercase names that leaves plenty of room for count unique names. '''
+    return max(min_length, math.ceil(math.log(max(count, 1) * 4, 26)))
+
+# 2020
+
+@generator(2020, 1)
+def gen_2020_01(rng: random.Random, scale: int) -> Iterator[str]:
+    '''
+    Exactly one pair and one triple of entries sum to 2020. The filler entries
+    are all bigger than 2020 so they can never be part of a solution.
+    '''
+    while True:
+        p = rng.randint(1, 300)
+        a, b = rng.sample(range(301, 700), 2)
+        planted = [p, 2020 - p, a, b, 2020 - a - b]
+        if len(set(planted)) != 5:
+            continue
+        pairs = [(x, y) for i, x in enumerate(planted) for y in planted[i+1:] if x + y == 2020]
+        triples = [(x, y, z) for i, x in enumerate(planted) for j, y in enumerate(planted[i+1:], i+1)
+                   for z in planted[j+1:] if x + y + z == 2020]
+        if len(pairs) == 1 and len(triples) == 1:
+            break
+    entries = planted + [rng.randint(2021, 10 ** 6) for _ in range(200 * scale - len(planted))]
+    rng.shuffle(entries)
+    return map(str, entries)
+
+@generator(2020, 2)
+def gen_2020_02(rng: random.Random, scale: int) -> Iterator[str]:
+    for _ in range(1000 * scale):
+        passwd = ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz'[:rng.randint(3, 26)])
+                         for _ in range(rng.randint(3, 20)))
+        lo = rng.randint(1, len(passwd) - 1)
+        hi = rng.randint(lo + 1, len(passwd)) # Part 2 indexes the password with both
+        yield f'{lo}-{hi} {rng.choice(passwd)}: {passwd}'
+
+@generator(2020, 3)
+def gen_2020_03(rng: random.Random, scale: int) -> Iterator[str]:
+    for _ in range(323 * scale):
+        yield ''.join('#' if rng.random() < 0.2 else '.' for _ in range(31))
+
+@generator(2020, 4)
+def gen_2020_04(rng: random.Random, scale: int) -> Iterator[str]:
+    values = {
+        'byr': lambda: str(rng.randint(1900, 2010)),
+        'iyr': lambda: str(rng.randint(2005, 2025)),
+        'eyr': lambda: str(rng.randint(2015, 2035)),
+        'hgt': lambda: f'{rng.randint(140, 200)}cm' if rng.random() < 0.6 else f'{rng.randint(50, 80)}in',
+        'hcl': lambda: '#' + ''.join(rng.choice('0123456789abcdef') for _ in range(6)),
+        'ecl': lambda: rng.choice(('amb', 'blu', 'brn', 'gry', 'grn', 'hzl', 'oth', 'xry')),
+        'pid': lambda: str(rng.randint(0, 10 ** rng.choice((8, 9, 10)))).zfill(9),
+        'cid': lambda: str(rng.randint(100, 350)),
+    }
+    for i in range(290 * scale):
+        fields = [f'{k}:{v()}' for k, v in values.items() if rng.random() < 0.9]
+        rng.shuffle(fields)
+        lines = []
+        while fields:
+            n = rng.randint(1, 4)
+            lines.append(' '.join(fields[:n]))
+            fields = fields[n:]
+        if i > 0:
+            yield ''
+        yield from lines or ['cid:100']
+
+@generator(2020, 5)
+def gen_2020_05(rng: random.Random, scale: int) -> Iterator[str]:
+    '''
+    A boarding pass has 1024 possible seat ids and every id is used at most
+    once, so the size is capped to a full plane with a single free seat.
+    '''
+    count = min(881 * scale, 1020)
+    first = rng.randint(1, 1022 - count)
+    mine = rng.randint(first + 1, first + count - 1)
+    seats = [s for s in range(first, first + count + 1) if s != mine]
+    rng.shuffle(seats)
+    for seat in seats:
+        row, col = divmod(seat, 8)
+        yield format(row, '07b').replace('0', 'F').replace('1', 'B') \
+            + format(col, '03b').replace('0', 'L').replace('1', 'R')
+
+@generator(2020, 6)
+def gen_2020_06(rng: random.Random, scale: int) -> Iterator[str]:
+    for i in range(490 * scale):
+        if i > 0:
+            yield ''
+        common = rng.sample(string.ascii_lowercase, rng.randint(0, 5))
+        for _ in range(rng.randint(1, 5)):
+            answers = dict.fromkeys(common + rng.sample(string.ascii_lowercase, rng.randint(0, 8)))
+            if not answers: # A blank line would end the group
+                answers = dict.fromkeys(rng.choice(string.ascii_lowercase))
+            yield ''.join(answers)
+
+@generator(2020, 7)
+def gen_2020_07(rng: random.Random, scale: int) -> Iterator[str]:
+    '''
+    Layered bag rule DAG, bags only contain bags of the next two layers so
+    there are no cycles and the nesting stays as shallow as in the real
+    input at any size. 'shiny gold' is in the middle layer.
+    '''
+    count = 594 * scale
+    pool = 2 * math.isqrt(count) + 10
+    words = [w for w in unique_words(rng, 2 * pool, name_length(2 * pool), ('shiny', 'gold'))
+             if 'bag' not in w and w != 'contain'] # Would break the rule parser
+    names = rng.sample([f'{a} {c}' for a in words[:pool] for c in words[pool:]], count - 1)
+    layers = [names[i::9] for i in range(9)]
+    layers[4][0] = 'shiny gold'
+
+    rules = []
+    for depth, layer in enumerate(layers):
+        below = [bag for lower in layers[depth + 1:depth + 3] for bag in lower]
+        for outer in layer:
+            if not below or rng.random() < 0.15:
+                rules.append(f'{outer} bags contain no other bags.')
+                continue
+            inner = rng.sample(below, min(len(below), rng.randint(1, 4)))
+            if depth == 3 and 'shiny gold' not in inner and rng.random() < 0.3:
+                inner.append('shiny gold')
+            contents = []
+            for bag in inner:
+                n = rng.randint(1, 5)
+                contents.append(f'{n} {bag} bag{"s" if n > 1 else ""}')
+            rules.append(f'{outer} bags contain {", ".join(contents)}.')
+    rng.shuffle(rules)
+    return iter(rules)
+
+@generator(2020, 8)
+def gen_2020_08(rng: random.Random, scale: int) -> Iterator[str]:
+    '''
+    Program whose forward jumps all land before its last instruction, which
+    jumps back to the start. Every path runs into that jump, so flipping it
+    is the only fix that lets the program terminate.
+    '''
+    count = 646 * scale
+    for i in range(count - 1):
+        op = rng.choices(('acc', 'jmp', 'nop'), (5, 3, 2))[0]
+        if op == 'acc':
+            yield f'acc {rng.randint(-50, 50):+d}'
+        elif op == 'jmp' and i < count - 2:
+            yield f'jmp {rng.randint(1, min(10, count - 2 - i)):+d}'
+        else:
+            yield 'nop +0'
+    yield f'jmp {-(count - 1):+d}'
+
+@generator(2020, 9)
+def gen_2020_09(rng: random.Random, scale: int) -> Iterator[str]:
+    '''
+    Every number is the sum of two different numbers among the 25 before it
+    until the invalid one, a sum of a short contiguous run near the start.
+    The numbers double about every 25 lines so the length is capped at
+    100000 lines, after which the file would grow to gigabytes.
+    '''
+    count = min(1000 * scale, 100000)
+    seq = rng.sample(range(1, 60), 25)
+    invalid_at = count - 1 - rng.randrange(max(1, count // 10))
+    while len(seq) < count:
+        if len(seq) == invalid_at:
+            start = rng.randint(0, 20)
+            seq.append(sum(seq[start:start + rng.randint(2, 5)]))
+            continue
+        window = sorted(set(seq[-25:]))
+        a, b = rng.sample(window[:6], 2)
+        seq.append(a + b)
+    return map(str, seq)
+
+@generator(2020, 10)
+def gen_2020_10(rng: random.Random, scale: int) -> Iterator[str]:
+    ''' Adapters are 1 or 3 jolts apart, at most four 1 jolt steps in a row. '''
+    joltages = []
+    joltage, ones = 0, 0
+    for _ in range(107 * scale):
+        step = 1 if ones < 4 and rng.random() < 0.7 else 3
+        ones = ones + 1 if step == 1 else 0
+        joltage += step
+        joltages.append(joltage)
+    rng.shuffle(joltages)
+    return map(str, joltages)
+
+def seats_settle(tile: List[str], max_rounds: int = 100) -> bool:
+    ''' Whether the seating of the tile reaches an equilibrium with the part 1 rules. '''
+    seats = [(y, x) for y, row in enumerate(tile) for x, c in enumerate(row) if c == 'L']
+    seat_set = set(seats)
+    adjacent = {(y, x): [(y + dy, x + dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1)
+                         if (dy or dx) and (y + dy, x + dx) in seat_set] for y, x in seats}
+    taken = dict.fromkeys(seats, False)
+    for _ in range(max_rounds):
+        flips = [s for s in seats if (taken[s] and sum(taken[a] for a in adjacent[s]) > 3)
+                 or (not taken[s] and not any(taken[a] for a in adjacent[s]))]
+        if not flips:
+            return True
+        for s in flips:
+            taken[s] = not taken[s]
+    return False
+
+@generator(2020, 11)
+def gen_2020_11(rng: random.Random, scale: int) -> Iterator[str]:
+    '''
+    Large random seat layouts tend to contain seatings that flip back and
+    forth forever. The layout is built of small tiles that are checked to
+    settle, separated by floor so that they settle independently in part 1.
+    '''
+    size = 16
+    tiles = []
+    while len(tiles) < 8:
+        tile = [''.join('.' if rng.random() < 0.15 else 'L' for _ in range(size)) for _ in range(size)]
+        if seats_settle(tile):
+            tiles.append(tile)
+
+    per_row = max(1, side(90, scale) // (size + 1))
+    for i in range(max(1, side(93, scale) // (size + 1))):
+        row_tiles = [rng.choice(tiles) for _ in range(per_row)]
+        if i > 0:
+            yield '.' * (per_row * (size + 1) - 1)
+        for y in range(size):
+            yield '.'.join(tile[y] for tile in row_tiles)
+
+@generator(2020, 12)
+def gen_2020_12(rng: random.Random, scale: int) -> Iterator[str]:
+    for _ in range(761 * scale):
+        action = rng.choice('NSEWLRFF')
+        if action in 'LR':
+            yield f'{action}{rng.choice((90, 180, 270))}'
+        else:
+            yield f'{action}{rng.randint(1, 100)}'
+
+# 2025
+
+@generator(2025, 1)
+def gen_2025_01(rng: random.Random, scale: int) -> Iterator[str]:
+    for _ in range(4531 * scale):
+        yield f'{rng.choice("LR")}{rng.randint(1, 99) if rng.random() < 0.9 else rng.randint(100, 999)}'
+
+@generator(2025, 2)
+def gen_2025_02(rng: random.Random, scale: int) -> Iterator[str]:
+    '''
+    Disjoint id ranges of 2 to 10 digit ids, about 70000 ids wide on
+    average like the real input.
+    '''
+    ranges = []
+    starts = sorted(set(int(10 ** rng.uniform(1, 10)) for _ in range(31 * scale)))
+    for start, next_start in zip(starts, starts[1:] + [10 ** 10]):
+        ranges.append(f'{start}-{min(start + rng.randint(0, 140000), next_start - 1)}')
+    rng.shuffle(ranges)
+    yield ','.join(ranges)
+
+@generator(2025, 3)
+def gen_2025_03(rng: random.Random, scale: int) -> Iterator[str]:
+    for _ in range(200 * scale):
+        yield ''.join(rng.choice('123456789') for _ in range(100))
+
+@generator(2025, 4)
+def gen_2025_04(rng: random.Random, scale: int) -> Iterator[str]:
+    width = side(137, scale)
+    for _ in range(side(137, scale)):
+        yield ''.join('@' if rng.random() < 0.6 else '.' for _ in range(width))
+
+@generator(2025, 5)
+def gen_2025_05(rng: random.Random, scale: int) -> Iterator[str]:
+    top = 10 ** 15
+    for _ in range(192 * scale):
+        low = rng.randint(1, top)
+        yield f'{low}-{low + rng.randint(0, top // 500)}'
+    yield ''
+    for _ in range(1000 * scale):
+        yield str(rng.randint(1, top))
+
+@generator(2025, 6)
+def gen_2025_06(rng: random.Random, scale: int) -> Iterator[str]:
+    ''' Space separated problem columns, numbers aligned left or right inside a column. '''
+    rows: List[List[str]] = [[] for _ in range(4)]
+    operators = []
+    for _ in range(1000 * scale):
+        nums = [str(rng.randint(1, 10 ** rng.randint(1, 4) - 1)) for _ in rows]
+        width = max(map(len, nums))
+        align = str.ljust if rng.random() < 0.5 else str.rjust
+        for row, n in zip(rows, nums):
+            row.append(align(n, width))
+        operators.append(rng.choice('+*').ljust(width))
+    for row in rows:
+        yield ' '.join(row)
+    yield ' '.join(operators)
+
+@generator(2025, 7)
+def gen_2025_07(rng: random.Random, scale: int) -> Iterator[str]:
+    ''' The manifold grows downwards, beams can only be split on every other row. '''
+    width = 141
+    start = width // 2
+    yield '.' * start + 'S' + '.' * (width - start - 1)
+    for y in range(1, 142 * scale):
+        if y % 2 == 1:
+            yield '.' * width
+            continue
+        spread = min(y // 2, start - 1)
+        yield ''.join(
+            '^' if abs(x - start) <= spread and (x - start + y // 2) % 2 == 0 and rng.random() < 0.85 else '.'
+            for x in range(width)
+        )
+
+@generator(2025, 8)
+def gen_2025_08(rng: random.Random, scale: int) -> Iterator[str]:
+    for _ in range(1000 * scale):
+        yield ','.join(str(rng.randint(0, 99999)) for _ in range(3))
+
+@generator(2025, 9)
+def gen_2025_09(rng: random.Random, scale: int) -> Iterator[str]:
+    '''
+    Rectilinear polygon tracing a noisy circle: every red tile is connected
+    to the next one by a horizontal or a vertical line, alternately. The
+    radius grows with the tile count so the coordinates stay distinct.
+    '''
+    count = 248 * scale
+    radius = 48000 * scale
+    center = radius + 1000
+    points = []
+    for i in range(count):
+        angle = 2 * math.pi * i / count
+        r = radius * rng.uniform(0.97, 1.0)
+        points.append((center + round(r * math.cos(angle)), center + round(r * math.sin(angle))))
+    for (x0, y0), (x1, _) in zip(points, points[1:] + points[:1]):
+        yield f'{x0},{y0}'
+        yield f'{x1},{y0}'
+
+@generator(2025, 10)
+def gen_2025_10(rng: random.Random, scale: int) -> Iterator[str]:
+    ''' The lights and the joltages are produced by pressing the buttons, so both are reachable. '''
+    for _ in range(190 * scale):
+        lights = rng.randint(4, 10)
+        buttons = [sorted(rng.sample(range(lights), rng.randint(1, lights))) for _ in range(rng.randint(3, 13))]
+        state = [False] * lights
+        for button in rng.sample(buttons, rng.randint(1, len(buttons))):
+            for i in button:
+                state[i] = not state[i]
+        joltages = [0] * lights
+        for button in buttons:
+            presses = rng.randint(0, 20)
+            for i in button:
+                joltages[i] += presses
+        yield '[{}] {} {{{}}}'.format(
+            ''.join('#' if s else '.' for s in state),
+            ' '.join('(' + ','.join(map(str, b)) + ')' for b in buttons),
+            ','.join(map(str, joltages))
+        )
+
+@generator(2025, 11)
+def gen_2025_11(rng: random.Random, scale: int) -> Iterator[str]:
+    '''
+    Layered device DAG: svr feeds the first layer, every layer only feeds
+    the next one and the last layer feeds out. fft and dac are in the
+    middle on a guaranteed path, you is close to out so that the number of
+    paths from it (enumerated one by one in part 1) stays small.
+    '''
+    layers = max(6, round(25 * math.sqrt(scale)))
+    width = max(2, round(22 * math.sqrt(scale)))
+    reserved = ('svr', 'you', 'fft', 'dac', 'out')
+    names = unique_words(rng, layers * width, name_length(layers * width), reserved)
+    grid = [names[i * width:(i + 1) * width] for i in range(layers)]
+    grid[layers // 3][0] = 'fft'
+    grid[2 * layers // 3][0] = 'dac'
+    grid[layers - 4][width // 2] = 'you'
+
+    lines = [f'svr: {" ".join(sorted(set(rng.sample(grid[0], min(3, width))) | {grid[0][0]}))}']
+    for y in range(layers):
+        for x, node in enumerate(grid[y]):
+            if y == layers - 1:
+                edges = ['out']
+            else:
+                edges = set(rng.sample(grid[y + 1], min(width, rng.randint(1, 3))))
+                if x == 0:
+                    edges.add(grid[y + 1][0]) # Keep the svr -> fft -> dac -> out chain
+            lines.append(f'{node}: {" ".join(sorted(edges))}')
+    rng.shuffle(lines)
+    return iter(lines)
+
+@generator(2025, 12)
+def gen_2025_12(rng: random.Random, scale: int) -> Iterator[str]:
+    for i in range(6):
+        while True:
+            cells = ['#' if rng.random() < 0.7 else '.' for _ in range(9)]
+            if cells.count('#') >= 5:
+                break
+        yield f'{i}:'
+        yield from (''.join(cells[r * 3:r * 3 + 3]) for r in range(3))
+        yield ''
+    for _ in range(1000 * scale):
+        # Like in the real input, half of the regions fit the presents even as
+        # whole 3x3 boxes and the presents of the other half cover more cells than the region has
+        width, height = rng.randint(35, 50), rng.randint(35, 50)
+        if rng.random() < 0.5:
+            # Only whole boxes count, a 35x35 region holds 11x11 of them and not 35*35/9
+            presents = round((width // 3) * (height // 3) * rng.uniform(0.75, 1.0))
+        else:
+            presents = round(width * height / 5 * rng.uniform(1.05, 1.2))
+        counts = [0] * 6
+        for i in rng.choices(range(6), k=presents):
+            counts[i] += 1
+        yield f'{width}x{height}: {" ".join(map(str, counts))}'
+
+def output_path(day: Day, scale: int) -> str:
+    return os.path.join(day.dir, f'input-x{scale}.txt')
+
+def generate(day: Day, scale: int, seed: int = 0) -> str:
+    ''' Writes the scaled input of day and returns the path of the file. '''
+    gen = GENERATORS.get((day.year, day.day))
+    if gen is None:
+        raise ValueError(f'No input generator for {day.name}')
+    rng = random.Random(f'{seed}-{day.year}-{day.day}-{scale}')
+    path = output_path(day, scale)
+    with open(path, 'w') as f:
+        f.write('\n'.join(gen(rng, scale)))
+    return path
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m aoc.generate', description=__doc__.split('\n\n')[0])
+    parser.add_argument('days', nargs='*', help="days to generate inputs for, e.g. '2025' or '2025:8'")
+    parser.add_argument('-s', '--scales', type=int, nargs='+', default=[10, 100, 1000],
+                        help='sizes relative to the real input')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    for day in select_cli_days(parser, args.days):
+        for scale in args.scales:
+            path = generate(day, scale, args.seed)
+            print(f'{os.path.relpath(path)}: {os.path.getsize(path)} bytes')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,168 @@
+'''
+Compact directed graph shared by the graph puzzles.
+
+Node names are interned once into consecutive integer ids, and the edges are
+stored in compressed sparse row form: the successors of node u are
+targets[offsets[u]:offsets[u+1]], with the matching optional integer weights
+in weights. Everything is kept in flat arrays, so a graph with millions of
+nodes costs a few bytes per edge instead of a Python list per node.
+The algorithms are iterative and work bottom-up in topological order, so
+they do not hit the recursion limit on deep graphs.
+'''
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+class Graph:
+    __slots__ = ('names', 'ids', 'offsets', 'targets', 'weights')
+
+    def __init__(
+            self,
+            names: List[str],
+            offsets: array,
+            targets: array,
+            weights: Optional[array] = None,
+            ids: Optional[Dict[str, int]] = None
+    ):
+        self.names = names
+        self.ids: Dict[str, int] = {name: i for i, name in enumerate(names)} if ids is None else ids
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.ids
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+    def successors(self, u: int) -> array:
+        return self.targets[self.offsets[u]:self.offsets[u+1]]
+
+    def edges(self, u: int) -> Iterator[Tuple[int, int]]:
+        ''' (successor, weight) pairs of node u, weights are 1 in an unweighted graph. '''
+        start, end = self.offsets[u], self.offsets[u+1]
+        if self.weights is None:
+            return ((v, 1) for v in self.targets[start:end])
+        return zip(self.targets[start:end], self.weights[start:end])
+
+    def reversed(self) -> 'Graph':
+        ''' The graph with every edge turned around. '''
+        sources = array('I')
+        for u in range(len(self)):
+            sources.extend(array('I', (u,)) * (self.offsets[u+1] - self.offsets[u]))
+        return csr(self.names, self.targets, sources, self.weights, self.ids)
+
+    def topological_order(self) -> List[int]:
+        ''' Node ids such that every edge points forwards. Raises ValueError on a cycle. '''
+        indegree = array('I', (0,)) * len(self)
+        for v in self.targets:
+            indegree[v] += 1
+        order = [u for u in range(len(self)) if indegree[u] == 0]
+        targets, offsets = self.targets, self.offsets
+        for u in order: # Grows while it is iterated
+            for i in range(offsets[u], offsets[u+1]):
+                v = targets[i]
+                indegree[v] -= 1
+                if indegree[v] == 0:
+                    order.append(v)
+        if len(order) != len(self):
+            raise ValueError('Graph has a cycle')
+        return order
+
+    def reachable(self, sources: Iterable[int]) -> bytearray:
+        ''' Flags of the nodes reachable from any of sources, including the sources. '''
+        seen = bytearray(len(self))
+        stack = list(sources)
+        for u in stack:
+            seen[u] = 1
+        targets, offsets = self.targets, self.offsets
+        while stack:
+            u = stack.pop()
+            for i in range(offsets[u], offsets[u+1]):
+                v = targets[i]
+                if not seen[v]:
+                    seen[v] = 1
+                    stack.append(v)
+        return seen
+
+    def path_counts(self, target: int, order: Optional[List[int]] = None) -> List[int]:
+        '''
+        Number of distinct paths from every node to target. The graph must be
+        acyclic, order is its topological order when already known.
+        '''
+        order = self.topological_order() if order is None else order
+        counts = [0] * len(self)
+        counts[target] = 1
+        targets, offsets = self.targets, self.offsets
+        for u in reversed(order):
+            if u != target:
+                counts[u] = sum(counts[targets[i]] for i in range(offsets[u], offsets[u+1]))
+        return counts
+
+    def weighted_sums(self, order: Optional[List[int]] = None) -> List[int]:
+        '''
+        For every node u the sum over all paths starting from u of the product
+        of the edge weights along the path, the empty path counting as 1. That
+        is sums[u] = 1 + sum(w * sums[v]) over the edges (u, v, w).
+        '''
+        order = self.topological_order() if order is None else order
+        sums = [1] * len(self)
+        for u in reversed(order):
+            sums[u] = 1 + sum(w * sums[v] for v, w in self.edges(u))
+        return sums
+
+class GraphBuilder:
+    ''' Collects named edges and builds a Graph of them. '''
+    def __init__(self, weighted: bool = False):
+        self.names: List[str] = []
+        self.ids: Dict[str, int] = {}
+        self.sources = array('I')
+        self.targets = array('I')
+        self.weights: Optional[array] = array('q') if weighted else None
+
+    def node(self, name: str) -> int:
+        ''' Interned id of the node, which is added if it is new. '''
+        i = self.ids.get(name)
+        if i is None:
+            i = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return i
+
+    def edge(self, source: str, target: str, weight: Optional[int] = None):
+        self.sources.append(self.node(source))
+        self.targets.append(self.node(target))
+        if self.weights is not None:
+            self.weights.append(1 if weight is None else weight)
+
+    def build(self) -> Graph:
+        return csr(self.names, self.sources, self.targets, self.weights, self.ids)
+
+def csr(
+        names: List[str],
+        sources: array,
+        targets: array,
+        weights: Optional[array] = None,
+        ids: Optional[Dict[str, int]] = None
+) -> Graph:
+    ''' Graph of the edges sources[i] -> targets[i], grouped by source with a counting sort. '''
+    n = len(names)
+    offsets = array('I', (0,)) * (n + 1)
+    for u in sources:
+        offsets[u + 1] += 1
+    for u in range(n):
+        offsets[u + 1] += offsets[u]
+
+    cursor = offsets[:-1]
+    sorted_targets = array('I', (0,)) * len(targets)
+    sorted_weights = array('q', (0,)) * len(targets) if weights is not None else None
+    for i, u in enumerate(sources):
+        pos = cursor[u]
+        cursor[u] = pos + 1
+        sorted_targets[pos] = targets[i]
+        if sorted_weights is not None:
+            sorted_weights[pos] = weights[i]
+    return Graph(names, offsets, sorted_targets, sorted_weights, ids)
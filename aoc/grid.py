@@ -0,0 +1,174 @@
+'''
+Compact grid shared by the grid puzzles.
+
+The cells are small integer codes stored row after row in one flat bytearray,
+or in an array of another typecode when the codes do not fit a byte. A cell
+is addressed by its flat index, and its neighbours by adding the offsets of
+offsets4 or offsets8 to it. A grid can be padded with rings of border cells,
+so those offsets never leave the grid from any interior cell and the
+neighbour loops need no bounds checks.
+'''
+from array import array
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from aoc.loader import records
+
+# (dy, dx) steps by compass direction, the same table as helpers.DIRECTIONS
+DIRECTIONS = {
+    'E': (0, 1),
+    'S': (1, 0),
+    'W': (0, -1),
+    'N': (-1, 0),
+    'NW': (-1, -1),
+    'NE': (-1, 1),
+    'SW': (1, -1),
+    'SE': (1, 1),
+}
+DIRECTIONS4 = ('E', 'S', 'W', 'N')
+DIRECTIONS8 = tuple(DIRECTIONS)
+
+Cells = Union[bytearray, array]
+
+class Grid:
+    __slots__ = ('height', 'width', 'pad', 'stride', 'typecode', 'cells', 'offsets4', 'offsets8')
+
+    def __init__(
+            self,
+            height: int,
+            width: int,
+            fill: int = 0,
+            pad: int = 0,
+            border: Optional[int] = None,
+            typecode: str = 'B',
+            cells: Optional[Cells] = None
+    ):
+        '''
+        Grid of height x width cells set to fill, surrounded by pad rings of
+        border cells which default to fill. cells is the flat storage
+        including the padding when it already exists.
+        '''
+        self.height = height
+        self.width = width
+        self.pad = pad
+        self.stride = width + 2 * pad
+        self.typecode = typecode
+        if cells is None:
+            border = fill if border is None else border
+            cells = run(border, (height + 2 * pad) * self.stride, typecode)
+            if fill != border:
+                filled = run(fill, width, typecode)
+                for start in self.row_starts():
+                    cells[start:start + width] = filled
+        self.cells = cells
+        # The stride never changes, so neither do the neighbour offsets
+        self.offsets4 = stride_offsets(self.stride, DIRECTIONS4)
+        self.offsets8 = stride_offsets(self.stride, DIRECTIONS8)
+
+    @classmethod
+    def from_lines(
+            cls,
+            lines: Iterable[Union[str, bytes]],
+            codes: Dict[str, int],
+            pad: int = 0,
+            border: int = 0,
+            typecode: str = 'B'
+    ) -> 'Grid':
+        '''
+        Parses the rows of characters in lines into cells using the character
+        to code mapping codes. Rows without any cells, such as the single
+        empty record of an empty file, give a grid of height and width 0.
+        '''
+        # Codes that fit a byte are translated by bytes.translate(), others looked up cell by cell
+        narrow = all(0 <= code < 256 for code in codes.values())
+        table = [codes.get(chr(c), 0) for c in range(256)]
+        translation = bytes(table) if narrow else None
+        known = ''.join(codes).encode('latin-1')
+        rows = []
+        for line in lines:
+            line = line.encode('latin-1') if isinstance(line, str) else line
+            unknown = line.translate(None, known)
+            if unknown:
+                raise ValueError(f'Grid row {len(rows)} contains unknown cells {unknown.decode("latin-1")!r}')
+            rows.append(line.translate(translation) if narrow else line)
+
+        width = len(rows[0]) if rows else 0
+        if any(len(row) != width for row in rows):
+            raise ValueError('Grid rows are not all the same length')
+        if width == 0:
+            rows = []
+        grid = cls(len(rows), width, border, pad, border, typecode)
+        for start, row in zip(grid.row_starts(), rows):
+            if not narrow:
+                row = array(typecode, [table[c] for c in row])
+            elif typecode != 'B':
+                # array() would take bytes as raw machine words, list() gives one code per cell
+                row = array(typecode, list(row))
+            grid.cells[start:start + width] = row
+        return grid
+
+    @classmethod
+    def load(cls, filename: str, codes: Dict[str, int], pad: int = 0, border: int = 0, typecode: str = 'B') -> 'Grid':
+        return cls.from_lines(records(filename), codes, pad, border, typecode)
+
+    def index(self, y: int, x: int) -> int:
+        ''' Flat index of the cell at (y, x), which may point into the padding. '''
+        return (y + self.pad) * self.stride + x + self.pad
+
+    def coords(self, i: int) -> Tuple[int, int]:
+        y, x = divmod(i, self.stride)
+        return y - self.pad, x - self.pad
+
+    def in_bounds(self, y: int, x: int) -> bool:
+        return 0 <= y < self.height and 0 <= x < self.width
+
+    def __getitem__(self, pos: Tuple[int, int]) -> int:
+        return self.cells[self.index(*pos)]
+
+    def __setitem__(self, pos: Tuple[int, int], value: int):
+        self.cells[self.index(*pos)] = value
+
+    def offsets(self, directions: Sequence[str]) -> Tuple[int, ...]:
+        ''' Flat index offsets of the steps towards directions, keys of DIRECTIONS. '''
+        return stride_offsets(self.stride, tuple(directions))
+
+    def row_starts(self) -> range:
+        ''' Flat indices of the first cell of every row. '''
+        first = self.pad * self.stride + self.pad
+        # An empty grid without padding has a stride of 0 and no rows to start
+        return range(first, first + self.height * self.stride, self.stride or 1)
+
+    def interior(self) -> Iterator[int]:
+        ''' Flat indices of every cell that is not padding, row by row. '''
+        for start in self.row_starts():
+            yield from range(start, start + self.width)
+
+    def row(self, y: int) -> memoryview:
+        start = self.index(y, 0)
+        return memoryview(self.cells)[start:start + self.width]
+
+    def column(self, x: int) -> memoryview:
+        start = self.index(0, x)
+        return memoryview(self.cells)[start:start + self.height * self.stride:self.stride]
+
+    def count(self, value: int) -> int:
+        return sum(self.cells[start:start + self.width].count(value) for start in self.row_starts())
+
+    def copy(self) -> 'Grid':
+        return Grid(self.height, self.width, pad=self.pad, typecode=self.typecode, cells=self.cells[:])
+
+    __copy__ = copy
+
+    def to_lines(self, chars: Dict[int, str]) -> List[str]:
+        return [''.join(chars[c] for c in self.row(y)) for y in range(self.height)]
+
+@lru_cache(maxsize=None)
+def stride_offsets(stride: int, directions: Tuple[str, ...]) -> Tuple[int, ...]:
+    ''' Grid.offsets() shared by every grid of the stride, searches copy grids a lot. '''
+    return tuple(DIRECTIONS[d][0] * stride + DIRECTIONS[d][1] for d in directions)
+
+def run(value: int, n: int, typecode: str = 'B') -> Cells:
+    ''' n cells set to value. '''
+    if typecode == 'B':
+        return bytearray((value,)) * n
+    return array(typecode, (value,)) * n
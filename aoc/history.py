@@ -0,0 +1,280 @@
+'''
+Local history of the benchmark and memory results, kept in SQLite.
+
+    python -m aoc.history report [days..] [--last N] [--input input.txt]
+    python -m aoc.history compare BASE HEAD [days..] [--alpha 0.05] [--threshold 1.05]
+
+aoc.bench and aoc.memory record every run into .aoc-history.sqlite unless
+they are given --no-history. A run is tagged with the git commit it was
+made on, whether the tree had uncommitted changes, the Python version and
+implementation, whether the inputs came from the parse cache and the tool,
+and each result with its day, phase, input file and input size. Every
+timing sample is stored, not only the summary, so two commits can be
+compared with a significance test instead of by their medians alone.
+
+Timings of another interpreter, or of a cached parse that only unpickles
+the input, say nothing about the code, so runs are only ever pooled and
+compared with runs of the same Python version, implementation and cache
+setting, which are part of the key of every series.
+
+report prints the median of each day and phase over the last runs, oldest
+first. compare pools the timing samples recorded on two commits and flags
+the phases that got slower by more than the threshold with a one-sided
+permutation test on the mean log time below alpha. BASE and HEAD are
+anything git rev-parse understands, or a prefix of a recorded commit, and
+select the runs made on a clean tree. A trailing + selects the runs made
+with uncommitted changes instead, so HEAD HEAD+ compares the work in
+progress against the last commit.
+'''
+import argparse
+import itertools
+import math
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+from aoc.days import ROOT, parse_selection
+
+HISTORY_PATH = os.path.join(ROOT, '.aoc-history.sqlite')
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    timestamp REAL NOT NULL,
+    tool TEXT NOT NULL,
+    git_commit TEXT,
+    dirty INTEGER NOT NULL,
+    python TEXT NOT NULL,
+    implementation TEXT NOT NULL,
+    cached INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS samples (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    year INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    phase TEXT NOT NULL,
+    input TEXT NOT NULL,
+    input_bytes INTEGER NOT NULL,
+    metric TEXT NOT NULL, -- 'time' in seconds or 'peak' in bytes
+    value REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS samples_key ON samples (year, day, phase, metric);
+'''
+# Above this many label assignments the permutation test samples them at random
+EXACT_PERMUTATIONS = 20000
+
+def connect(path: str = HISTORY_PATH) -> sqlite3.Connection:
+    db = sqlite3.connect(path)
+    db.executescript(SCHEMA)
+    # Databases from before the cached column, their runs never used the cache
+    if 'cached' not in [row[1] for row in db.execute('PRAGMA table_info(runs)')]:
+        db.execute('ALTER TABLE runs ADD COLUMN cached INTEGER NOT NULL DEFAULT 0')
+    return db
+
+def git_state() -> Tuple[Optional[str], bool]:
+    ''' The commit checked out and whether tracked files have changes, (None, False) outside git. '''
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        status = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=ROOT,
+                                capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None, False
+    return commit, bool(status.strip())
+
+def record(results: List[Dict], tool: str, path: str = HISTORY_PATH) -> int:
+    '''
+    Stores the results of aoc.bench (with their 'samples') or of aoc.memory
+    (with their 'peak') as one run, returns its id.
+    '''
+    commit, dirty = git_state()
+    cached = any(r.get('cached') for r in results)
+    with connect(path) as db:
+        run_id = db.execute(
+            'INSERT INTO runs (timestamp, tool, git_commit, dirty, python, implementation, cached) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (time.time(), tool, commit, dirty, platform.python_version(), platform.python_implementation(), cached)
+        ).lastrowid
+        rows = []
+        for r in results:
+            input_bytes = r.get('input_bytes')
+            if input_bytes is None:
+                input_bytes = os.path.getsize(r['input'])
+            key = (run_id, r['year'], r['day'], r['phase'], os.path.basename(r['input']), input_bytes)
+            if 'samples' in r:
+                rows.extend((*key, 'time', sample) for sample in r['samples'])
+            if 'peak' in r:
+                rows.append((*key, 'peak', r['peak']))
+        db.executemany('INSERT INTO samples VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows)
+    db.close()
+    return run_id
+
+def day_filter(specs: List[str]) -> Tuple[str, List]:
+    ''' SQL condition and parameters selecting the days of the selection specs. '''
+    selection = parse_selection(specs)
+    if not selection:
+        return '1', []
+    terms, params = [], []
+    for year, day in selection:
+        if day is None:
+            terms.append('s.year = ?')
+            params.append(year)
+        else:
+            terms.append('(s.year = ? AND s.day = ?)')
+            params.extend((year, day))
+    return '(' + ' OR '.join(terms) + ')', params
+
+def resolve_commit(db: sqlite3.Connection, rev: str) -> Tuple[str, bool]:
+    '''
+    Full hash of rev, which git resolves or which prefixes a single recorded
+    commit, and whether it selects the dirty runs.
+    '''
+    dirty = rev.endswith('+')
+    rev = rev.rstrip('+')
+    proc = subprocess.run(['git', 'rev-parse', '--verify', '--quiet', f'{rev}^{{commit}}'], cwd=ROOT,
+                          capture_output=True, text=True)
+    if proc.returncode == 0:
+        return proc.stdout.strip(), dirty
+    matches = [row[0] for row in db.execute(
+        'SELECT DISTINCT git_commit FROM runs WHERE git_commit LIKE ?', (rev + '%',))]
+    if len(matches) != 1:
+        raise ValueError(f'{rev!r} matches {len(matches)} recorded commits')
+    return matches[0], dirty
+
+# (year, day, phase, input, input size, python version, implementation, cached)
+Key = Tuple[int, int, str, str, int, str, str, int]
+KEY_COLUMNS = 's.year, s.day, s.phase, s.input, s.input_bytes, r.python, r.implementation, r.cached'
+
+def trends(db: sqlite3.Connection, specs: List[str], last: int, input: Optional[str] = None) -> Dict[Tuple[Key, str], List[Tuple[str, float]]]:
+    ''' Per key and metric, the (commit, median) of the last runs oldest first. '''
+    where, params = day_filter(specs)
+    if input is not None:
+        where += ' AND s.input = ?'
+        params.append(input)
+    rows = db.execute(f'''
+        SELECT {KEY_COLUMNS}, s.metric, r.id, r.git_commit, r.dirty, s.value
+        FROM samples s JOIN runs r ON r.id = s.run_id
+        WHERE {where}
+        ORDER BY {KEY_COLUMNS}, s.metric, r.id
+    ''', params).fetchall()
+
+    result = {}
+    for (*key, metric), group in itertools.groupby(rows, key=lambda row: row[:9]):
+        runs = []
+        for (_, commit, dirty), samples in itertools.groupby(group, key=lambda row: row[9:12]):
+            label = (commit or 'no-git')[:8] + ('+' if dirty else '')
+            runs.append((label, statistics.median(row[12] for row in samples)))
+        result[(tuple(key), metric)] = runs[-last:]
+    return result
+
+def commit_samples(db: sqlite3.Connection, commit: str, dirty: bool, specs: List[str]) -> Dict[Key, List[float]]:
+    ''' The timing samples of every clean or dirty run recorded on commit, by key. '''
+    where, params = day_filter(specs)
+    rows = db.execute(f'''
+        SELECT {KEY_COLUMNS}, s.value
+        FROM samples s JOIN runs r ON r.id = s.run_id
+        WHERE r.git_commit = ? AND r.dirty = ? AND s.metric = 'time' AND {where}
+    ''', [commit, dirty] + params)
+    samples: Dict[Key, List[float]] = {}
+    for *key, value in rows:
+        samples.setdefault(tuple(key), []).append(value)
+    return samples
+
+def permutation_pvalue(base: List[float], head: List[float], seed: int = 0) -> float:
+    '''
+    One-sided p-value of head being slower than base: the share of the ways
+    to split the pooled log times into groups of the same sizes whose head
+    mean exceeds the base mean by at least as much as observed. Exact when
+    there are few splits, estimated from random splits otherwise.
+    '''
+    pooled = [math.log(max(v, 1e-12)) for v in base + head]
+    n, k = len(pooled), len(head)
+    total = sum(pooled)
+    observed = sum(pooled[len(base):])
+    # The head mean minus the base mean grows with the head sum, so the sums can be compared
+    eps = 1e-12 * max(1.0, abs(total))
+    if math.comb(n, k) <= EXACT_PERMUTATIONS:
+        splits = [sum(c) for c in itertools.combinations(pooled, k)]
+        return sum(1 for s in splits if s >= observed - eps) / len(splits)
+    rng = random.Random(seed)
+    splits = [sum(rng.sample(pooled, k)) for _ in range(EXACT_PERMUTATIONS)]
+    # The observed split counts as one of the samples, so the estimate is never 0
+    return (sum(1 for s in splits if s >= observed - eps) + 1) / (len(splits) + 1)
+
+def compare(base: Dict[Key, List[float]], head: Dict[Key, List[float]], alpha: float, threshold: float) -> List[Dict]:
+    compared = []
+    for key in sorted(base.keys() & head.keys()):
+        ratio = statistics.median(head[key]) / statistics.median(base[key])
+        p = permutation_pvalue(base[key], head[key])
+        compared.append({'key': key, 'base': statistics.median(base[key]), 'head': statistics.median(head[key]),
+                         'ratio': ratio, 'p': p, 'slower': p < alpha and ratio > threshold})
+    return compared
+
+def format_key(key: Key) -> str:
+    year, day, phase, input, size, python, implementation, cached = key
+    return f'{year}-{day:02} {phase:<6} {input} ({size} B) {implementation} {python}' + (' cached' if cached else '')
+
+def format_value(metric: str, value: float) -> str:
+    return f'{value * 1000:.3f} ms' if metric == 'time' else f'{value / 1024:.1f} KiB'
+
+def report_main(args: argparse.Namespace, db: sqlite3.Connection) -> int:
+    for (key, metric), runs in trends(db, args.days, args.last, args.input).items():
+        first = runs[0][1]
+        change = f'  {runs[-1][1] / first - 1:+.1%}' if len(runs) > 1 and first > 0 else ''
+        print(f'{format_key(key)} {metric}{change}')
+        print('    ' + '  '.join(f'{label} {format_value(metric, value)}' for label, value in runs))
+    return 0
+
+def compare_main(args: argparse.Namespace, db: sqlite3.Connection) -> int:
+    base, head = resolve_commit(db, args.base), resolve_commit(db, args.head)
+    compared = compare(commit_samples(db, *base, args.days), commit_samples(db, *head, args.days),
+                       args.alpha, args.threshold)
+    label = lambda commit, dirty: commit[:8] + ('+' if dirty else '')
+    if not compared:
+        print(f'No timings recorded on both {label(*base)} and {label(*head)} '
+              'with the same Python and cache setting')
+        return 0
+    print(f'{label(*base)} -> {label(*head)}')
+    for c in compared:
+        line = f'{format_key(c["key"])} {format_value("time", c["base"]):>12} -> ' \
+               f'{format_value("time", c["head"]):>12} {c["ratio"]:6.2f}x  p={c["p"]:.3f}'
+        if c['slower']:
+            line += '  SLOWER'
+        print(line)
+    return 1 if any(c['slower'] for c in compared) else 0
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m aoc.history', description=__doc__.split('\n\n')[0])
+    parser.add_argument('--db', default=HISTORY_PATH, help='history database, default %(default)s')
+    commands = parser.add_subparsers(dest='command', required=True)
+    report_parser = commands.add_parser('report', help='medians of the last runs of every day and phase')
+    report_parser.add_argument('days', nargs='*', help="days to show, e.g. '2025' or '2025:8', default every day")
+    report_parser.add_argument('-n', '--last', type=int, default=5, help='runs shown per phase')
+    report_parser.add_argument('-i', '--input', help='only show this input file name, e.g. input.txt')
+    compare_parser = commands.add_parser('compare', help='significant slowdowns between two commits')
+    compare_parser.add_argument('base')
+    compare_parser.add_argument('head')
+    compare_parser.add_argument('days', nargs='*', help="days to compare, default every day")
+    compare_parser.add_argument('-a', '--alpha', type=float, default=0.05, help='significance level')
+    compare_parser.add_argument('-t', '--threshold', type=float, default=1.05,
+                                help='median ratio a slowdown must exceed as well')
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.db):
+        parser.error(f'{args.db} does not exist, run python -m aoc.bench first')
+    db = connect(args.db)
+    try:
+        return report_main(args, db) if args.command == 'report' else compare_main(args, db)
+    except ValueError as e:
+        parser.error(str(e))
+    finally:
+        db.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,160 @@
+'''
+Opt-in instrumentation of the hot recursive functions of the solutions.
+
+    AOC_INSTRUMENT=1 python main.py          # report printed at exit
+    python -m aoc.instrument [days..] [-o report.json]
+
+Functions decorated with @instrument record their call count, cumulative and
+self time and deepest recursion, and the tables of aoc.memo.memoize add their
+hits and misses under the name of the function they memoize. Whether
+instrumentation is on is decided when the decorator is applied, that is when
+the solution module is imported, and with it off the decorator returns the
+function unchanged so the solutions run exactly as without it.
+'''
+import atexit
+import functools
+import os
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+ENV_VAR = 'AOC_INSTRUMENT'
+
+def enabled() -> bool:
+    return os.environ.get(ENV_VAR, '') not in ('', '0')
+
+class Stats:
+    __slots__ = ('name', 'calls', 'total', 'self_time', 'depth', 'max_depth', 'hits', 'misses')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.depth = 0
+        self.clear()
+
+    def clear(self):
+        self.calls = 0
+        self.total = 0.0     # Time inside the outermost active call, recursion is not counted twice
+        self.self_time = 0.0 # Time not spent in other instrumented calls
+        self.max_depth = self.depth
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> Optional[float]:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+    def to_dict(self) -> Dict:
+        return {'calls': self.calls, 'total': self.total, 'self': self.self_time,
+                'max_depth': self.max_depth, 'hits': self.hits, 'misses': self.misses,
+                'hit_rate': self.hit_rate}
+
+STATS: Dict[str, Stats] = {}
+# Time spent in instrumented callees of every active instrumented call
+_child_times: List[float] = []
+
+def stats_for(name: str) -> Stats:
+    if name not in STATS:
+        if not STATS:
+            atexit.register(report)
+        STATS[name] = Stats(name)
+    return STATS[name]
+
+def instrument(func: Optional[Callable] = None, *, name: Optional[str] = None):
+    ''' Decorator recording the calls of func, usable as @instrument or @instrument(name=..). '''
+    if func is None:
+        return lambda f: instrument(f, name=name)
+    if not enabled():
+        return func
+
+    stats = stats_for(name or func.__qualname__)
+    perf_counter = time.perf_counter
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        stats.calls += 1
+        stats.depth += 1
+        if stats.depth > stats.max_depth:
+            stats.max_depth = stats.depth
+        _child_times.append(0.0)
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            stats.self_time += elapsed - _child_times.pop()
+            if _child_times:
+                _child_times[-1] += elapsed
+            stats.depth -= 1
+            if stats.depth == 0:
+                stats.total += elapsed
+    return wrapper
+
+def reset():
+    for stats in STATS.values():
+        stats.clear()
+
+def snapshot() -> Dict[str, Dict]:
+    return {name: stats.to_dict() for name, stats in STATS.items() if stats.calls or stats.hits or stats.misses}
+
+def format_report(report: Dict[str, Dict]) -> str:
+    lines = [f'{"function":<40} {"calls":>10} {"total ms":>10} {"self ms":>10} {"depth":>6} {"hit rate":>9}']
+    for name, s in sorted(report.items(), key=lambda item: -item[1]['self']):
+        hit_rate = f'{s["hit_rate"]:9.1%}' if s['hit_rate'] is not None else f'{"-":>9}'
+        lines.append(f'{name[-40:]:<40} {s["calls"]:>10} {s["total"] * 1000:10.2f} '
+                     f'{s["self"] * 1000:10.2f} {s["max_depth"]:>6} {hit_rate}')
+    return '\n'.join(lines)
+
+def report(file=None):
+    ''' Prints what has been recorded so far, called at exit when instrumentation is on. '''
+    recorded = snapshot()
+    if recorded:
+        print(format_report(recorded), file=file or sys.stderr)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    # Imported here, the solutions import this module for the decorators only
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(prog='python -m aoc.instrument', description=__doc__.split('\n\n')[0])
+    parser.add_argument('days', nargs='*', help="days to run, e.g. '2025' or '2025:8', default every day")
+    parser.add_argument('-i', '--input', help='input file to use instead of input.txt (single day only)')
+    parser.add_argument('-o', '--output', help='write the reports as JSON into this file')
+    args = parser.parse_args(argv)
+
+    # Must be set before the solutions are imported, that is when @instrument is applied
+    os.environ[ENV_VAR] = '1'
+    from aoc.bench import silenced
+    from aoc.days import load_module, select_cli_days
+
+    days = select_cli_days(parser, args.days)
+    if args.input and len(days) != 1:
+        parser.error('--input can only be used with a single day')
+
+    reports = []
+    for day in days:
+        module = load_module(day)
+        input_path = args.input or day.input_path
+        with silenced():
+            input = module.load(input_path)
+        for phase, part in (('part1', module.part1), ('part2', module.part2)):
+            reset()
+            with silenced():
+                part(input)
+            recorded = snapshot()
+            reports.append({'year': day.year, 'day': day.day, 'phase': phase, 'functions': recorded})
+            if recorded:
+                print(f'{day.name} {phase}')
+                print(format_report(recorded), end='\n\n')
+    atexit.unregister(report)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(reports, f, indent=1)
+    return 0
+
+
+if __name__ == '__main__':
+    # Run as a script this module is __main__, while the solutions record into aoc.instrument
+    from aoc.instrument import main as shared_main
+    sys.exit(shared_main())
@@ -0,0 +1,92 @@
+'''
+Sets of integers stored as sorted, disjoint, inclusive ranges.
+
+The ranges are merged as they are added, overlapping and touching ones
+becoming one range, and kept in two parallel sorted lists of the range
+starts and ends. The range that may contain a value is then found with a
+binary search on the starts, so membership is O(log n) whatever order the
+values are queried in.
+'''
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, List, Tuple
+
+class IntervalSet:
+    __slots__ = ('starts', 'ends')
+
+    def __init__(self, ranges: Iterable[Tuple[int, int]] = ()):
+        ''' Set of the values in the inclusive (low, high) ranges, which may overlap and come in any order. '''
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+        for low, high in sorted(ranges):
+            if low > high:
+                continue
+            if self.ends and low <= self.ends[-1] + 1:
+                self.ends[-1] = max(self.ends[-1], high)
+            else:
+                self.starts.append(low)
+                self.ends.append(high)
+
+    def __len__(self) -> int:
+        ''' Number of disjoint ranges, see covered for the number of values. '''
+        return len(self.starts)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return zip(self.starts, self.ends)
+
+    def __repr__(self) -> str:
+        return f'IntervalSet({list(self)})'
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, IntervalSet) and self.starts == other.starts and self.ends == other.ends
+
+    def __contains__(self, value: int) -> bool:
+        i = bisect_right(self.starts, value) - 1
+        return i >= 0 and value <= self.ends[i]
+
+    contains = __contains__
+
+    def count_contained(self, values: Iterable[int]) -> int:
+        ''' How many of values are in the set, duplicates counting every time. '''
+        starts, ends = self.starts, self.ends
+        count = 0
+        for value in values:
+            i = bisect_right(starts, value) - 1
+            if i >= 0 and value <= ends[i]:
+                count += 1
+        return count
+
+    def covered(self) -> int:
+        ''' Number of values in the set. '''
+        return sum(self.ends) - sum(self.starts) + len(self.starts)
+
+    def add(self, low: int, high: int):
+        ''' Adds the inclusive range low..high, merging it with the ranges it overlaps or touches. '''
+        if low > high:
+            return
+        # Ranges [first, last) are merged into the new one
+        first = bisect_left(self.ends, low - 1)
+        last = bisect_right(self.starts, high + 1)
+        if first < last:
+            low = min(low, self.starts[first])
+            high = max(high, self.ends[last - 1])
+        self.starts[first:last] = [low]
+        self.ends[first:last] = [high]
+
+    def intersection(self, other: 'IntervalSet') -> 'IntervalSet':
+        ''' Values in both sets, in one merge pass over both. '''
+        result = IntervalSet()
+        i = j = 0
+        while i < len(self.starts) and j < len(other.starts):
+            low = max(self.starts[i], other.starts[j])
+            high = min(self.ends[i], other.ends[j])
+            if low <= high:
+                result.starts.append(low)
+                result.ends.append(high)
+            # The range ending first can not overlap anything further
+            if self.ends[i] < other.ends[j]:
+                i += 1
+            else:
+                j += 1
+        return result
+
+    __and__ = intersection
@@ -0,0 +1,171 @@
+'''
+Searches for k values of a list that add up to a target.
+
+The values are indexed once by value, with the positions of every
+occurrence, so the searches work on the distinct values and their
+multiplicities instead of on the whole list: a report of a million entries
+drawn from a few thousand amounts costs no more to search than the
+amounts themselves. Solutions are found as non-decreasing tuples of
+values and only then expanded into the index tuples of the occurrences.
+Up to k = 3 the smaller values are fixed in turn and the last two come from
+a hash lookup, for larger k the two halves of the tuple meet in the middle
+through a table of half-tuple sums. That table grows as the number of
+distinct values to the power k / 2, so when it would hold more than
+MAX_TABLE half-tuples the direct search is used for larger k as well.
+
+Batches of targets are answered by find_many. For pairs it builds, once
+per index, a table of every sum two entries can make with the first pair
+of values making it, after which each target costs one lookup. When there
+are more than MAX_TABLE pairs of distinct values the targets are searched
+one by one on the shared index instead.
+'''
+import math
+from bisect import bisect_left
+from collections import Counter
+from itertools import combinations, groupby
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+MAX_TABLE = 4_000_000
+
+class SumIndex:
+    __slots__ = ('values', 'positions', 'distinct', 'pair_sums')
+
+    def __init__(self, values: Iterable[int]):
+        self.values = list(values)
+        self.positions: Dict[int, List[int]] = {}
+        for i, value in enumerate(self.values):
+            self.positions.setdefault(value, []).append(i)
+        self.distinct = sorted(self.positions)
+        self.pair_sums: Optional[Dict[int, Tuple[int, int]]] = None # Built by the first find_many
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def count(self, value: int) -> int:
+        ''' Number of occurrences of value. '''
+        return len(self.positions.get(value, ()))
+
+    def find(self, target: int, k: int = 2) -> Optional[Tuple[int, ...]]:
+        ''' Ascending indices of k distinct entries adding up to target, None if there are none. '''
+        for values in self.value_solutions(target, k):
+            return next(self.index_tuples(values))
+        return None
+
+    def find_all(self, target: int, k: int = 2) -> Iterator[Tuple[int, ...]]:
+        ''' Ascending indices of every set of k distinct entries adding up to target. '''
+        for values in self.value_solutions(target, k):
+            yield from self.index_tuples(values)
+
+    def find_many(self, targets: Iterable[int], k: int = 2) -> Dict[int, Optional[Tuple[int, ...]]]:
+        ''' find for every target, the same answers for a fraction of the cost when k is 2. '''
+        if k == 2 and self.pair_table() is not None:
+            return {target: self._pair_find(target) for target in targets}
+        return {target: self.find(target, k) for target in targets}
+
+    def pair_table(self) -> Optional[Dict[int, Tuple[int, int]]]:
+        ''' Every sum of two entries with its smallest pair of values, None if there are too many pairs to tabulate. '''
+        if self.pair_sums is None:
+            d = len(self.distinct)
+            if d * (d + 1) // 2 > MAX_TABLE:
+                return None
+            sums: Dict[int, Tuple[int, int]] = {}
+            distinct = self.distinct
+            for i, a in enumerate(distinct):
+                if len(self.positions[a]) > 1:
+                    sums.setdefault(a + a, (a, a))
+                for b in distinct[i + 1:]:
+                    sums.setdefault(a + b, (a, b))
+            self.pair_sums = sums
+        return self.pair_sums
+
+    def _pair_find(self, target: int) -> Optional[Tuple[int, ...]]:
+        values = self.pair_sums.get(target)
+        return None if values is None else next(self.index_tuples(values))
+
+    def value_solutions(self, target: int, k: int) -> Iterator[Tuple[int, ...]]:
+        ''' Every non-decreasing tuple of k values adding up to target that the entries can provide. '''
+        if k < 1:
+            raise ValueError('k must be at least 1')
+        if not self.distinct:
+            return
+        if k <= 3 or math.comb(len(self.distinct) + k // 2 - 1, k // 2) > MAX_TABLE:
+            solutions = self._direct(target, k, self.distinct[0])
+        else:
+            solutions = self._meet_in_the_middle(target, k)
+        for values in solutions:
+            # Only a value used more than once can be missing occurrences
+            if len(set(values)) == k or all(n <= self.count(v) for v, n in Counter(values).items()):
+                yield values
+
+    def index_tuples(self, values: Tuple[int, ...]) -> Iterator[Tuple[int, ...]]:
+        ''' The ascending index tuples of the occurrences making up the non-decreasing values. '''
+        groups = [(v, len(list(group))) for v, group in groupby(values)]
+        for chosen in self._choices(groups, 0):
+            yield tuple(sorted(chosen))
+
+    def _choices(self, groups: List[Tuple[int, int]], i: int) -> Iterator[Tuple[int, ...]]:
+        ''' Lazily, itertools.product would list every choice of a value with thousands of occurrences first. '''
+        if i == len(groups):
+            yield ()
+            return
+        value, n = groups[i]
+        for chosen in combinations(self.positions[value], n):
+            for rest in self._choices(groups, i + 1):
+                yield chosen + rest
+
+    def _direct(self, target: int, k: int, low: int) -> Iterator[Tuple[int, ...]]:
+        ''' Non-decreasing k-tuples of distinct values no smaller than low adding up to target. '''
+        distinct = self.distinct
+        if k == 1:
+            if target >= low and target in self.positions:
+                yield (target,)
+            return
+        start = bisect_left(distinct, low)
+        if k == 2:
+            positions = self.positions
+            for j in range(start, len(distinct)):
+                value = distinct[j]
+                rest = target - value
+                if rest < value: # The values only grow, so does the sum
+                    break
+                if rest in positions:
+                    yield value, rest
+            return
+        for j in range(start, len(distinct)):
+            value = distinct[j]
+            if value * k > target: # Every value after it is at least as large
+                break
+            for rest in self._direct(target - value, k - 1, value):
+                yield (value,) + rest
+
+    def _meet_in_the_middle(self, target: int, k: int) -> Iterator[Tuple[int, ...]]:
+        '''
+        The non-decreasing k-tuples adding up to target as a tuple of the
+        smaller half of the values followed by one of the larger half,
+        looked up by its sum in a table of every larger half.
+        '''
+        small, large = k - k // 2, k // 2
+        lowest = self.distinct[0]
+        # The smaller values average at most target / k, so the larger ones at least that
+        small_max = target * small // k
+        halves: Dict[int, List[Tuple[int, ...]]] = {}
+        for half, total in self._tuples(large, lowest, target - small * lowest):
+            if total >= target - small_max:
+                halves.setdefault(total, []).append(half)
+        for half, total in self._tuples(small, lowest, small_max):
+            for rest in halves.get(target - total, ()):
+                if half[-1] <= rest[0]:
+                    yield half + rest
+
+    def _tuples(self, n: int, low: int, max_sum: int) -> Iterator[Tuple[Tuple[int, ...], int]]:
+        ''' Non-decreasing n-tuples of distinct values no smaller than low adding up to at most max_sum, with their sums. '''
+        distinct = self.distinct
+        for j in range(bisect_left(distinct, low), len(distinct)):
+            value = distinct[j]
+            if value * n > max_sum:
+                break
+            if n == 1:
+                yield (value,), value
+            else:
+                for rest, total in self._tuples(n - 1, value, max_sum - value):
+                    yield (value,) + rest, value + total
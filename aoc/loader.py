@@ -0,0 +1,125 @@
+'''
+Input loaders shared by the solutions of every year.
+
+filemap() keeps its old behaviour of returning a list, the other loaders
+never hold the whole file in memory: the file is memory mapped and split into
+records chunk by chunk, and only the records themselves are copied out of
+the map. The fast paths parse the records straight from bytes without
+decoding them into str first.
+'''
+import mmap
+import os
+from array import array
+from typing import Callable, Iterator, List, Optional, Pattern, Tuple
+
+CHUNK_SIZE = 1 << 22
+WHITESPACE = b' \t\n\r\x0b\x0c'
+
+def records(filename: str, sep: bytes = b'\n', strip: bool = True, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    '''
+    Lazily yields the records of the file separated by sep as bytes. Leading
+    and trailing whitespace of the whole file is ignored if strip is True,
+    which matches f.read().strip().split(sep). CRLF line endings are read as
+    LF like in text mode, so they match a sep such as '\n' or '\n\n' too.
+    '''
+    with open(filename, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start, end = 0, size
+            if strip:
+                while start < end and mm[start] in WHITESPACE:
+                    start += 1
+                while end > start and mm[end-1] in WHITESPACE:
+                    end -= 1
+
+            # One scan of the map spares LF files the translation
+            crlf = mm.find(b'\r', start, end) != -1
+            tail = b''
+            for pos in range(start, end, chunk_size):
+                chunk = mm[pos:min(pos + chunk_size, end)]
+                data = tail + chunk if tail else chunk
+                if crlf:
+                    # A CR ending the chunk stays in the tail until its LF arrives
+                    data = data.replace(b'\r\n', b'\n')
+                recs = data.split(sep)
+                tail = recs.pop() # Possibly cut in half by the chunk boundary
+                yield from recs
+            yield tail
+
+def ifilemap(filename: str, func: Callable = int, sep: str = '\n', strip: bool = True) -> Iterator:
+    '''
+    Lazy version of filemap(), yields the records of the file mapped by func
+    one at a time. Only a single record is decoded at a time.
+    '''
+    for rec in records(filename, sep.encode(), strip):
+        yield func(rec.decode())
+
+def filemap(filename: str, func: Callable = int, sep: str = '\n', strip: bool = True) -> List:
+    '''
+    Reads in the filename and returns a list with all the rows mapped by
+    the function func, which defaults to int(). That is returns
+    a list containing one integer for every row of the file with def arguments.
+    '''
+    return list(ifilemap(filename, func, sep, strip))
+
+# Fast paths for the common record shapes. int() parses bytes directly.
+
+def ints(filename: str, sep: str = '\n', typecode: str = 'q') -> array:
+    ''' Returns the integer records of the file as a compact array. '''
+    return array(typecode, map(int, records(filename, sep.encode())))
+
+def iint_tuples(filename: str, sep: str = '\n', delim: str = ',') -> Iterator[Tuple[int, ...]]:
+    ''' Lazily yields records such as '1,2,3' as tuples of integers. '''
+    delim_b = delim.encode()
+    for rec in records(filename, sep.encode()):
+        yield tuple(map(int, rec.split(delim_b)))
+
+def int_tuples(filename: str, sep: str = '\n', delim: str = ',') -> List[Tuple[int, ...]]:
+    return list(iint_tuples(filename, sep, delim))
+
+def ichar_ints(filename: str, sep: str = '\n') -> Iterator[Tuple[str, int]]:
+    ''' Lazily yields records such as 'R42' as (char, int) tuples, skipping empty records. '''
+    for rec in records(filename, sep.encode()):
+        if rec:
+            yield (chr(rec[0]), int(rec[1:]))
+
+def char_ints(filename: str, sep: str = '\n') -> List[Tuple[str, int]]:
+    return list(ichar_ints(filename, sep))
+
+def imatches(filename: str, pattern: Pattern[bytes], start: int = 0, end: Optional[int] = None) -> Iterator[Tuple[bytes, ...]]:
+    '''
+    Lazily yields the groups of every match of the compiled bytes pattern in
+    the file, or in its bytes from start to end. The pattern runs over the
+    memory map in place, so only the groups are copied out of it and records
+    of any shape can be parsed without splitting the file into lines first.
+    '''
+    with open(filename, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for match in pattern.finditer(mm, start, size if end is None else end):
+                yield match.groups()
+
+def byte_ranges(filename: str, chunk_size: int = CHUNK_SIZE, sep: bytes = b'\n') -> List[Tuple[int, int]]:
+    '''
+    Splits the file into (start, end) byte ranges of about chunk_size bytes,
+    every one but the last ending just after a sep so no record is cut in
+    two. The ranges can be parsed independently, e.g. in worker processes.
+    '''
+    with open(filename, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            ranges = []
+            start = 0
+            while start < size:
+                end = mm.find(sep, start + chunk_size - 1)
+                end = size if end == -1 else end + len(sep)
+                ranges.append((start, end))
+                start = end
+            return ranges
@@ -0,0 +1,121 @@
+'''
+Memoization shared by the recursive solutions.
+
+    @memoize(key=lambda bank, start, n: pack(n, start), maxsize=100_000)
+    def best(bank, start, n): ..
+
+A memoized function gets a fresh Memo table on every outermost call, which
+its recursive calls share and which is dropped when that call returns. So
+nothing leaks from one input or one call to the next. The table may be
+bounded, evicting the least recently used entry once it is full, and counts
+its hits, misses and evictions. The counts of the last outermost call are
+kept in the stats attribute of the function, and are added to the report of
+aoc.instrument when instrumentation is on. key maps the arguments to the
+memo key, pack combines small non-negative integers into one int, which
+hashes and compares faster and takes less memory than a tuple.
+
+The table of the running outermost call is held by the function itself, so
+a memoized function is not thread-safe: a call from a second thread while
+one is running joins its table, as if it were a recursive call, and the
+first call to return drops the table under the other. The solutions only
+ever call them from one thread.
+'''
+import functools
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional
+
+from aoc.instrument import enabled, stats_for
+
+_MISSING = object()
+
+class Memo:
+    __slots__ = ('maxsize', 'data', 'hits', 'misses', 'evictions')
+
+    def __init__(self, maxsize: Optional[int] = None):
+        ''' Memo table holding at most maxsize entries, unbounded when None. '''
+        if maxsize is not None and maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+        self.maxsize = maxsize
+        self.data: Dict = {} if maxsize is None else OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.data
+
+    def get(self, key: Hashable, default=None):
+        ''' The value memoized for key counting a hit, or default counting a miss. '''
+        value = self.data.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+        self.hits += 1
+        if self.maxsize is not None:
+            self.data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value):
+        self.data[key] = value
+        if self.maxsize is not None and len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self.data.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'size': len(self.data)}
+
+def pack(*values: int, bits: int = 32) -> int:
+    ''' values, each in [0, 2**bits), packed into one integer key. '''
+    key = 0
+    for value in values:
+        key = key << bits | value
+    return key
+
+def memoize(
+        func: Optional[Callable] = None,
+        *,
+        key: Optional[Callable[..., Hashable]] = None,
+        maxsize: Optional[int] = None,
+        name: Optional[str] = None
+):
+    '''
+    Decorator memoizing func for the duration of each outermost call, usable
+    as @memoize or @memoize(key=.., maxsize=..). key computes the memo key of
+    the arguments, by default the tuple of all of them. Only positional
+    arguments are supported.
+    '''
+    if func is None:
+        return lambda f: memoize(f, key=key, maxsize=maxsize, name=name)
+    name = name or func.__qualname__
+    memo: Optional[Memo] = None
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        nonlocal memo
+        outermost = memo is None
+        if outermost:
+            memo = Memo(maxsize)
+        try:
+            k = args if key is None else key(*args)
+            value = memo.get(k, _MISSING)
+            if value is _MISSING:
+                value = memo[k] = func(*args)
+            return value
+        finally:
+            if outermost:
+                wrapper.stats = memo.stats()
+                if enabled():
+                    stats = stats_for(name)
+                    stats.hits += memo.hits
+                    stats.misses += memo.misses
+                memo = None
+
+    wrapper.stats = {}
+    return wrapper
@@ -0,0 +1,187 @@
+'''
+Peak memory of the parse, part 1 and part 2 phases of every day, checked
+against the budgets in aoc/memory-budgets.json.
+
+    python -m aoc.memory [days..] [--top N] [-i input.txt]
+    python -m aoc.memory [days..] --update   # record the current peaks as budgets
+
+The peaks are measured with tracemalloc, so they count the Python
+allocations made during the phase, not the resident size of the process.
+Each part gets a freshly parsed input which is allocated before tracing
+starts. Every day is measured in a process of its own: the free lists and
+caches left behind by the days measured before would otherwise make a
+peak depend on which days ran with it. A phase over its budget makes the
+run exit with 1.
+'''
+import argparse
+import json
+import os
+import sys
+import threading
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from aoc.bench import phase_funcs, silenced
+from aoc.days import ROOT, Day, load_module, select_cli_days
+
+BUDGETS_PATH = os.path.join(ROOT, 'aoc', 'memory-budgets.json')
+# Budgets recorded with --update leave this much room above the measured peak
+HEADROOM = 1.25
+# Smaller peaks vary with interpreter internals more than with the solution
+MIN_BUDGET = 64 * 1024
+
+class PeakSampler(threading.Thread):
+    '''
+    Snapshots the traced allocations whenever they have grown well past the
+    largest snapshot so far. The last snapshot is taken close to the peak and
+    shows where the memory at the peak was allocated, which a snapshot taken
+    after the phase cannot since most of it has been freed by then.
+    '''
+    def __init__(self, interval: float = 0.01, growth: float = 1.2):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.growth = growth
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.snapshot_size = 0
+        self.done = threading.Event()
+
+    def run(self):
+        while not self.done.wait(self.interval):
+            current, _ = tracemalloc.get_traced_memory()
+            if current > self.snapshot_size * self.growth:
+                self.snapshot = tracemalloc.take_snapshot()
+                self.snapshot_size, _ = tracemalloc.get_traced_memory()
+
+    def stop(self):
+        self.done.set()
+        self.join()
+
+def top_sites(snapshot: tracemalloc.Snapshot, top: int) -> List[Dict]:
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, threading.__file__),
+        tracemalloc.Filter(False, __file__),
+    ))
+    return [{'site': f'{os.path.relpath(stat.traceback[0].filename, ROOT)}:{stat.traceback[0].lineno}',
+             'size': stat.size, 'count': stat.count}
+            for stat in snapshot.statistics('lineno')[:top]]
+
+def measure(func: Callable, arg=None, top: int = 5) -> Tuple[int, List[Dict]]:
+    ''' Runs func(arg), or func() if arg is None, and returns its peak traced memory and top allocation sites. '''
+    sampler = PeakSampler()
+    tracemalloc.start()
+    try:
+        sampler.start()
+        result = func(arg) if arg is not None else func()
+        sampler.stop()
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot = sampler.snapshot
+        if snapshot is None or sampler.snapshot_size < tracemalloc.get_traced_memory()[0]:
+            snapshot = tracemalloc.take_snapshot()
+    finally:
+        sampler.stop()
+        tracemalloc.stop()
+    return peak, top_sites(snapshot, top)
+
+def measure_day(day: Day, top: int = 5, input_path: Optional[str] = None) -> List[Dict]:
+    input_path = input_path or day.input_path
+    module = load_module(day)
+    results = []
+    for phase, (func, setup) in phase_funcs(module, input_path).items():
+        with silenced():
+            arg = setup() if setup is not None else None
+            peak, sites = measure(func, arg, top)
+        del arg
+        results.append({'year': day.year, 'day': day.day, 'phase': phase,
+                        'input': os.path.relpath(input_path), 'peak': peak, 'sites': sites})
+    return results
+
+def load_budgets(path: str = BUDGETS_PATH) -> Dict[str, Dict[str, int]]:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+def save_budgets(budgets: Dict[str, Dict[str, int]], path: str = BUDGETS_PATH):
+    with open(path, 'w') as f:
+        json.dump(dict(sorted(budgets.items())), f, indent=1)
+        f.write('\n')
+
+def round_budget(peak: int) -> int:
+    ''' Peak with headroom rounded up to whole KiB. '''
+    return max(MIN_BUDGET, -(-int(peak * HEADROOM) // 1024) * 1024)
+
+def format_size(size: int) -> str:
+    for unit in ('B', 'KiB', 'MiB'):
+        if abs(size) < 1024:
+            return f'{size:.1f} {unit}' if unit != 'B' else f'{size} B'
+        size /= 1024
+    return f'{size:.1f} GiB'
+
+def check(results: List[Dict], budgets: Dict[str, Dict[str, int]]) -> List[Dict]:
+    ''' Returns the results with their budget and whether they exceeded it. '''
+    checked = []
+    for r in results:
+        budget = budgets.get(f'{r["year"]}-{r["day"]:02}', {}).get(r['phase'])
+        checked.append({**r, 'budget': budget, 'over': budget is not None and r['peak'] > budget})
+    return checked
+
+def print_results(results: List[Dict]):
+    print(f'{"day":<8} {"phase":<6} {"peak":>12} {"budget":>12}')
+    for r in results:
+        budget = format_size(r['budget']) if r['budget'] is not None else 'none'
+        line = f'{r["year"]}-{r["day"]:02} {r["phase"]:<6} {format_size(r["peak"]):>12} {budget:>12}'
+        if r['over']:
+            line += '  OVER BUDGET'
+        print(line)
+        for site in r['sites']:
+            print(f'    {format_size(site["size"]):>12} {site["count"]:>9} blocks  {site["site"]}')
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m aoc.memory', description=__doc__.split('\n\n')[0])
+    parser.add_argument('days', nargs='*', help="days to measure, e.g. '2025' or '2025:8', default every day")
+    parser.add_argument('-n', '--top', type=int, default=5, help='allocation sites shown per phase')
+    parser.add_argument('-i', '--input', help='input file to use instead of input.txt (single day only)')
+    parser.add_argument('-o', '--output', help='write the results as JSON into this file')
+    parser.add_argument('--budgets', default=BUDGETS_PATH, help='budgets file, default %(default)s')
+    parser.add_argument('--update', action='store_true', help='store the measured peaks as the new budgets')
+    parser.add_argument('--no-history', action='store_true', help='do not record the run in the history database')
+    args = parser.parse_args(argv)
+
+    days = select_cli_days(parser, args.days)
+    if args.input and len(days) != 1:
+        parser.error('--input can only be used with a single day')
+    if args.input and args.update:
+        parser.error('budgets are only recorded for the real inputs')
+
+    results = []
+    for day in days:
+        print(f'Measuring {day.name}..', file=sys.stderr)
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            results.extend(pool.submit(measure_day, day, args.top, args.input).result())
+
+    budgets = load_budgets(args.budgets)
+    if args.update:
+        for r in results:
+            budgets.setdefault(f'{r["year"]}-{r["day"]:02}', {})[r['phase']] = round_budget(r['peak'])
+        save_budgets(budgets, args.budgets)
+
+    checked = check(results, budgets)
+    print_results(checked)
+    if not args.no_history:
+        from aoc.history import record
+        record(results, 'memory')
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(checked, f, indent=1)
+
+    over = [r for r in checked if r['over']]
+    if over:
+        print(f'{len(over)} phases over their memory budget', file=sys.stderr)
+    return 1 if over else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
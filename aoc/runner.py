@@ -0,0 +1,181 @@
+'''
+Runs any subset of the days in a process pool, one day per worker.
+
+    python -m aoc.runner [days..] [-j JOBS] [-o results.json] [--cache]
+
+Every worker imports the solution module and runs its phases just like the
+module's own main() does. The days are started slowest first by the times
+of the previous run, kept in .aoc-run-times.json, so a run of every day
+takes about as long as the slowest day when there are enough cores. A day
+that raises or takes its worker down is reported as failed without
+affecting the other days: a dead worker breaks the whole pool, so the days
+that were not finished then are run again, each in a process of its own.
+'''
+import argparse
+import json
+import math
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from aoc.bench import silenced
+from aoc.days import ROOT, Day, load_module, select_cli_days
+
+RUN_TIMES_PATH = os.path.join(ROOT, '.aoc-run-times.json')
+
+def run_day(day: Day, input_path: Optional[str] = None, cache: bool = False) -> Dict:
+    '''
+    Solves both parts of day and times the phases. The parts share the parsed
+    input in the same order as in main(). Never raises, errors are returned
+    in the result instead.
+    '''
+    result = {'year': day.year, 'day': day.day, 'answers': [None, None],
+              'timings': {}, 'error': None}
+    input_path = input_path or day.input_path
+    phase = 'import'
+    try:
+        with silenced():
+            start = time.perf_counter()
+            module = load_module(day)
+            result['timings'][phase] = time.perf_counter() - start
+
+            phase = 'parse'
+            start = time.perf_counter()
+            if cache:
+                from aoc.cache import cached_load
+                input = cached_load(module, input_path)
+            else:
+                input = module.load(input_path)
+            result['timings'][phase] = time.perf_counter() - start
+
+            for i, part in enumerate((module.part1, module.part2)):
+                phase = f'part{i+1}'
+                start = time.perf_counter()
+                result['answers'][i] = part(input)
+                result['timings'][phase] = time.perf_counter() - start
+    except Exception:
+        result['error'] = f'{phase}: ' + traceback.format_exc().strip().split('\n')[-1]
+    return result
+
+def failed_result(day: Day, error: str) -> Dict:
+    return {'year': day.year, 'day': day.day, 'answers': [None, None],
+            'timings': {}, 'error': error}
+
+def run_isolated(
+        func: Callable,
+        calls: Sequence[Tuple],
+        jobs: int,
+        initializer: Optional[Callable] = None,
+        initargs: Tuple = ()
+) -> List[object]:
+    '''
+    func(*call) for every call in a pool of jobs worker processes, in the
+    order of calls. A call that raises, or whose worker dies, has the
+    exception in place of its result. A dying worker fails every call the
+    pool has not finished with BrokenProcessPool, not just its own, so
+    those are run again each in a process of its own, jobs at a time.
+    '''
+    results: List[object] = [None] * len(calls)
+    unfinished = []
+    with ProcessPoolExecutor(max_workers=min(jobs, len(calls) or 1), initializer=initializer,
+                             initargs=initargs) as pool:
+        futures: List[Future] = [pool.submit(func, *call) for call in calls]
+        for i, future in enumerate(futures):
+            try:
+                results[i] = future.result()
+            except BrokenProcessPool:
+                unfinished.append(i)
+            except Exception as e:
+                results[i] = e
+
+    def alone(i: int) -> object:
+        with ProcessPoolExecutor(max_workers=1, initializer=initializer, initargs=initargs) as pool:
+            try:
+                return pool.submit(func, *calls[i]).result()
+            except Exception as e: # Only this call can have killed the worker now
+                return e
+
+    if unfinished:
+        with ThreadPoolExecutor(max_workers=min(jobs, len(unfinished))) as threads:
+            for i, result in zip(unfinished, threads.map(alone, unfinished)):
+                results[i] = result
+    return results
+
+def load_run_times(path: str = RUN_TIMES_PATH) -> Dict[str, float]:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_run_times(times: Dict[str, float], path: str = RUN_TIMES_PATH):
+    try:
+        with open(path, 'w') as f:
+            json.dump(dict(sorted(times.items())), f, indent=1)
+    except OSError:
+        pass # Only the order of the next run depends on it
+
+def run_days(
+        days: List[Day],
+        jobs: Optional[int] = None,
+        input_path: Optional[str] = None,
+        cache: bool = False
+) -> List[Dict]:
+    ''' Runs the days in a pool of jobs worker processes, results are in the order of days. '''
+    jobs = jobs or os.cpu_count() or 1
+    times = load_run_times()
+    # The slowest days first so they do not start last, days never timed count as the slowest
+    order = sorted(range(len(days)), key=lambda i: -times.get(days[i].name, math.inf))
+    outcomes = run_isolated(run_day, [(days[i], input_path, cache) for i in order], jobs)
+
+    results: List[Dict] = [{}] * len(days)
+    for i, outcome in zip(order, outcomes):
+        if isinstance(outcome, BaseException): # The worker died, e.g. ran out of memory
+            outcome = failed_result(days[i], f'worker: {type(outcome).__name__}: {outcome}')
+        results[i] = outcome
+        if input_path is None and not outcome['error']:
+            times[days[i].name] = sum(outcome['timings'].values())
+    if input_path is None:
+        save_run_times(times)
+    return results
+
+def print_results(results: List[Dict]):
+    print(f'{"day":<8} {"part1":>18} {"part2":>18} {"parse ms":>10} {"part1 ms":>10} {"part2 ms":>10}')
+    for r in results:
+        t = r['timings']
+        times = ' '.join(f'{t[p] * 1000:10.2f}' if p in t else f'{"-":>10}' for p in ('parse', 'part1', 'part2'))
+        answers = ' '.join(f'{str(a):>18}' for a in r['answers'])
+        line = f'{r["year"]}-{r["day"]:02} {answers} {times}'
+        if r['error']:
+            line += f'  FAILED {r["error"]}'
+        print(line)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m aoc.runner', description=__doc__.split('\n\n')[0])
+    parser.add_argument('days', nargs='*', help="days to run, e.g. '2025' or '2025:8', default every day")
+    parser.add_argument('-j', '--jobs', type=int, help='worker processes, default one per core')
+    parser.add_argument('-o', '--output', help='write the results as JSON into this file')
+    parser.add_argument('--cache', action='store_true', help='load parsed inputs from the on-disk cache')
+    args = parser.parse_args(argv)
+
+    days = select_cli_days(parser, args.days)
+    start = time.perf_counter()
+    results = run_days(days, args.jobs, cache=args.cache)
+    elapsed = time.perf_counter() - start
+
+    print_results(results)
+    print(f'{len(days)} days in {elapsed:.2f}s, {sum(1 for r in results if r["error"])} failed')
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=1, default=repr)
+
+    return 1 if any(r['error'] for r in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
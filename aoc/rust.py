@@ -0,0 +1,144 @@
+'''
+Compares the Python solutions with the Rust ones of the days that have both.
+
+    python -m aoc.rust [days..] [--scales 10 100] [--repeat N] [-o out.json]
+
+The Rust crates are built with cargo build --release --offline, a crate that
+does not build is reported and skipped. Both implementations are run on the
+same input files, the real input and the scaled inputs written by
+aoc.generate. The Rust binaries print the nanoseconds spent on each phase to
+stderr, which are compared against the medians of aoc.bench. Days 1 and 2
+only read ./input.txt, so they are run in a directory where input.txt is a
+link to the input.
+'''
+import argparse
+import json
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+from aoc.bench import bench_day, format_ms
+from aoc.days import Day, select_cli_days
+
+TIMINGS_RE = re.compile(r'(parse|prob1|prob2) (\d+)')
+ANSWER_RE = re.compile(r'Prob ([12]): (-?\d+)')
+# Extra arguments a binary needs to run to completion without a terminal
+EXTRA_ARGS = {(2025, 9): ['-d']}
+RUST_PHASES = {'parse': 'parse', 'prob1': 'part1', 'prob2': 'part2'}
+
+def cargo() -> str:
+    return shutil.which('cargo') or os.path.expanduser('~/.cargo/bin/cargo')
+
+def crate_dir(day: Day) -> Optional[str]:
+    if not day.dir.endswith('-python'):
+        return None
+    path = day.dir[:-len('-python')] + '-rust'
+    return path if os.path.exists(os.path.join(path, 'Cargo.toml')) else None
+
+def build(crate: str) -> Tuple[Optional[str], str]:
+    ''' Builds the crate and returns the path of its binary, or None and the cargo error. '''
+    proc = subprocess.run([cargo(), 'build', '--release', '--offline', '--quiet'],
+                          cwd=crate, capture_output=True, text=True)
+    if proc.returncode != 0:
+        lines = [l for l in proc.stderr.splitlines() if l.startswith('error')]
+        return None, lines[0] if lines else proc.stderr.strip()
+    with open(os.path.join(crate, 'Cargo.toml')) as f:
+        name = re.search(r'^name\s*=\s*"([^"]+)"', f.read(), re.M).group(1)
+    return os.path.join(crate, 'target', 'release', name), ''
+
+def run_rust(binary: str, crate: str, day: Day, input_path: str) -> Tuple[Dict[str, float], Dict[str, str]]:
+    ''' Runs the binary once on input_path, returns its phase timings in seconds and answers by part. '''
+    extra = EXTRA_ARGS.get((day.year, day.day), [])
+    with tempfile.TemporaryDirectory() as tmp:
+        if os.path.exists(os.path.join(crate, 'src', 'io')): # Takes the input as an argument
+            args, cwd = [binary, '-i', os.path.abspath(input_path)], crate
+        else:
+            os.symlink(os.path.abspath(input_path), os.path.join(tmp, 'input.txt'))
+            args, cwd = [binary], tmp
+        proc = subprocess.run(args + extra, cwd=cwd, capture_output=True, text=True, check=True)
+    timings = {RUST_PHASES[phase]: int(ns) / 1e9 for phase, ns in TIMINGS_RE.findall(proc.stderr)}
+    answers = {f'part{part}': answer for part, answer in ANSWER_RE.findall(proc.stdout)}
+    return timings, answers
+
+def compare_day(day: Day, binary: str, crate: str, input_path: str, repeat: int) -> List[Dict]:
+    rust_samples: Dict[str, List[float]] = {}
+    for _ in range(repeat):
+        timings, rust_answers = run_rust(binary, crate, day, input_path)
+        for phase, elapsed in timings.items():
+            rust_samples.setdefault(phase, []).append(elapsed)
+
+    results = []
+    for py in bench_day(day, repeat, 0, input_path):
+        phase = py['phase']
+        rust = statistics.median(rust_samples[phase]) if phase in rust_samples else None
+        results.append({
+            'year': day.year, 'day': day.day, 'phase': phase, 'input': py['input'],
+            'python': py['median'], 'rust': rust,
+            'ratio': py['median'] / rust if rust else None,
+            'agree': None if phase not in rust_answers else py['answer'] == rust_answers[phase],
+        })
+    return results
+
+def input_paths(day: Day, scales: List[int]) -> List[str]:
+    paths = [day.input_path]
+    for scale in scales:
+        path = os.path.join(day.dir, f'input-x{scale}.txt')
+        if os.path.exists(path):
+            paths.append(path)
+        else:
+            print(f'{day.name}: no {os.path.basename(path)}, run python -m aoc.generate', file=sys.stderr)
+    return paths
+
+def print_results(results: List[Dict]):
+    print(f'{"day":<8} {"phase":<6} {"input":<14} {"python ms":>10} {"rust ms":>10} {"py/rust":>9}')
+    for r in results:
+        rust = format_ms(r['rust']) if r['rust'] is not None else f'{"-":>10}'
+        ratio = f'{r["ratio"]:8.1f}x' if r['ratio'] is not None else f'{"-":>9}'
+        line = f'{r["year"]}-{r["day"]:02} {r["phase"]:<6} {os.path.basename(r["input"]):<14} ' \
+               f'{format_ms(r["python"])} {rust} {ratio}'
+        if r['agree'] is False:
+            line += '  ANSWERS DIFFER'
+        print(line)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m aoc.rust', description=__doc__.split('\n\n')[0])
+    parser.add_argument('days', nargs='*', help="days to compare, e.g. '2025:8', default every day with a crate")
+    parser.add_argument('-s', '--scales', type=int, nargs='*', default=[],
+                        help='also compare on the generated input-x<scale>.txt inputs')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='runs per implementation and input')
+    parser.add_argument('-o', '--output', help='write the results as JSON into this file')
+    args = parser.parse_args(argv)
+
+    days = [day for day in select_cli_days(parser, args.days) if crate_dir(day)]
+    results = []
+    for day in days:
+        crate = crate_dir(day)
+        print(f'Building {os.path.basename(crate)}..', file=sys.stderr)
+        binary, error = build(crate)
+        if binary is None:
+            print(f'{day.name}: skipped, build failed: {error}', file=sys.stderr)
+            continue
+        for input_path in input_paths(day, args.scales):
+            print(f'Comparing {day.name} on {os.path.basename(input_path)}..', file=sys.stderr)
+            try:
+                results.extend(compare_day(day, binary, crate, input_path, args.repeat))
+            except subprocess.CalledProcessError as e:
+                error = e.stderr.strip() or f'exit status {e.returncode}'
+                print(f'{day.name}: rust failed on {os.path.basename(input_path)}: {error}', file=sys.stderr)
+            except Exception as e:
+                print(f'{day.name}: python failed on {os.path.basename(input_path)}: {type(e).__name__}: {e}', file=sys.stderr)
+
+    print_results(results)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=1)
+    return 1 if any(r['agree'] is False for r in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
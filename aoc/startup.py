@@ -0,0 +1,135 @@
+'''
+Cold start cost of the solution modules, from -X importtime.
+
+    python -m aoc.startup [days..] [--repeat N] [--budget MS] [-n TOP] [-o out.json]
+
+Every day is imported in fresh interpreters started in its directory, as
+python main.py would, without running main(). Runs under -X importtime
+tell which modules the day pulls in beyond a bare interpreter and what
+each costs, the other runs time the whole process. The overhead of a day is
+the median wall time of those runs minus the one of an interpreter
+importing an empty module the same way. One untimed run comes first so the
+bytecode of the imported modules is cached as after any earlier run, even
+when PYTHONDONTWRITEBYTECODE is set.
+
+The wall times vary by several milliseconds from run to run, and so does
+the import time of a single module now and then, so the budget is checked
+against the sum of the median import time of every module over --repeat
+runs. Startup only matters for the fast days, the ones whose parts take
+under FAST_DAY_SECONDS together by their medians in aoc/expected.json, so
+only those are held to the fixed budget. A fast day importing more than the
+budget makes the run exit with 1, the other days are only reported.
+'''
+import argparse
+import json
+import math
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+from aoc.check import PARTS, load_expected
+from aoc.days import Day, select_cli_days
+
+# Runs the module at argv[1] without calling main(), runpy is paid for by the baseline too
+BOOTSTRAP = 'import runpy, sys; runpy.run_path(sys.argv[1], run_name="aoc_startup")'
+IMPORTTIME_RE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)', re.M)
+# Import time allowed per fast day on top of the bare interpreter. Their imports take
+# 1.5-3.5 ms, this leaves room for one of the ~5 ms stalls a busy machine adds now and then
+DEFAULT_BUDGET_MS = 12.0
+# Days whose parts take less than this in total are held to the budget
+FAST_DAY_SECONDS = 0.1
+
+def interpreter(path: str, importtime: bool = False) -> Tuple[float, str]:
+    ''' Imports the module at path in a new interpreter, returns the wall time and stderr. '''
+    flags = ['-X', 'importtime'] if importtime else []
+    # Compiling the sources on every start is not what a normal cold start pays
+    env = {name: value for name, value in os.environ.items() if name != 'PYTHONDONTWRITEBYTECODE'}
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, *flags, '-c', BOOTSTRAP, os.path.abspath(path)],
+                          cwd=os.path.dirname(os.path.abspath(path)), stdout=subprocess.DEVNULL,
+                          stderr=subprocess.PIPE, text=True, check=True, env=env)
+    return time.perf_counter() - start, proc.stderr
+
+def import_times(stderr: str) -> Dict[str, float]:
+    ''' Self time in seconds of every module imported, from the -X importtime output. '''
+    return {name: int(self_us) / 1e6 for self_us, _, _, name in IMPORTTIME_RE.findall(stderr)}
+
+def measure(path: str, repeat: int) -> Tuple[float, Dict[str, float]]:
+    ''' Median wall time of importing the module at path and the median import time of
+        each of its imports over repeat runs.
+    '''
+    interpreter(path) # Writes the bytecode of the imported modules
+    walls = [interpreter(path)[0] for _ in range(repeat)]
+    runs = [import_times(interpreter(path, importtime=True)[1]) for _ in range(repeat)]
+    # A module missing from a run, e.g. imported by a site hook only sometimes, counts as 0 there
+    names = {name for run in runs for name in run}
+    return statistics.median(walls), {name: statistics.median(run.get(name, 0.0) for run in runs)
+                                      for name in names}
+
+def measure_day(day: Day, baseline: Tuple[float, Dict[str, float]], repeat: int, top: int) -> Dict:
+    base_wall, base_imports = baseline
+    wall, imports = measure(day.path, repeat)
+    own = {name: t for name, t in imports.items() if name not in base_imports}
+    return {
+        'year': day.year, 'day': day.day, 'wall': wall, 'overhead': wall - base_wall,
+        'imports': sum(own.values()),
+        'top': sorted(own.items(), key=lambda item: -item[1])[:top],
+    }
+
+def fast_days(days: List[Day]) -> List[Day]:
+    ''' The days whose parts take less than FAST_DAY_SECONDS by their recorded medians. '''
+    expected = load_expected()
+    def total(day: Day) -> float:
+        medians = [expected.get(day.name, {}).get(part, {}).get('median') for part in PARTS]
+        return math.inf if None in medians else sum(medians)
+    return [day for day in days if total(day) < FAST_DAY_SECONDS]
+
+def baseline_measure(repeat: int) -> Tuple[float, Dict[str, float]]:
+    ''' The same measure of an interpreter importing an empty module. '''
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'empty.py')
+        open(path, 'w').close()
+        return measure(path, repeat)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m aoc.startup', description=__doc__.split('\n\n')[0])
+    parser.add_argument('days', nargs='*', help="days to measure, e.g. '2025' or '2025:8', default every day")
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+                        help='timed and importtime interpreter starts per day')
+    parser.add_argument('-b', '--budget', type=float, default=DEFAULT_BUDGET_MS,
+                        help='import time allowed per fast day in ms, default %(default)s')
+    parser.add_argument('-n', '--top', type=int, default=3, help='most expensive imports shown per day')
+    parser.add_argument('-o', '--output', help='write the results as JSON into this file')
+    args = parser.parse_args(argv)
+
+    days = select_cli_days(parser, args.days)
+    fast = set(fast_days(days))
+    baseline = baseline_measure(args.repeat)
+    print(f'bare interpreter {baseline[0] * 1000:.1f} ms, median of {args.repeat} runs per day, '
+          f'import budget {args.budget:g} ms per fast day')
+    print(f'{"day":<8} {"cold ms":>8} {"over ms":>8} {"imports":>8} {"budget":>8}  top imports')
+    results = []
+    for day in days:
+        result = measure_day(day, baseline, args.repeat, args.top)
+        result['budget'] = args.budget if day in fast else None
+        result['over_budget'] = day in fast and result['imports'] * 1000 > args.budget
+        results.append(result)
+        top = ', '.join(f'{name} {t * 1000:.1f}' for name, t in result['top'])
+        budget = f'{args.budget:8g}' if day in fast else f'{"-":>8}'
+        print(f'{day.name} {result["wall"] * 1000:8.1f} {result["overhead"] * 1000:8.1f} '
+              f'{result["imports"] * 1000:8.1f} {budget}  {top}'
+              + ('  OVER BUDGET' if result['over_budget'] else ''))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=1)
+    return 1 if any(r['over_budget'] for r in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,63 @@
+'''
+Disjoint sets of the integers 0..n-1, the union-find structure.
+
+Every set is a tree stored in one flat parent array, identified by its root.
+find compresses the path it walks, and union hangs the smaller tree below
+the larger one, which keeps the trees flat enough that both are close to
+constant time. The size of every set and the number of sets are kept up to
+date, so neither needs a scan.
+'''
+from array import array
+from typing import Dict, List
+
+class UnionFind:
+    __slots__ = ('parent', 'size', 'count')
+
+    def __init__(self, n: int):
+        self.parent = array('I', range(n))
+        self.size = array('I', (1,)) * n
+        # Number of disjoint sets
+        self.count = n
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def find(self, x: int) -> int:
+        ''' Root of the set containing x. '''
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    def union(self, a: int, b: int) -> bool:
+        ''' Merges the sets of a and b, returns False when they already were the same set. '''
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        self.count -= 1
+        return True
+
+    def connected(self, a: int, b: int) -> bool:
+        return self.find(a) == self.find(b)
+
+    def set_size(self, x: int) -> int:
+        ''' Number of elements in the set containing x. '''
+        return self.size[self.find(x)]
+
+    def set_sizes(self) -> List[int]:
+        ''' Sizes of all the sets, one per set in no particular order. '''
+        return [self.size[root] for root in range(len(self)) if self.parent[root] == root]
+
+    def sets(self) -> Dict[int, List[int]]:
+        ''' Elements of every set by root. '''
+        members: Dict[int, List[int]] = {}
+        for x in range(len(self)):
+            members.setdefault(self.find(x), []).append(x)
+        return members
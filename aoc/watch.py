@@ -0,0 +1,194 @@
+'''
+Watch mode re-running a day whenever its solution or input changes.
+
+    python -m aoc.watch 2025:12 [--input big.txt] [--part 2] [--interval 0.5]
+
+The solution module and the input file are polled for changes. The parsed
+input is kept in memory between runs and only parsed again when the input
+file or the code of load changes. After an edit of the solution the module
+is imported again, and only the parts whose code changed are run again: the
+bytecode of part1 and part2 and of the module level functions, classes and
+constants they use is fingerprinted, ignoring line numbers, so editing one
+part or a comment does not rerun the others. Every run is reported with the
+time difference against the previous run of the same phase. Edits of the
+shared aoc modules or the year helpers are not picked up, restart the watch
+for those.
+'''
+import argparse
+import inspect
+import os
+import pickle
+import sys
+import time
+import traceback
+from types import CodeType, FunctionType, ModuleType
+from typing import Dict, List, Optional, Set, Tuple
+
+from aoc.days import Day, load_module, select_cli_days
+
+PHASES = ('load', 'part1', 'part2')
+# Module level values whose repr goes into the fingerprint of the code using them
+DATA_TYPES = (int, float, str, bytes, tuple, list, dict, set, frozenset)
+
+def code_fingerprint(code: CodeType) -> Tuple:
+    ''' What the code does, without its line numbers and file name. '''
+    consts = tuple(code_fingerprint(c) if isinstance(c, CodeType) else c for c in code.co_consts)
+    return (code.co_code, code.co_names, code.co_varnames, consts)
+
+def global_names(code: CodeType) -> Set[str]:
+    ''' Names code and the code nested in it may look up in the module globals. '''
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= global_names(const)
+    return names
+
+def fingerprint(module: ModuleType, name: str) -> int:
+    ''' Hash of the code of the module level object name and of what it uses from the module. '''
+    parts = []
+    seen: Set[str] = set()
+    pending = [name]
+    while pending:
+        name = pending.pop()
+        if name in seen or name not in vars(module):
+            continue
+        seen.add(name)
+        value = vars(module)[name]
+        codes = []
+        if isinstance(value, FunctionType) and value.__module__ == module.__name__:
+            codes.append(inspect.unwrap(value).__code__)
+        elif isinstance(value, type) and value.__module__ == module.__name__:
+            parts.append((name, value.__qualname__))
+            codes.extend(attr.__code__ for attr in vars(value).values() if isinstance(attr, FunctionType))
+        elif isinstance(value, DATA_TYPES):
+            parts.append((name, repr(value)))
+        for code in codes:
+            parts.append((name, code_fingerprint(code)))
+            pending.extend(global_names(code))
+    return hash(tuple(sorted(parts, key=repr)))
+
+def fingerprints(module: ModuleType) -> Dict[str, int]:
+    return {phase: fingerprint(module, phase) for phase in PHASES}
+
+def mtime(path: str) -> Optional[Tuple[float, int]]:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime, stat.st_size
+
+def reload(day: Day) -> ModuleType:
+    ''' Imports the solution module of day again from its file. '''
+    sys.modules.pop(day.module_name, None)
+    return load_module(day)
+
+def format_delta(elapsed: float, previous: Optional[float]) -> str:
+    line = f'{elapsed * 1000:10.3f} ms'
+    if previous:
+        delta = elapsed - previous
+        line += f'  ({delta * 1000:+.3f} ms, {delta / previous:+.1%})'
+    return line
+
+class Watcher:
+    def __init__(self, day: Day, input_path: str, parts: List[int]):
+        self.day = day
+        self.input_path = input_path
+        self.parts = parts
+        self.module: Optional[ModuleType] = None
+        self.prints: Dict[str, int] = {}
+        self.input = None
+        self.snapshot: Optional[bytes] = None # Pickled parsed input, so every part gets a fresh copy
+        self.times: Dict[str, float] = {}
+        self.answers: Dict[str, object] = {}
+
+    def timed(self, phase: str, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        print(f'{self.day.name} {phase:<5} {format_delta(elapsed, self.times.get(phase))}')
+        self.times[phase] = elapsed
+        return result
+
+    def parse(self):
+        self.input = self.timed('load', self.module.load, self.input_path)
+        try:
+            self.snapshot = pickle.dumps(self.input, pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            self.snapshot = None
+
+    def fresh_input(self):
+        ''' A copy of the parsed input, parsed again when it can not be unpickled. '''
+        if self.snapshot is not None:
+            try:
+                return pickle.loads(self.snapshot)
+            except Exception:
+                pass
+        return self.module.load(self.input_path)
+
+    def update(self, source_changed: bool, input_changed: bool):
+        ''' Runs again what the changes may affect. '''
+        if source_changed or self.module is None:
+            module = reload(self.day)
+            prints = fingerprints(module)
+            changed = {phase for phase in PHASES if prints[phase] != self.prints.get(phase)}
+            self.module, self.prints = module, prints
+        else:
+            changed = set()
+        if input_changed or 'load' in changed or self.input is None:
+            self.parse()
+            changed |= set(PHASES)
+
+        for part in self.parts:
+            phase = f'part{part}'
+            if phase not in changed:
+                continue
+            answer = self.timed(phase, getattr(self.module, phase), self.fresh_input())
+            previous = self.answers.get(phase, answer)
+            self.answers[phase] = answer
+            print(f'{self.day.name} {phase} answer: {answer}' + (f' (was {previous})' if previous != answer else ''))
+        if not changed:
+            print(f'{self.day.name}: no code of load or the parts changed')
+
+def watch(day: Day, input_path: str, parts: List[int], interval: float):
+    watcher = Watcher(day, input_path, parts)
+    stamps = {day.path: None, input_path: None}
+    print(f'Watching {day.path} and {input_path}, Ctrl-C to stop', file=sys.stderr)
+    while True:
+        current = {path: mtime(path) for path in stamps}
+        source_changed = current[day.path] != stamps[day.path]
+        input_changed = current[input_path] != stamps[input_path]
+        if source_changed or input_changed:
+            stamps = current
+            try:
+                watcher.update(source_changed, input_changed)
+            except Exception:
+                traceback.print_exc()
+                # The failed step is tried again after the next change
+                if source_changed:
+                    watcher.module = None
+                if input_changed:
+                    watcher.input = None
+            print('---', file=sys.stderr)
+        time.sleep(interval)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m aoc.watch', description=__doc__.split('\n\n')[0])
+    parser.add_argument('day', help="day to watch, e.g. '2025:12'")
+    parser.add_argument('-i', '--input', help='input file to use instead of input.txt')
+    parser.add_argument('-p', '--part', type=int, choices=(1, 2), help='only run this part')
+    parser.add_argument('--interval', type=float, default=0.5, help='seconds between polls, default %(default)s')
+    args = parser.parse_args(argv)
+
+    days = select_cli_days(parser, [args.day])
+    if len(days) != 1:
+        parser.error('select a single day')
+    day = days[0]
+    try:
+        watch(day, args.input or day.input_path, [args.part] if args.part else [1, 2], args.interval)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
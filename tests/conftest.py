@@ -0,0 +1,21 @@
+import os
+import sys
+
+import pytest
+
+# The tests import the shared aoc modules from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def pytest_addoption(parser):
+    parser.addoption('--slow', action='store_true', help='also run the tests marked slow')
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', 'slow: takes seconds to minutes, only run with --slow')
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption('--slow'):
+        return
+    skip = pytest.mark.skip(reason='slow, run with --slow')
+    for item in items:
+        if 'slow' in item.keywords:
+            item.add_marker(skip)
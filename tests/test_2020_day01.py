@@ -0,0 +1,49 @@
+import math
+import random
+from itertools import combinations
+
+import pytest
+
+import aoc.ksum
+from aoc.days import load_module, select_days
+from aoc.ksum import SumIndex
+
+day1 = load_module(select_days(['2020:1'])[0])
+
+def brute_force_products(values, targets, k):
+    ''' Whether any k entries add up to each target, and the products of those that do. '''
+    products = {t: set() for t in targets}
+    for c in combinations(values, k):
+        if sum(c) in products:
+            products[sum(c)].add(math.prod(c))
+    return products
+
+@pytest.mark.parametrize('max_table', [0, aoc.ksum.MAX_TABLE])
+def test_products_duplicates(monkeypatch, max_table):
+    monkeypatch.setattr(aoc.ksum, 'MAX_TABLE', max_table)
+    # 1010 + 1010 only counts when 1010 is there twice
+    assert day1.products(SumIndex([1010, 7]), [2020, 1017]) == {2020: None, 1017: 1010 * 7}
+    assert day1.products(SumIndex([1010, 7, 1010]), [2020, 14]) == {2020: 1010 * 1010, 14: None}
+    assert day1.products(SumIndex([5, 5, 5]), [15, 10], 3) == {15: 125, 10: None}
+
+@pytest.mark.parametrize('max_table', [0, aoc.ksum.MAX_TABLE])
+def test_products_without_solutions(monkeypatch, max_table):
+    monkeypatch.setattr(aoc.ksum, 'MAX_TABLE', max_table)
+    assert day1.products(SumIndex([1, 2, 4]), [0, 8, 2020]) == {0: None, 8: None, 2020: None}
+    assert day1.products(SumIndex([1, 2]), [3], 3) == {3: None}
+    assert day1.products(SumIndex([]), [0, 1]) == {0: None, 1: None}
+
+@pytest.mark.parametrize('max_table', [0, aoc.ksum.MAX_TABLE])
+@pytest.mark.parametrize('k', [2, 3])
+def test_products_match_brute_force(monkeypatch, max_table, k):
+    monkeypatch.setattr(aoc.ksum, 'MAX_TABLE', max_table)
+    rng = random.Random(k)
+    for _ in range(50):
+        values = [rng.randint(0, 15) for _ in range(rng.randint(0, 9))]
+        targets = range(0, 40, 2)
+        expected = brute_force_products(values, targets, k)
+        for target, product in day1.products(SumIndex(values), targets, k).items():
+            if expected[target]:
+                assert product in expected[target]
+            else:
+                assert product is None
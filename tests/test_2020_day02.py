@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from aoc.days import load_module, select_days
+
+day2 = load_module(select_days(['2020:2'])[0])
+
+EXAMPLE = '1-3 a: abcde\n1-3 b: cdefg\n2-9 c: ccccccccc\n'
+
+def random_log(rng, lines):
+    records = []
+    for _ in range(lines):
+        low = rng.randint(1, 5)
+        high = rng.randint(low, 12)
+        passwd = ''.join(rng.choice('abc') for _ in range(rng.randint(high, high + 5)))
+        records.append(f'{low}-{high} {rng.choice("abc")}: {passwd}\n')
+    return ''.join(records)
+
+@pytest.fixture
+def write(tmp_path):
+    def write(text):
+        path = tmp_path / 'input.txt'
+        path.write_bytes(text.encode())
+        return str(path)
+    return write
+
+def parsed(path):
+    policies = day2.parse(path)
+    return day2.part1(policies), day2.part2(policies)
+
+def test_example(write):
+    assert parsed(write(EXAMPLE)) == (2, 1)
+
+# Chunks of 1 byte end at every newline, 7 and 20 bytes fall in the middle of a record
+# and the chunk has to be carried on to the end of it
+@pytest.mark.parametrize('chunk_size', [1, 7, 20, len(EXAMPLE) // 2, 1 << 22])
+def test_stream_matches_parse_on_example(write, chunk_size):
+    path = write(EXAMPLE)
+    assert day2.stream(path, 1, chunk_size) == parsed(path) == (2, 1)
+
+@pytest.mark.parametrize('chunk_size', [1, 13, 64, 1000, 1 << 22])
+def test_stream_matches_parse(write, chunk_size):
+    path = write(random_log(random.Random(chunk_size), 200))
+    assert day2.stream(path, 2, chunk_size) == parsed(path)
+
+def test_stream_without_final_newline(write):
+    path = write(EXAMPLE.rstrip('\n'))
+    assert day2.stream(path, 1, 7) == parsed(path) == (2, 1)
+
+def test_empty_file(write):
+    path = write('')
+    assert day2.stream(path, 1) == parsed(path) == (0, 0)
@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+from aoc.days import load_module, select_days
+
+day3 = load_module(select_days(['2020:3'])[0])
+
+SLOPES = ((1, 1), (1, 3), (1, 5), (1, 7), (2, 1), (3, 2), (5, 11))
+
+EXAMPLE = '''..##.......
+#...#...#..
+.#....#..#.
+..#.#...#.#
+.#...##..#.
+..#.##.....
+.#.#.#....#
+.#........#
+#.##...#...
+#...##....#
+.#..#...#.#
+'''
+
+def travel(map, dy, dx):
+    ''' The counter the streaming one replaced, on a list of str rows. '''
+    y_max, x_max = len(map), len(map[0])
+    x = 0
+    trees = 0
+    for y in range(0, y_max, dy):
+        if map[y][x] == '#':
+            trees += 1
+        x = (x + dx) % x_max
+    return trees
+
+@pytest.fixture
+def write(tmp_path):
+    def write(text, newline='\n'):
+        path = tmp_path / 'input.txt'
+        path.write_bytes(text.replace('\n', newline).encode())
+        return str(path)
+    return write
+
+@pytest.mark.parametrize('newline', ['\n', '\r\n'])
+def test_example(write, newline):
+    path = write(EXAMPLE, newline)
+    assert day3.part1(day3.load(path)) == 7
+    assert day3.part2(day3.load(path)) == 336
+
+@pytest.mark.parametrize('seed', range(20))
+@pytest.mark.parametrize('newline', ['\n', '\r\n'])
+def test_matches_travel(write, seed, newline):
+    rng = random.Random(seed)
+    width = rng.randint(1, 40)
+    rows = [''.join(rng.choice('.#') for _ in range(width)) for _ in range(rng.randint(1, 60))]
+    path = write(''.join(row + '\n' for row in rows), newline)
+    assert day3.count_trees_in_file(path, SLOPES) == [travel(rows, dy, dx) for dy, dx in SLOPES]
+
+def test_empty_file(write):
+    path = write('')
+    assert day3.count_trees_in_file(path, SLOPES) == [0] * len(SLOPES)
+    assert day3.part1(day3.load(path)) == 0
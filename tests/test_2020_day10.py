@@ -0,0 +1,33 @@
+import random
+
+import pytest
+
+from aoc.days import load_module, select_days
+
+day10 = load_module(select_days(['2020:10'])[0])
+
+@pytest.mark.parametrize('data', [
+    [1],
+    [3],
+    [1, 2, 3],
+    [16, 10, 15, 5, 1, 11, 7, 19, 6, 12, 4],
+    [1, 1, 2, 2, 3],
+    [2, 2, 2, 5, 5, 6],
+])
+def test_bottom_up_matches_recursive(data):
+    assert day10.part2(data) == day10.part2(data, recursive=True)
+
+def test_examples():
+    assert day10.part2([16, 10, 15, 5, 1, 11, 7, 19, 6, 12, 4]) == 8
+    assert day10.part2([28, 33, 18, 42, 31, 14, 46, 20, 48, 47, 24, 23, 49, 45, 19, 38,
+                        39, 11, 1, 32, 25, 35, 8, 17, 7, 9, 4, 2, 34, 10, 3]) == 19208
+
+@pytest.mark.parametrize('seed', range(30))
+def test_random_chains_with_duplicates(seed):
+    rng = random.Random(seed)
+    joltage, data = 0, []
+    for _ in range(rng.randint(1, 40)):
+        joltage += rng.randint(1, 3)
+        data.extend([joltage] * rng.choice([1, 1, 1, 2, 3]))
+    rng.shuffle(data)
+    assert day10.part2(data) == day10.part2(data, recursive=True)
@@ -0,0 +1,36 @@
+import random
+
+import pytest
+
+from aoc.days import load_module, select_days
+from aoc.grid import Grid
+
+day07 = load_module(select_days(['2025:7'])[0])
+
+def grid(lines):
+    return Grid.from_lines(lines, day07.CODES, pad=1, border=day07.CellEnum.BORDER)
+
+def random_lines(rng, width, height):
+    start = rng.randrange(width)
+    lines = ['.' * start + 'S' + '.' * (width - start - 1)]
+    for _ in range(height - 1):
+        row = []
+        for _ in range(width):
+            # Splitters side by side would send the recursive version back and forth forever
+            row.append('^' if (not row or row[-1] != '^') and rng.random() < 0.3 else '.')
+        lines.append(''.join(row))
+    return lines
+
+def test_example():
+    assert day07.part2(grid(day07.test_input)) == 40
+    assert day07.part2(grid(day07.test_input), recursive=True) == 40
+
+@pytest.mark.parametrize('seed', range(40))
+def test_bottom_up_matches_recursive(seed):
+    rng = random.Random(seed)
+    lines = random_lines(rng, rng.randint(1, 12), rng.randint(1, 12))
+    assert day07.part2(grid(lines)) == day07.part2(grid(lines), recursive=True)
+
+def test_splitters_at_the_edges():
+    lines = ['S..', '^.^', '.^.', '^.^']
+    assert day07.part2(grid(lines)) == day07.part2(grid(lines), recursive=True)
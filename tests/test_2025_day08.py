@@ -0,0 +1,45 @@
+import math
+import random
+from itertools import combinations
+
+import pytest
+
+from aoc.days import load_module, select_days
+from aoc.unionfind import UnionFind
+
+day08 = load_module(select_days(['2025:8'])[0])
+
+def kruskal(boxes, connections_cnt=None):
+    ''' The original solution, every pair sorted by distance. '''
+    pairs = sorted((math.dist(a, b), i, j) for (i, a), (j, b) in combinations(enumerate(boxes), 2))
+    circuits = UnionFind(len(boxes))
+    if connections_cnt is not None:
+        for _, a, b in pairs[:connections_cnt]:
+            circuits.union(a, b)
+        return math.prod(sorted(circuits.set_sizes(), reverse=True)[:3])
+    last = None
+    for _, a, b in pairs:
+        if circuits.union(a, b):
+            last = (a, b)
+    return -1 if last is None else boxes[last[0]].x * boxes[last[1]].x
+
+def random_boxes(rng, n):
+    # Unique coordinates from a wide range make equal distances unlikely
+    return [day08.Point3D(*(rng.randrange(100000) for _ in range(3))) for _ in range(n)]
+
+def test_example():
+    boxes = [day08.line_parser(line) for line in day08.test_input]
+    assert day08.part1(boxes, 10) == 40
+    assert day08.part2(boxes) == 25272
+
+@pytest.mark.parametrize('seed', range(20))
+def test_matches_sorting_every_pair(seed):
+    rng = random.Random(seed)
+    boxes = random_boxes(rng, rng.randint(2, 60))
+    for connections_cnt in (1, 5, 40, 10000):
+        assert day08.part1(boxes, connections_cnt) == kruskal(boxes, connections_cnt)
+    assert day08.part2(boxes) == kruskal(boxes)
+
+def test_too_few_boxes():
+    assert day08.part2([]) == -1
+    assert day08.part2(random_boxes(random.Random(0), 1)) == -1
@@ -0,0 +1,19 @@
+import pytest
+
+from aoc.days import load_module, select_days
+
+DAY = select_days(['2025:12'])[0]
+day12 = load_module(DAY)
+
+# Regions of the test input in which all their presents fit
+TEST_INPUT_FITS = 2
+
+def test_part1_with_calibration_passed_in():
+    calibrated = (day12.parse_input(day12.test_input), TEST_INPUT_FITS)
+    assert day12.part1(day12.load(DAY.input_path), calibrated) == 472
+
+@pytest.mark.slow
+def test_calibration():
+    input_test, fits_cnt = day12.calibration()
+    assert input_test.regions == day12.parse_input(day12.test_input).regions
+    assert fits_cnt == TEST_INPUT_FITS
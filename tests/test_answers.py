@@ -0,0 +1,19 @@
+import pytest
+
+from aoc.check import PARTS, check_result, load_expected
+from aoc.days import all_days
+from aoc.runner import run_day
+
+EXPECTED = load_expected()
+# Days whose parts take longer than this in total by their recorded medians only run with --slow
+SLOW_SECONDS = 1.0
+
+def day_param(day):
+    medians = EXPECTED.get(day.name, {})
+    total = sum(medians.get(part, {}).get('median', 0) for part in PARTS)
+    marks = [pytest.mark.slow] if total > SLOW_SECONDS else []
+    return pytest.param(day, id=day.name, marks=marks)
+
+@pytest.mark.parametrize('day', [day_param(day) for day in all_days()])
+def test_answers(day):
+    assert check_result(day, run_day(day), EXPECTED) == []
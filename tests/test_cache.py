@@ -0,0 +1,35 @@
+import os
+from types import ModuleType
+
+from aoc.cache import cached_load
+
+def counting_module(name):
+    module = ModuleType(name)
+    module.calls = 0
+    def load(filename):
+        module.calls += 1
+        with open(filename) as f:
+            return f.read().split()
+    module.load = load
+    return module
+
+def test_hit_and_invalidation(tmp_path):
+    path = tmp_path / 'input.txt'
+    path.write_text('a b')
+    module = counting_module('aoc_2025_11')
+    cache_dir = str(tmp_path / 'cache')
+    assert cached_load(module, str(path), cache_dir) == ['a', 'b']
+    assert cached_load(module, str(path), cache_dir) == ['a', 'b']
+    assert module.calls == 1
+    path.write_text('a b c')
+    assert cached_load(module, str(path), cache_dir) == ['a', 'b', 'c']
+    assert module.calls == 2
+
+def test_fast_parsers_are_not_cached(tmp_path):
+    path = tmp_path / 'input.txt'
+    path.write_text('a')
+    module = counting_module('aoc_2025_04')
+    cache_dir = str(tmp_path / 'cache')
+    cached_load(module, str(path), cache_dir)
+    cached_load(module, str(path), cache_dir)
+    assert module.calls == 2 and not os.path.exists(cache_dir)
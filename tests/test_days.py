@@ -0,0 +1,23 @@
+import argparse
+
+import pytest
+
+from aoc.days import parse_selection, select_cli_days, select_days
+
+def test_parse_selection():
+    assert parse_selection(['2025', '2025:8', '2020/1']) == [(2025, None), (2025, 8), (2020, 1)]
+    with pytest.raises(ValueError):
+        parse_selection(['2025:x'])
+
+def test_select_days():
+    assert [day.name for day in select_days(['2020:3', '2025/1'])] == ['2020-03', '2025-01']
+    assert all(day.year == 2025 for day in select_days(['2025']))
+    with pytest.raises(ValueError):
+        select_days(['2020:99'])
+
+@pytest.mark.parametrize('spec', ['2020:99', '1999', 'x'])
+def test_select_cli_days_reports_usage_errors(spec, capsys):
+    with pytest.raises(SystemExit) as exit:
+        select_cli_days(argparse.ArgumentParser(prog='tool'), [spec])
+    assert exit.value.code == 2
+    assert 'tool: error:' in capsys.readouterr().err
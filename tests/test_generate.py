@@ -0,0 +1,17 @@
+import random
+
+from aoc.generate import gen_2025_12
+
+def test_2025_12_regions_fit_as_boxes_or_overflow():
+    lines = list(gen_2025_12(random.Random(0), 1))
+    shapes = [sum(row.count('#') for row in lines[i * 5 + 1:i * 5 + 4]) for i in range(6)]
+    fitting = 0
+    for line in lines[30:]:
+        size, counts = line.split(': ')
+        width, height = map(int, size.split('x'))
+        counts = list(map(int, counts.split()))
+        if sum(counts) <= (width // 3) * (height // 3):
+            fitting += 1
+        else:
+            assert sum(c * cells for c, cells in zip(counts, shapes)) > width * height
+    assert 400 < fitting < 600
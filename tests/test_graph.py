@@ -0,0 +1,46 @@
+import pytest
+
+from aoc.graph import GraphBuilder
+
+def diamond(weighted=False):
+    builder = GraphBuilder(weighted=weighted)
+    for source, target, weight in (('a', 'b', 2), ('a', 'c', 3), ('b', 'd', 4), ('c', 'd', 5)):
+        builder.edge(source, target, weight)
+    return builder.build()
+
+def test_structure():
+    graph = diamond()
+    a, d = graph.ids['a'], graph.ids['d']
+    assert len(graph) == 4 and graph.edge_count == 4
+    assert 'c' in graph and 'x' not in graph
+    assert sorted(graph.names[v] for v in graph.successors(a)) == ['b', 'c']
+    assert list(graph.successors(d)) == []
+    assert sorted(graph.names[v] for v in graph.reversed().successors(d)) == ['b', 'c']
+
+def test_topological_order_and_cycles():
+    graph = diamond()
+    position = {u: i for i, u in enumerate(graph.topological_order())}
+    for u in range(len(graph)):
+        assert all(position[u] < position[v] for v in graph.successors(u))
+
+    builder = GraphBuilder()
+    builder.edge('x', 'y')
+    builder.edge('y', 'x')
+    with pytest.raises(ValueError):
+        builder.build().topological_order()
+
+def test_reachable_and_path_counts():
+    graph = diamond()
+    ids = graph.ids
+    seen = graph.reachable([ids['b']])
+    assert {graph.names[u] for u in range(len(graph)) if seen[u]} == {'b', 'd'}
+    assert graph.path_counts(ids['d'])[ids['a']] == 2
+
+def test_weighted_sums():
+    graph = diamond(weighted=True)
+    sums = graph.weighted_sums()
+    # 1 + 2 * (1 + 4) + 3 * (1 + 5)
+    assert sums[graph.ids['a']] == 29
+    assert sums[graph.ids['d']] == 1
+    assert sorted(graph.edges(graph.ids['a'])) == sorted([(graph.ids['b'], 2), (graph.ids['c'], 3)])
+    assert list(diamond().edges(graph.ids['b'])) == [(graph.ids['d'], 1)]
@@ -0,0 +1,63 @@
+import pytest
+
+from aoc.grid import DIRECTIONS8, Grid
+
+CODES = {'.': 0, '#': 1, 'L': 2}
+LINES = ['.#L', 'L.#']
+
+@pytest.mark.parametrize('typecode', ['b', 'B', 'h', 'H', 'i', 'I', 'l', 'L', 'q', 'Q'])
+@pytest.mark.parametrize('pad', [0, 1])
+def test_from_lines_typecodes(typecode, pad):
+    grid = Grid.from_lines(LINES, CODES, pad=pad, border=2, typecode=typecode)
+    assert list(grid.row(0)) == [0, 1, 2]
+    assert list(grid.row(1)) == [2, 0, 1]
+    assert grid[1, 2] == 1
+    assert grid.to_lines({0: '.', 1: '#', 2: 'L'}) == LINES
+    if pad:
+        assert grid.cells[0] == 2 and grid.cells[-1] == 2
+
+def test_from_bytes_lines():
+    assert Grid.from_lines([b'.#', b'#.'], CODES).to_lines({0: '.', 1: '#'}) == ['.#', '#.']
+
+def test_unknown_and_ragged_rows():
+    with pytest.raises(ValueError):
+        Grid.from_lines(['.x'], CODES)
+    with pytest.raises(ValueError):
+        Grid.from_lines(['..', '.'], CODES)
+
+def test_offsets_follow_directions():
+    grid = Grid.from_lines(['...', '.#.', '...'], CODES, pad=1)
+    centre = grid.index(1, 1)
+    assert grid.offsets8 == grid.offsets(DIRECTIONS8)
+    neighbours = {grid.coords(centre + o) for o in grid.offsets8}
+    assert neighbours == {(y, x) for y in range(3) for x in range(3)} - {(1, 1)}
+    assert sum(grid.cells[centre + o] for o in grid.offsets4) == 0
+
+def test_copy_and_count():
+    grid = Grid.from_lines(LINES, CODES, pad=1, border=1)
+    copy = grid.copy()
+    copy[0, 0] = 1
+    assert grid[0, 0] == 0 and copy[0, 0] == 1
+    assert grid.count(1) == 2 and copy.count(1) == 3
+    assert copy.offsets8 == grid.offsets8
+
+@pytest.mark.parametrize('lines', [[], [''], [b''], ['', '']])
+@pytest.mark.parametrize('pad', [0, 1])
+def test_empty_grid(lines, pad):
+    grid = Grid.from_lines(lines, CODES, pad=pad)
+    assert (grid.height, grid.width) == (0, 0)
+    assert list(grid.row_starts()) == [] and list(grid.interior()) == []
+    assert grid.count(0) == 0 and grid.to_lines({}) == []
+    assert grid.copy().height == 0
+
+def test_zero_width_rows_must_all_be_empty():
+    with pytest.raises(ValueError):
+        Grid.from_lines(['', '.'], CODES)
+
+@pytest.mark.parametrize('typecode', ['h', 'i', 'q'])
+def test_codes_wider_than_a_byte(typecode):
+    codes = {'.': -1, '#': 1000, 'L': 300}
+    grid = Grid.from_lines(LINES, codes, pad=1, border=-2, typecode=typecode)
+    assert list(grid.row(0)) == [-1, 1000, 300]
+    assert list(grid.row(1)) == [300, -1, 1000]
+    assert grid.cells[0] == -2
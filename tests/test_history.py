@@ -0,0 +1,65 @@
+import sqlite3
+
+import pytest
+
+import aoc.history
+from aoc.history import commit_samples, compare, connect, permutation_pvalue, record, trends
+
+BASE, HEAD = 'a' * 40, 'b' * 40
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(aoc.history, 'git_state', lambda: (HEAD, False))
+    return str(tmp_path / 'history.sqlite')
+
+def record_run(monkeypatch, path, samples, commit=HEAD, python='3.11.7', implementation='CPython', cached=False):
+    monkeypatch.setattr(aoc.history, 'git_state', lambda: (commit, False))
+    monkeypatch.setattr(aoc.history.platform, 'python_version', lambda: python)
+    monkeypatch.setattr(aoc.history.platform, 'python_implementation', lambda: implementation)
+    result = {'year': 2025, 'day': 1, 'phase': 'parse', 'input': 'input.txt', 'input_bytes': 100,
+              'samples': samples, 'cached': cached}
+    return record([result], 'bench', path)
+
+def test_environments_are_never_pooled(monkeypatch, db_path):
+    record_run(monkeypatch, db_path, [1.0, 1.1])
+    record_run(monkeypatch, db_path, [1.2])
+    record_run(monkeypatch, db_path, [5.0], python='3.12.1')
+    record_run(monkeypatch, db_path, [6.0], implementation='PyPy')
+    record_run(monkeypatch, db_path, [0.1], cached=True)
+    with connect(db_path) as db:
+        samples = commit_samples(db, HEAD, False, [])
+        series = trends(db, [], last=10)
+    assert sorted(samples.values()) == [[0.1], [1.0, 1.1, 1.2], [5.0], [6.0]]
+    assert {key[5:] for key in samples} == {('3.11.7', 'CPython', 0), ('3.11.7', 'CPython', 1),
+                                            ('3.12.1', 'CPython', 0), ('3.11.7', 'PyPy', 0)}
+    assert len(series) == 4
+
+def test_compare_only_matching_environments(monkeypatch, db_path):
+    record_run(monkeypatch, db_path, [1.0] * 5, commit=BASE)
+    record_run(monkeypatch, db_path, [0.1] * 5, commit=BASE, cached=True)
+    record_run(monkeypatch, db_path, [9.0] * 5, commit=HEAD, python='3.12.1')
+    record_run(monkeypatch, db_path, [1.0, 1.01, 0.99, 1.0, 1.02], commit=HEAD)
+    with connect(db_path) as db:
+        compared = compare(commit_samples(db, BASE, False, []), commit_samples(db, HEAD, False, []), 0.05, 1.05)
+    assert len(compared) == 1
+    assert compared[0]['key'][5:] == ('3.11.7', 'CPython', 0)
+    assert not compared[0]['slower']
+
+def test_old_database_gets_cached_column(tmp_path):
+    path = str(tmp_path / 'old.sqlite')
+    db = sqlite3.connect(path)
+    db.execute('CREATE TABLE runs (id INTEGER PRIMARY KEY, timestamp REAL NOT NULL, tool TEXT NOT NULL, '
+               'git_commit TEXT, dirty INTEGER NOT NULL, python TEXT NOT NULL, implementation TEXT NOT NULL)')
+    db.execute("INSERT INTO runs VALUES (1, 0, 'bench', NULL, 0, '3.11.7', 'CPython')")
+    db.commit()
+    db.close()
+    with connect(path) as db:
+        assert db.execute('SELECT cached FROM runs').fetchall() == [(0,)]
+
+def test_permutation_pvalue():
+    base = [1.0, 1.02, 0.98, 1.01, 0.99]
+    assert permutation_pvalue(base, [2.0, 2.1, 1.9, 2.05, 1.95]) < 0.01
+    assert permutation_pvalue(base, [0.5, 0.51, 0.49, 0.5, 0.52]) > 0.99
+    assert permutation_pvalue(base, base) > 0.3
+    # Too many splits to enumerate, estimated from random ones
+    assert permutation_pvalue(base * 5, [v * 2 for v in base] * 5) < 0.01
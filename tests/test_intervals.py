@@ -0,0 +1,30 @@
+import random
+
+from aoc.intervals import IntervalSet
+
+def test_merging():
+    ranges = IntervalSet([(10, 14), (3, 5), (16, 20), (12, 18), (6, 6), (9, 8)])
+    assert list(ranges) == [(3, 6), (10, 20)]
+    assert len(ranges) == 2 and ranges.covered() == 15
+
+def test_membership():
+    ranges = IntervalSet([(3, 5), (10, 20)])
+    assert [v in ranges for v in (2, 3, 5, 6, 9, 10, 20, 21)] == [False, True, True, False, False, True, True, False]
+    assert ranges.count_contained([1, 4, 4, 15, 30]) == 3
+
+def test_add_matches_construction():
+    rng = random.Random(1)
+    for _ in range(200):
+        pairs = [(low, low + rng.randint(-1, 6)) for low in (rng.randint(0, 40) for _ in range(rng.randint(0, 8)))]
+        incremental = IntervalSet()
+        for low, high in pairs:
+            incremental.add(low, high)
+        assert incremental == IntervalSet(pairs)
+        values = {v for low, high in pairs for v in range(low, high + 1)}
+        assert incremental.covered() == len(values)
+
+def test_intersection():
+    a = IntervalSet([(0, 5), (10, 15), (20, 30)])
+    b = IntervalSet([(3, 12), (14, 22)])
+    assert list(a & b) == [(3, 5), (10, 12), (14, 15), (20, 22)]
+    assert list(a & IntervalSet()) == []
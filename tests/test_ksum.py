@@ -0,0 +1,43 @@
+import random
+from itertools import combinations
+
+import pytest
+
+import aoc.ksum
+from aoc.ksum import SumIndex
+
+def brute_force(values, target, k):
+    return sorted(c for c in combinations(range(len(values)), k) if sum(values[i] for i in c) == target)
+
+@pytest.mark.parametrize('max_table', [0, aoc.ksum.MAX_TABLE])
+def test_find_all_matches_brute_force(monkeypatch, max_table):
+    monkeypatch.setattr(aoc.ksum, 'MAX_TABLE', max_table)
+    rng = random.Random(2)
+    for _ in range(100):
+        values = [rng.randint(-5, 12) for _ in range(rng.randint(1, 8))]
+        index = SumIndex(values)
+        for k in range(1, min(len(values), 5) + 1):
+            for target in range(-10, 30, 3):
+                assert sorted(index.find_all(target, k)) == brute_force(values, target, k)
+
+def test_find():
+    index = SumIndex([1721, 979, 366, 299, 675, 1456])
+    assert index.find(2020) == (0, 3)
+    assert index.find(2020, 3) == (1, 2, 4)
+    assert index.find(1) is None
+    assert SumIndex([]).find(0) is None
+    with pytest.raises(ValueError):
+        index.find(2020, 0)
+
+def test_duplicates_need_enough_occurrences():
+    assert SumIndex([5, 1]).find(10) is None
+    assert SumIndex([5, 1, 5]).find(10) == (0, 2)
+    assert SumIndex([5, 5, 5]).count(5) == 3
+
+@pytest.mark.parametrize('max_table', [0, aoc.ksum.MAX_TABLE])
+def test_find_many(monkeypatch, max_table):
+    monkeypatch.setattr(aoc.ksum, 'MAX_TABLE', max_table)
+    index = SumIndex([3, 8, 8, 1, 12])
+    targets = range(0, 30)
+    assert index.find_many(targets) == {t: index.find(t) for t in targets}
+    assert index.find_many(targets, 3) == {t: index.find(t, 3) for t in targets}
@@ -0,0 +1,70 @@
+import re
+
+import pytest
+
+from aoc.grid import Grid
+from aoc.loader import (byte_ranges, char_ints, filemap, ifilemap, imatches, int_tuples, ints,
+                        records)
+
+TEXT = '\n 12\n-3\n45\n\n6 \n\n'
+
+@pytest.fixture
+def write(tmp_path):
+    def write(data, name='input.txt'):
+        path = tmp_path / name
+        path.write_bytes(data.encode() if isinstance(data, str) else data)
+        return str(path)
+    return write
+
+def text_mode(path, sep='\n'):
+    ''' What filemap() did before the loader: a text mode read, stripped and split. '''
+    with open(path) as f:
+        return f.read().strip().split(sep)
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 5, 1 << 22])
+@pytest.mark.parametrize('newline', ['\n', '\r\n'])
+def test_records_match_text_mode(write, chunk_size, newline):
+    path = write(TEXT.replace('\n', newline))
+    got = [rec.decode() for rec in records(path, chunk_size=chunk_size)]
+    assert got == text_mode(path)
+    paragraphs = [rec.decode() for rec in records(path, b'\n\n', chunk_size=chunk_size)]
+    assert paragraphs == text_mode(path, '\n\n')
+
+def test_records_without_strip(write):
+    path = write('a\nb\n')
+    assert list(records(path, strip=False, chunk_size=1)) == [b'a', b'b', b'']
+
+def test_empty_file(write):
+    path = write('')
+    assert list(records(path)) == [b'']
+    assert char_ints(path) == []
+    assert list(imatches(path, re.compile(rb'(\d+)'))) == []
+    assert byte_ranges(path) == []
+
+def test_filemap_crlf(write):
+    path = write('ab\r\ncd\r\n')
+    assert filemap(path, str) == ['ab', 'cd']
+    assert list(ifilemap(path, len)) == [2, 2]
+
+def test_fast_paths(write):
+    assert list(ints(write('1\r\n-2\r\n3\r\n'))) == [1, -2, 3]
+    assert int_tuples(write('1,2\n3,-4\n')) == [(1, 2), (3, -4)]
+    assert char_ints(write('R42\n\nL7\n')) == [('R', 42), ('L', 7)]
+
+def test_imatches_range(write):
+    path = write('x=1 y=2\nx=3 y=4\n')
+    pattern = re.compile(rb'x=(\d+) y=(\d+)')
+    assert list(imatches(path, pattern)) == [(b'1', b'2'), (b'3', b'4')]
+    assert list(imatches(path, pattern, 8)) == [(b'3', b'4')]
+
+def test_byte_ranges_end_on_records(write):
+    data = ''.join(f'{i}\n' for i in range(100))
+    path = write(data)
+    ranges = byte_ranges(path, chunk_size=16)
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+    assert all(end == start for (_, end), (start, _) in zip(ranges, ranges[1:]))
+    assert all(data[end - 1] == '\n' for _, end in ranges)
+
+def test_grid_load_crlf(write):
+    grid = Grid.load(write('.#\r\n#.\r\n'), {'.': 0, '#': 1})
+    assert grid.to_lines({0: '.', 1: '#'}) == ['.#', '#.']
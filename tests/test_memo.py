@@ -0,0 +1,75 @@
+import pytest
+
+import aoc.memo
+from aoc.instrument import Stats
+from aoc.memo import Memo, memoize, pack
+
+def test_memo_counts_and_evicts():
+    memo = Memo(maxsize=2)
+    memo['a'] = 1
+    memo['b'] = 2
+    assert memo.get('a') == 1 # a is now the most recently used
+    memo['c'] = 3
+    assert 'b' not in memo and 'a' in memo and 'c' in memo
+    assert memo.get('b', 'missing') == 'missing'
+    assert memo.stats() == {'hits': 1, 'misses': 1, 'evictions': 1, 'size': 2}
+    memo.clear()
+    assert len(memo) == 0 and memo.stats()['hits'] == 0
+    with pytest.raises(ValueError):
+        Memo(maxsize=0)
+
+def test_fresh_table_per_outermost_call():
+    calls = []
+
+    @memoize
+    def fib(n):
+        calls.append(n)
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    assert fib(30) == 832040
+    assert sorted(calls) == list(range(31)) # Every n computed once
+    assert fib.stats == {'hits': 28, 'misses': 31, 'evictions': 0, 'size': 31}
+    fib(30)
+    assert len(calls) == 62 # Nothing kept from the previous call
+
+def test_key_and_bounded_table():
+    @memoize(key=lambda grid, i: i, maxsize=4)
+    def paths(grid, i):
+        return 1 if i >= len(grid) else paths(grid, i + 1) + paths(grid, i + 2)
+
+    assert paths('x' * 20, 0) == 17711
+    assert paths.stats['size'] == 4 and paths.stats['evictions'] > 0
+
+def test_exception_drops_the_table():
+    failing = [True]
+
+    @memoize
+    def depth(n):
+        if n == 0 and failing[0]:
+            raise KeyError(n)
+        return 0 if n == 0 else depth(n - 1) + 1
+
+    with pytest.raises(KeyError):
+        depth(3)
+    failing[0] = False
+    assert depth(3) == 3
+    # A new outermost call, not a recursive call of the one that raised
+    assert depth.stats == {'hits': 0, 'misses': 4, 'evictions': 0, 'size': 4}
+
+def test_reports_to_instrument(monkeypatch):
+    recorded = {}
+    monkeypatch.setattr(aoc.memo, 'enabled', lambda: True)
+    monkeypatch.setattr(aoc.memo, 'stats_for', lambda name: recorded.setdefault(name, Stats(name)))
+
+    @memoize(name='steps')
+    def steps(n):
+        return 0 if n == 0 else 1 + max(steps(n - 1), steps(n - 1))
+
+    steps(5)
+    steps(5)
+    assert (recorded['steps'].hits, recorded['steps'].misses) == (10, 12)
+
+def test_pack():
+    assert pack(1, 2) == (1 << 32) | 2
+    assert pack(1, 2, 3, bits=8) == 0x010203
+    assert len({pack(a, b) for a in range(10) for b in range(10)}) == 100
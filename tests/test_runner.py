@@ -0,0 +1,25 @@
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+from aoc.runner import run_isolated
+
+def work(value):
+    if value == 'die':
+        os._exit(1) # Takes the worker and with it the whole pool down
+    if value == 'raise':
+        raise ValueError(value)
+    return value * 2
+
+def test_dead_worker_fails_only_its_own_call():
+    calls = [(1,), ('die',), (3,), ('raise',), (5,), (6,)]
+    results = run_isolated(work, calls, jobs=2)
+    assert results[0] == 2 and results[2] == 6 and results[4] == 10 and results[5] == 12
+    assert isinstance(results[1], BrokenProcessPool)
+    assert isinstance(results[3], ValueError)
+
+def test_initializer_runs_in_retried_workers():
+    calls = [('die',), (2,), (3,)]
+    assert run_isolated(work, calls, jobs=1, initializer=os.getpid)[1:] == [4, 6]
+
+def test_no_calls():
+    assert run_isolated(work, [], jobs=4) == []
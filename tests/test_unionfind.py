@@ -0,0 +1,20 @@
+from aoc.unionfind import UnionFind
+
+def test_union_and_find():
+    sets = UnionFind(6)
+    assert sets.count == 6 and len(sets) == 6
+    assert sets.union(0, 1) and sets.union(1, 2) and sets.union(4, 5)
+    assert not sets.union(0, 2)
+    assert sets.count == 3
+    assert sets.connected(0, 2) and not sets.connected(2, 3)
+    assert sets.set_size(1) == 3 and sets.set_size(3) == 1
+    assert sorted(sets.set_sizes()) == [1, 2, 3]
+    assert sorted(sorted(members) for members in sets.sets().values()) == [[0, 1, 2], [3], [4, 5]]
+
+def test_single_set():
+    sets = UnionFind(1000)
+    for i in range(999):
+        sets.union(i, i + 1)
+    assert sets.count == 1
+    assert sets.set_sizes() == [1000]
+    assert len({sets.find(i) for i in range(1000)}) == 1